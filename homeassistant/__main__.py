@@ -122,6 +122,12 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--log-no-color", action="store_true", help="Disable color logs"
     )
+    parser.add_argument(
+        "--startup-trace",
+        type=str,
+        default=None,
+        help="Write a Chrome trace event file of the startup phases to this path",
+    )
     parser.add_argument(
         "--script", nargs=argparse.REMAINDER, help="Run one of the embedded scripts"
     )
@@ -194,6 +200,7 @@ def main() -> int:
         safe_mode=args.safe_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        startup_trace=args.startup_trace,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
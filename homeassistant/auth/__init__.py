@@ -3,11 +3,13 @@ from __future__ import annotations
 
 import asyncio
 from collections import OrderedDict
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from datetime import timedelta
+import time
 from typing import Any, Optional, cast
 
 import jwt
+from lru import LRU  # pylint: disable=no-name-in-module
 
 from homeassistant import data_entry_flow
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
@@ -15,7 +17,7 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.util import dt as dt_util
 
 from . import auth_store, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
+from .const import ACCESS_TOKEN_CACHE_SIZE, ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 
@@ -158,6 +160,8 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        # Validated access tokens by signature, see async_validate_access_token
+        self._access_tokens = LRU(ACCESS_TOKEN_CACHE_SIZE)
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -310,6 +314,9 @@ class AuthManager:
             await asyncio.gather(*tasks)
 
         await self._store.async_remove_user(user)
+        self._async_forget_access_tokens(
+            lambda refresh_token: refresh_token.user is user
+        )
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -473,6 +480,9 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_forget_access_tokens(
+            lambda cached_token: cached_token.id == refresh_token.id
+        )
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, [])
         for revoke_callback in callbacks:
@@ -553,7 +563,25 @@ class AuthManager:
     async def async_validate_access_token(
         self, token: str
     ) -> models.RefreshToken | None:
-        """Return refresh token if an access token is valid."""
+        """Return refresh token if an access token is valid.
+
+        Validated tokens are remembered until they expire or their refresh
+        token is removed, so repeated requests with the same token skip
+        decoding the token and looking up the refresh token.
+        """
+        signature = token.rpartition(".")[2]
+        if (cached := self._access_tokens.get(signature)) is not None:
+            cached_token, refresh_token, expires = cached
+            if (
+                cached_token == token
+                and time.time() < expires
+                and refresh_token.user.is_active
+                and refresh_token.user.refresh_tokens.get(refresh_token.id)
+                is refresh_token
+            ):
+                return cast(models.RefreshToken, refresh_token)
+            self._access_tokens.pop(signature, None)
+
         try:
             unverif_claims = jwt.decode(
                 token, algorithms=["HS256"], options={"verify_signature": False}
@@ -573,15 +601,29 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        if isinstance(expires := claims.get("exp"), (int, float)):
+            # Same leeway as the validation above
+            self._access_tokens[signature] = (token, refresh_token, expires + 10)
         return refresh_token
 
+    @callback
+    def _async_forget_access_tokens(
+        self, predicate: Callable[[models.RefreshToken], bool]
+    ) -> None:
+        """Forget validated access tokens of matching refresh tokens."""
+        for signature, (_, refresh_token, _) in self._access_tokens.items():
+            if predicate(refresh_token):
+                self._access_tokens.pop(signature, None)
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
@@ -2,6 +2,8 @@
 from datetime import timedelta
 
 ACCESS_TOKEN_EXPIRATION = timedelta(minutes=30)
+# Number of validated access tokens kept by the auth manager
+ACCESS_TOKEN_CACHE_SIZE = 256
 MFA_SESSION_EXPIRATION = timedelta(minutes=5)
 
 GROUP_ID_ADMIN = "system-admin"
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Iterable
 import contextlib
 from datetime import datetime, timedelta
 import logging
@@ -30,10 +31,18 @@ from .helpers import (
     entity_registry,
     issue_registry,
     recorder,
+    registry_snapshot,
 )
 from .helpers.dispatcher import async_dispatcher_send
+from .helpers.startup_timeline import (
+    DATA_STARTUP_TIMELINE,
+    async_start_timeline,
+    startup_span,
+)
 from .helpers.typing import ConfigType
 from .setup import (
+    BASE_PLATFORMS,
+    DATA_IMPORT_TIME,
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
@@ -42,7 +51,7 @@ from .setup import (
 )
 from .util import dt as dt_util
 from .util.logging import async_activate_log_queue_handler
-from .util.package import async_get_user_site, is_virtual_env
+from .util.package import async_get_user_site, is_installed, is_virtual_env
 
 if TYPE_CHECKING:
     from .runner import RuntimeConfig
@@ -108,6 +117,7 @@ async def async_setup_hass(
     """Set up Home Assistant."""
     hass = core.HomeAssistant()
     hass.config.config_dir = runtime_config.config_dir
+    async_start_timeline(hass)
 
     async_enable_logging(
         hass,
@@ -137,7 +147,8 @@ async def async_setup_hass(
         await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
 
         try:
-            config_dict = await conf_util.async_hass_config_yaml(hass)
+            with startup_span(hass, "load configuration.yaml", "config"):
+                config_dict = await conf_util.async_hass_config_yaml(hass)
         except HomeAssistantError as err:
             _LOGGER.error(
                 "Failed to parse configuration.yaml: %s. Activating safe mode",
@@ -174,6 +185,7 @@ async def async_setup_hass(
         old_logging = hass.data.get(DATA_LOGGING)
 
         hass = core.HomeAssistant()
+        async_start_timeline(hass)
         if old_logging:
             hass.data[DATA_LOGGING] = old_logging
         hass.config.skip_pip = old_config.skip_pip
@@ -196,6 +208,11 @@ async def async_setup_hass(
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
+    if runtime_config.startup_trace:
+        await hass.async_add_executor_job(
+            hass.data[DATA_STARTUP_TIMELINE].write, runtime_config.startup_trace
+        )
+
     return hass
 
 
@@ -235,14 +252,21 @@ async def load_registries(hass: core.HomeAssistant) -> None:
         """
         platform.uname().processor  # pylint: disable=expression-not-assigned
 
+    async def _async_load(name: str, load: Awaitable[None]) -> None:
+        """Load a registry as a span of the startup timeline."""
+        with startup_span(hass, f"load {name}", "registries", name):
+            await load
+
     # Load the registries and cache the result of platform.uname().processor
-    await asyncio.gather(
-        area_registry.async_load(hass),
-        device_registry.async_load(hass),
-        entity_registry.async_load(hass),
-        issue_registry.async_load(hass),
-        hass.async_add_executor_job(_cache_uname_processor),
-    )
+    with startup_span(hass, "load registries", "registries"):
+        await _async_load("registry_snapshot", registry_snapshot.async_load(hass))
+        await asyncio.gather(
+            _async_load("area_registry", area_registry.async_load(hass)),
+            _async_load("device_registry", device_registry.async_load(hass)),
+            _async_load("entity_registry", entity_registry.async_load(hass)),
+            _async_load("issue_registry", issue_registry.async_load(hass)),
+            hass.async_add_executor_job(_cache_uname_processor),
+        )
 
 
 async def async_from_config_dict(
@@ -256,20 +280,21 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
-    await hass.config_entries.async_initialize()
+    with startup_span(hass, "load config entries", "config_entries"):
+        await hass.config_entries.async_initialize()
     await load_registries(hass)
 
     # Set up core.
     _LOGGER.debug("Setting up %s", CORE_INTEGRATIONS)
 
-    if not all(
-        await asyncio.gather(
+    with startup_span(hass, "set up core integrations", "stage"):
+        core_results = await asyncio.gather(
             *(
                 async_setup_component(hass, domain, config)
                 for domain in CORE_INTEGRATIONS
             )
         )
-    ):
+    if not all(core_results):
         _LOGGER.error("Home Assistant core failed to initialize. ")
         return None
 
@@ -512,6 +537,91 @@ async def async_setup_multi_components(
         )
 
 
+def _preload_integration(
+    hass: core.HomeAssistant,
+    integration: loader.Integration,
+    platform_names: set[str],
+    requirements: list[str],
+) -> timedelta | None:
+    """Import an integration and its platforms, return the time it took.
+
+    Integrations with requirements which are not installed yet are not
+    imported, they are installed or upgraded when the integration is set up.
+    """
+    if not all(is_installed(requirement) for requirement in requirements):
+        return None
+
+    start = monotonic()
+    try:
+        with startup_span(hass, "preload", "import", integration.domain):
+            integration.preload(platform_names)
+    except Exception:  # pylint: disable=broad-except
+        # The error is reported when the integration is set up
+        _LOGGER.debug("Unable to preload %s", integration.domain, exc_info=True)
+        return None
+    return timedelta(seconds=monotonic() - start)
+
+
+def _preload_requirements(
+    by_domain: dict[str, loader.Integration], integration: loader.Integration
+) -> list[str]:
+    """Return the requirements of an integration and its dependencies.
+
+    Importing an integration can import its dependencies and their
+    requirements.
+    """
+    requirements = list(integration.requirements)
+    for domain in integration.all_dependencies:
+        if (dependency := by_domain.get(domain)) is not None:
+            requirements.extend(dependency.requirements)
+    return requirements
+
+
+async def _async_preload_integrations(
+    hass: core.HomeAssistant,
+    integrations: Iterable[loader.Integration],
+    platform_names: set[str],
+) -> None:
+    """Import integrations and their platforms in the executor.
+
+    An integration has more dependencies than each of its dependencies, so
+    importing batches of integrations with the same number of dependencies
+    imports every integration after its dependencies.
+    """
+    by_domain = {integration.domain: integration for integration in integrations}
+    batches: dict[int, list[loader.Integration]] = {}
+    for integration in by_domain.values():
+        batches.setdefault(len(integration.all_dependencies), []).append(integration)
+
+    import_time: dict[str, timedelta] = hass.data.setdefault(DATA_IMPORT_TIME, {})
+    for _, batch in sorted(batches.items()):
+        results = await asyncio.gather(
+            *(
+                hass.async_add_executor_job(
+                    _preload_integration,
+                    hass,
+                    integration,
+                    platform_names,
+                    _preload_requirements(by_domain, integration),
+                )
+                for integration in batch
+            )
+        )
+        for integration, time_taken in zip(batch, results):
+            if time_taken is not None:
+                import_time[integration.domain] = time_taken
+
+    _LOGGER.debug(
+        "Integration import times: %s",
+        {
+            domain: time_taken.total_seconds()
+            for domain, time_taken in sorted(
+                import_time.items(), key=lambda item: item[1]
+            )
+        },
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -527,38 +637,44 @@ async def _async_set_up_integrations(
     # that will have to be loaded and start rightaway
     integration_cache: dict[str, loader.Integration] = {}
     to_resolve: set[str] = domains_to_setup
-    while to_resolve:
-        old_to_resolve: set[str] = to_resolve
-        to_resolve = set()
-
-        integrations_to_process = [
-            int_or_exc
-            for int_or_exc in (
-                await loader.async_get_integrations(hass, old_to_resolve)
-            ).values()
-            if isinstance(int_or_exc, loader.Integration)
-        ]
-        resolve_dependencies_tasks = [
-            itg.resolve_dependencies()
-            for itg in integrations_to_process
-            if not itg.all_dependencies_resolved
-        ]
-
-        if resolve_dependencies_tasks:
-            await asyncio.gather(*resolve_dependencies_tasks)
-
-        for itg in integrations_to_process:
-            integration_cache[itg.domain] = itg
-
-            for dep in itg.all_dependencies:
-                if dep in domains_to_setup:
-                    continue
-
-                domains_to_setup.add(dep)
-                to_resolve.add(dep)
+    with startup_span(hass, "resolve integrations", "stage"):
+        while to_resolve:
+            old_to_resolve: set[str] = to_resolve
+            to_resolve = set()
+
+            integrations_to_process = [
+                int_or_exc
+                for int_or_exc in (
+                    await loader.async_get_integrations(hass, old_to_resolve)
+                ).values()
+                if isinstance(int_or_exc, loader.Integration)
+            ]
+            resolve_dependencies_tasks = [
+                itg.resolve_dependencies()
+                for itg in integrations_to_process
+                if not itg.all_dependencies_resolved
+            ]
+
+            if resolve_dependencies_tasks:
+                await asyncio.gather(*resolve_dependencies_tasks)
+
+            for itg in integrations_to_process:
+                integration_cache[itg.domain] = itg
+
+                for dep in itg.all_dependencies:
+                    if dep in domains_to_setup:
+                        continue
+
+                    domains_to_setup.add(dep)
+                    to_resolve.add(dep)
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    with startup_span(hass, "preload integrations", "stage"):
+        await _async_preload_integrations(
+            hass, integration_cache.values(), domains_to_setup & BASE_PLATFORMS
+        )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -566,22 +682,26 @@ async def _async_set_up_integrations(
     # Load logging as soon as possible
     if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
         _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config)
+        with startup_span(hass, "set up logging", "stage"):
+            await async_setup_multi_components(hass, logging_domains, config)
 
     # Setup frontend
     if frontend_domains := domains_to_setup & FRONTEND_INTEGRATIONS:
         _LOGGER.info("Setting up frontend: %s", frontend_domains)
-        await async_setup_multi_components(hass, frontend_domains, config)
+        with startup_span(hass, "set up frontend", "stage"):
+            await async_setup_multi_components(hass, frontend_domains, config)
 
     # Setup recorder
     if recorder_domains := domains_to_setup & RECORDER_INTEGRATIONS:
         _LOGGER.info("Setting up recorder: %s", recorder_domains)
-        await async_setup_multi_components(hass, recorder_domains, config)
+        with startup_span(hass, "set up recorder", "stage"):
+            await async_setup_multi_components(hass, recorder_domains, config)
 
     # Start up debuggers. Start these first in case they want to wait.
     if debuggers := domains_to_setup & DEBUGGER_INTEGRATIONS:
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config)
+        with startup_span(hass, "set up debuggers", "stage"):
+            await async_setup_multi_components(hass, debuggers, config)
 
     # calculate what components to setup in what stage
     stage_1_domains: set[str] = set()
@@ -618,10 +738,11 @@ async def _async_set_up_integrations(
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
         try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+            with startup_span(hass, "stage 1", "stage"):
+                async with hass.timeout.async_timeout(
+                    STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 1 - moving forward")
 
@@ -631,21 +752,27 @@ async def _async_set_up_integrations(
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
         try:
-            async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+            with startup_span(hass, "stage 2", "stage"):
+                async with hass.timeout.async_timeout(
+                    STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
-        async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+        with startup_span(hass, "wrap up", "stage"):
+            async with hass.timeout.async_timeout(
+                WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME
+            ):
+                await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
 
+    if timeline := hass.data.get(DATA_STARTUP_TIMELINE):
+        timeline.async_stop()
     watch_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATIONS, {})
 
@@ -32,6 +32,8 @@ from homeassistant.helpers.json import json_dumps, json_loads
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
 
+from .state_stream import StateStreamClient, async_get_state_stream
+
 _LOGGER = logging.getLogger(__name__)
 
 ATTR_BASE_URL = "base_url"
@@ -46,12 +48,15 @@ ATTR_VERSION = "version"
 DOMAIN = "api"
 STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
+URL_API_STREAM_STATES = "/api/stream/states"
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Register the API with the HTTP interface."""
     hass.http.register_view(APIStatusView)
     hass.http.register_view(APIEventStream)
+    hass.http.register_view(APIStateStream)
+    hass.http.register_view(APIStateStreamClientsView)
     hass.http.register_view(APIConfigView)
     hass.http.register_view(APIStatesView)
     hass.http.register_view(APIEntityStateView)
@@ -147,6 +152,86 @@ class APIEventStream(HomeAssistantView):
         return response
 
 
+def _query_list(request: web.Request, key: str) -> list[str]:
+    """Return a comma separated query parameter as list."""
+    if not (value := request.query.get(key)):
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+class APIStateStream(HomeAssistantView):
+    """View to stream state changes as server-sent events.
+
+    State changes can be filtered by the entity_id and domain query
+    parameters, and the attributes query parameter limits the attributes
+    which are sent. A client reconnecting with the Last-Event-ID header
+    receives the changes it missed, or a reset event if they are no longer
+    buffered.
+    """
+
+    url = URL_API_STREAM_STATES
+    name = "api:stream-states"
+
+    async def get(self, request: web.Request) -> web.StreamResponse:
+        """Provide a filtered stream of state changes."""
+        if not request["hass_user"].is_admin:
+            raise Unauthorized()
+        hub = async_get_state_stream(request.app["hass"])
+        attributes = _query_list(request, "attributes")
+        client = StateStreamClient(
+            {entity_id.lower() for entity_id in _query_list(request, "entity_id")},
+            {domain.lower() for domain in _query_list(request, "domain")},
+            tuple(sorted(set(attributes))) if attributes else None,
+        )
+
+        response = web.StreamResponse()
+        response.content_type = "text/event-stream"
+        await response.prepare(request)
+
+        resumed = hub.async_subscribe(client, request.headers.get("Last-Event-ID"))
+        try:
+            if not resumed:
+                await response.write(b"event: reset\ndata: {}\n\n")
+            await response.write(b": ping\n\n")
+            while not client.overflowed:
+                try:
+                    async with async_timeout.timeout(STREAM_PING_INTERVAL):
+                        stream_event = await client.queue.get()
+                except asyncio.TimeoutError:
+                    await response.write(b": ping\n\n")
+                    continue
+
+                if stream_event is None:
+                    break
+                if (encoded := stream_event.encode(client.attributes)) is not None:
+                    await response.write(encoded)
+                    client.sent += 1
+
+        except asyncio.CancelledError:
+            _LOGGER.debug("State stream %s aborted", id(client))
+
+        finally:
+            hub.async_unsubscribe(client)
+
+        return response
+
+
+class APIStateStreamClientsView(HomeAssistantView):
+    """View to list the clients of the state stream."""
+
+    url = f"{URL_API_STREAM_STATES}/clients"
+    name = "api:stream-states:clients"
+
+    @ha.callback
+    def get(self, request):
+        """Return the filters and backlog of the state stream clients."""
+        if not request["hass_user"].is_admin:
+            raise Unauthorized()
+        return self.json(
+            async_get_state_stream(request.app["hass"]).async_client_stats()
+        )
+
+
 class APIConfigView(HomeAssistantView):
     """View to handle Configuration requests."""
 
@@ -165,17 +250,19 @@ class APIStatesView(HomeAssistantView):
     url = URL_API_STATES
     name = "api:states"
 
-    @ha.callback
-    def get(self, request):
+    async def get(self, request):
         """Get current states."""
         user = request["hass_user"]
         entity_perm = user.permissions.check_entity
-        states = [
-            state
-            for state in request.app["hass"].states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
-        return self.json(states)
+        states = request.app["hass"].states.async_all()
+
+        async def readable_states():
+            """Yield the states the user is allowed to read."""
+            for state in states:
+                if entity_perm(state.entity_id, "read"):
+                    yield state
+
+        return await self.json_stream(request, readable_states())
 
 
 class APIEntityStateView(HomeAssistantView):
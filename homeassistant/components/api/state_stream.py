@@ -0,0 +1,203 @@
+"""Server-sent event stream of filtered state changes."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import logging
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.json import JSON_ENCODE_EXCEPTIONS, json_dumps
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATE_STREAM = "api.state_stream"
+
+# Number of state changes kept for clients resuming with Last-Event-ID,
+# this is also the largest backlog of a client before it is disconnected.
+STATE_STREAM_BUFFER_SIZE = 1024
+
+
+class StateStreamEvent:
+    """A buffered state change."""
+
+    __slots__ = ("event_id", "entity_id", "domain", "new_state", "_encoded")
+
+    def __init__(self, event_id: str, event: Event) -> None:
+        """Initialize the event."""
+        self.event_id = event_id
+        self.entity_id: str = event.data["entity_id"]
+        self.domain = self.entity_id.partition(".")[0]
+        self.new_state: State | None = event.data["new_state"]
+        self._encoded: dict[tuple[str, ...] | None, bytes | None] = {}
+
+    def encode(self, attributes: tuple[str, ...] | None) -> bytes | None:
+        """Return the server-sent event, encoded once per attribute allowlist.
+
+        Returns None if the state cannot be serialized.
+        """
+        if attributes in self._encoded:
+            return self._encoded[attributes]
+
+        state_dict: dict[str, Any] | None = None
+        if (state := self.new_state) is not None:
+            state_dict = dict(state.as_dict())
+            if attributes is not None:
+                state_dict["attributes"] = {
+                    attribute: state.attributes[attribute]
+                    for attribute in attributes
+                    if attribute in state.attributes
+                }
+
+        encoded: bytes | None
+        try:
+            payload = json_dumps({"entity_id": self.entity_id, "new_state": state_dict})
+        except JSON_ENCODE_EXCEPTIONS as err:
+            _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, state_dict)
+            encoded = None
+        else:
+            encoded = (
+                f"id: {self.event_id}\nevent: state_changed\ndata: {payload}\n\n"
+            ).encode("UTF-8")
+        self._encoded[attributes] = encoded
+        return encoded
+
+
+class StateStreamClient:
+    """A client of the state stream."""
+
+    def __init__(
+        self,
+        entity_ids: set[str],
+        domains: set[str],
+        attributes: tuple[str, ...] | None,
+    ) -> None:
+        """Initialize the client.
+
+        Without entity ids and domains the client receives all state changes.
+        """
+        self.entity_ids = entity_ids
+        self.domains = domains
+        self.attributes = attributes
+        self.queue: asyncio.Queue[StateStreamEvent | None] = asyncio.Queue(
+            maxsize=STATE_STREAM_BUFFER_SIZE
+        )
+        self.overflowed = False
+        self.sent = 0
+
+    def matches(self, stream_event: StateStreamEvent) -> bool:
+        """Return if the client is interested in the state change."""
+        if not self.entity_ids and not self.domains:
+            return True
+        return (
+            stream_event.entity_id in self.entity_ids
+            or stream_event.domain in self.domains
+        )
+
+    @callback
+    def async_put(self, stream_event: StateStreamEvent | None) -> None:
+        """Queue a state change, mark the client overflowed if it lags behind."""
+        try:
+            self.queue.put_nowait(stream_event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class StateStreamHub:
+    """Share filtered state changes between state stream clients.
+
+    Each state change is encoded at most once per attribute allowlist and the
+    latest changes are kept in a ring buffer, so clients can resume from the
+    id of the last event they received.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        # Event ids of an earlier run can not be resumed
+        self._run_id = f"{time.time_ns():x}"
+        self._next_id = 1
+        self._buffer: deque[tuple[int, StateStreamEvent]] = deque(
+            maxlen=STATE_STREAM_BUFFER_SIZE
+        )
+        self._clients: set[StateStreamClient] = set()
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Buffer a state change and queue it for the matching clients."""
+        sequence = self._next_id
+        self._next_id += 1
+        stream_event = StateStreamEvent(f"{self._run_id}-{sequence}", event)
+        self._buffer.append((sequence, stream_event))
+        for client in self._clients:
+            if client.matches(stream_event):
+                client.async_put(stream_event)
+
+    @callback
+    def _async_stop(self, event: Event) -> None:
+        """End all streams."""
+        for client in self._clients:
+            client.async_put(None)
+
+    @callback
+    def async_subscribe(
+        self, client: StateStreamClient, last_event_id: str | None = None
+    ) -> bool:
+        """Subscribe a client, replaying buffered changes after last_event_id.
+
+        Returns False if the client can not resume because the changes after
+        last_event_id are no longer buffered.
+        """
+        self._clients.add(client)
+        if last_event_id is None:
+            return True
+
+        run_id, _, sequence_str = last_event_id.partition("-")
+        try:
+            sequence = int(sequence_str)
+        except ValueError:
+            return False
+        if (
+            run_id != self._run_id
+            or sequence >= self._next_id
+            or (self._buffer and sequence < self._buffer[0][0] - 1)
+        ):
+            return False
+
+        for buffered_sequence, stream_event in self._buffer:
+            if buffered_sequence > sequence and client.matches(stream_event):
+                client.async_put(stream_event)
+        return True
+
+    @callback
+    def async_unsubscribe(self, client: StateStreamClient) -> None:
+        """Unsubscribe a client."""
+        self._clients.discard(client)
+
+    @callback
+    def async_client_stats(self) -> list[dict[str, Any]]:
+        """Return the filters and backlog of the connected clients."""
+        return [
+            {
+                "entity_ids": sorted(client.entity_ids),
+                "domains": sorted(client.domains),
+                "attributes": client.attributes,
+                "backlog": client.queue.qsize(),
+                "sent": client.sent,
+            }
+            for client in self._clients
+        ]
+
+
+@callback
+def async_get_state_stream(hass: HomeAssistant) -> StateStreamHub:
+    """Return the state stream hub."""
+    hub: StateStreamHub | None = hass.data.get(DATA_STATE_STREAM)
+    if hub is None:
+        hub = hass.data[DATA_STATE_STREAM] = StateStreamHub(hass)
+    return hub
@@ -856,10 +856,12 @@ async def _async_process_if(
     """Process if checks."""
     if_configs = config[CONF_CONDITION]
 
-    checks: list[condition.ConditionCheckerType] = []
-    for if_config in if_configs:
+    # Evaluate cheap conditions first, the result of the AND does not
+    # depend on the order of the checks.
+    checks: list[tuple[int, condition.ConditionCheckerType]] = []
+    for index, if_config in condition.conditions_by_cost(if_configs):
         try:
-            checks.append(await condition.async_from_config(hass, if_config))
+            checks.append((index, await condition.async_from_config(hass, if_config)))
         except HomeAssistantError as ex:
             LOGGER.warning("Invalid condition: %s", ex)
             return None
@@ -867,7 +869,7 @@ async def _async_process_if(
     def if_action(variables: Mapping[str, Any] | None = None) -> bool:
         """AND all conditions."""
         errors: list[ConditionErrorIndex] = []
-        for index, check in enumerate(checks):
+        for index, check in checks:
             try:
                 with trace_path(["condition", str(index)]):
                     if not check(hass, variables):
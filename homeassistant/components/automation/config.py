@@ -21,7 +21,12 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_per_platform, config_validation as cv, script
+from homeassistant.helpers import (
+    config_item_cache,
+    config_per_platform,
+    config_validation as cv,
+    script,
+)
 from homeassistant.helpers.condition import async_validate_conditions_config
 from homeassistant.helpers.trigger import async_validate_trigger_config
 from homeassistant.helpers.typing import ConfigType
@@ -202,12 +207,27 @@ async def _try_async_validate_config_item(
     hass: HomeAssistant,
     config: dict[str, Any],
 ) -> AutomationConfig | None:
-    """Validate config item."""
+    """Validate config item.
+
+    Automations which are unchanged since they were last validated are
+    reused instead of being validated again. Blueprint automations are
+    always validated since the blueprint may have changed.
+    """
+    cache = None
+    if not blueprint.is_blueprint_instance_config(config):
+        cache = config_item_cache.async_get(hass)
+        if (cached := cache.async_get(DOMAIN, None, config)) is not None:
+            return cached  # type: ignore[no-any-return]
+
     try:
-        return await _async_validate_config_item(hass, config, True)
+        automation_config = await _async_validate_config_item(hass, config, True)
     except (vol.Invalid, HomeAssistantError):
         return None
 
+    if cache is not None:
+        cache.async_set(DOMAIN, None, config, automation_config)
+    return automation_config
+
 
 async def async_validate_config_item(
     hass: HomeAssistant,
@@ -234,6 +254,7 @@ async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> Conf
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
+    config_item_cache.async_get(hass).async_retain(DOMAIN, automations)
     config = config_without_domain(config, DOMAIN)
     config[DOMAIN] = automations
 
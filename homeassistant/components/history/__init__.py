@@ -1,12 +1,12 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
 import logging
 import time
-from typing import Any, cast
+from typing import Any
 
 from aiohttp import web
 import voluptuous as vol
@@ -20,7 +20,7 @@ from homeassistant.components.recorder.filters import (
 )
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import messages
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA
 from homeassistant.helpers.json import JSON_DUMP
@@ -33,6 +33,9 @@ DOMAIN = "history"
 HISTORY_FILTERS = "history_filters"
 HISTORY_USE_INCLUDE_ORDER = "history_use_include_order"
 
+# Number of requested entities fetched per query when streaming their history
+STREAM_ENTITY_BATCH_SIZE = 50
+
 CONF_ORDER = "use_include_order"
 
 
@@ -118,6 +121,7 @@ def _ws_get_significant_states(
     }
 )
 @websocket_api.async_response
+@websocket_api.limit_concurrency
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
@@ -191,7 +195,7 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return history over a period of time."""
         datetime_ = None
         if datetime and (datetime_ := dt_util.parse_datetime(datetime)) is None:
@@ -236,10 +240,9 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
-        return cast(
-            web.Response,
-            await get_instance(hass).async_add_executor_job(
-                self._sorted_significant_states_json,
+        return await self.json_stream(
+            request,
+            self._async_significant_states(
                 hass,
                 start_time,
                 end_time,
@@ -251,7 +254,63 @@ class HistoryPeriodView(HomeAssistantView):
             ),
         )
 
-    def _sorted_significant_states_json(
+    async def _async_significant_states(
+        self,
+        hass: HomeAssistant,
+        start_time: dt,
+        end_time: dt,
+        entity_ids: list[str] | None,
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> AsyncIterator[list[State | dict[str, Any]]]:
+        """Yield the significant states of each entity.
+
+        When entities are requested, they are fetched STREAM_ENTITY_BATCH_SIZE
+        at a time so only the history of a batch is held in memory while
+        streaming.
+        """
+        batches: list[list[str] | None]
+        if entity_ids is None:
+            batches = [None]
+        else:
+            ordered = self._ordered(entity_ids)
+            batches = [
+                ordered[index : index + STREAM_ENTITY_BATCH_SIZE]
+                for index in range(0, len(ordered), STREAM_ENTITY_BATCH_SIZE)
+            ]
+
+        instance = get_instance(hass)
+        for batch in batches:
+            for entity_states in await instance.async_add_executor_job(
+                self._sorted_significant_states,
+                hass,
+                start_time,
+                end_time,
+                batch,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            ):
+                yield entity_states
+
+    def _ordered(self, entity_ids: list[str]) -> list[str]:
+        """Return the unique entity ids in the order of the result."""
+        ordered = dict.fromkeys(entity_ids)
+        if not self.filters or not self.use_include_order:
+            return list(ordered)
+        included = [
+            entity_id
+            for entity_id in self.filters.included_entities
+            if entity_id in ordered
+        ]
+        return included + [
+            entity_id for entity_id in ordered if entity_id not in included
+        ]
+
+    def _sorted_significant_states(
         self,
         hass: HomeAssistant,
         start_time: dt,
@@ -261,8 +320,8 @@ class HistoryPeriodView(HomeAssistantView):
         significant_changes_only: bool,
         minimal_response: bool,
         no_attributes: bool,
-    ) -> web.Response:
-        """Fetch significant stats from the database as json."""
+    ) -> list[list[State | dict[str, Any]]]:
+        """Fetch significant stats from the database."""
         timer_start = time.perf_counter()
 
         with session_scope(hass=hass) as session:
@@ -288,7 +347,7 @@ class HistoryPeriodView(HomeAssistantView):
         # Optionally reorder the result to respect the ordering given
         # by any entities explicitly included in the configuration.
         if not self.filters or not self.use_include_order:
-            return self.json(list(states.values()))
+            return list(states.values())
 
         sorted_result = [
             states.pop(order_entity)
@@ -296,7 +355,7 @@ class HistoryPeriodView(HomeAssistantView):
             if order_entity in states
         ]
         sorted_result.extend(list(states.values()))
-        return self.json(sorted_result)
+        return sorted_result
 
 
 def _entities_may_have_state_changes_after(
@@ -2,11 +2,12 @@
 import asyncio
 import itertools as it
 import logging
+from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_CONTROL
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 import homeassistant.config as conf_util
 from homeassistant.const import (
     ATTR_ENTITY_ID,
@@ -31,6 +32,8 @@ from homeassistant.helpers.service import (
 )
 from homeassistant.helpers.typing import ConfigType
 
+from .triggers.state import async_get_multiplexer
+
 ATTR_ENTRY_ID = "entry_id"
 
 _LOGGER = logging.getLogger(__name__)
@@ -275,4 +278,18 @@ async def async_setup(hass: ha.HomeAssistant, config: ConfigType) -> bool:  # no
         schema=SCHEMA_RELOAD_CONFIG_ENTRY,
     )
 
+    websocket_api.async_register_command(hass, websocket_state_trigger_stats)
+
     return True
+
+
+@ha.callback
+@websocket_api.websocket_command({vol.Required("type"): "state_trigger/stats"})
+@websocket_api.require_admin
+def websocket_state_trigger_stats(
+    hass: ha.HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return how often each attached state trigger matched a state change."""
+    connection.send_result(msg["id"], async_get_multiplexer(hass).async_stats())
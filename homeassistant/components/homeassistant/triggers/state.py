@@ -1,12 +1,15 @@
 """Offer state listening automation rules."""
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable
 from datetime import timedelta
 import logging
+from typing import Any
 
 import voluptuous as vol
 
 from homeassistant import exceptions
+from homeassistant.config import config_key
 from homeassistant.const import CONF_ATTRIBUTE, CONF_FOR, CONF_PLATFORM, MATCH_ALL
 from homeassistant.core import (
     CALLBACK_TYPE,
@@ -37,6 +40,8 @@ CONF_TO = "to"
 CONF_NOT_FROM = "not_from"
 CONF_NOT_TO = "not_to"
 
+DATA_STATE_TRIGGER_MULTIPLEXER = "state_trigger_multiplexer"
+
 BASE_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_PLATFORM): "state",
@@ -88,50 +93,58 @@ async def async_validate_trigger_config(
     return config
 
 
-async def async_attach_trigger(
-    hass: HomeAssistant,
-    config: ConfigType,
-    action: TriggerActionType,
-    trigger_info: TriggerInfo,
-    *,
-    platform_type: str = "state",
-) -> CALLBACK_TYPE:
-    """Listen for state changes based on configuration."""
-    entity_ids = config[CONF_ENTITY_ID]
+class _StateMatcher:
+    """Match state changed events against the from/to config of a trigger."""
 
-    if (from_state := config.get(CONF_FROM)) is not None:
-        match_from_state = process_state_match(from_state)
-    elif (not_from_state := config.get(CONF_NOT_FROM)) is not None:
-        match_from_state = process_state_match(not_from_state, invert=True)
-    else:
-        match_from_state = process_state_match(MATCH_ALL)
-
-    if (to_state := config.get(CONF_TO)) is not None:
-        match_to_state = process_state_match(to_state)
-    elif (not_to_state := config.get(CONF_NOT_TO)) is not None:
-        match_to_state = process_state_match(not_to_state, invert=True)
-    else:
-        match_to_state = process_state_match(MATCH_ALL)
+    def __init__(self, config: ConfigType) -> None:
+        """Initialize the matcher."""
+        if (from_state := config.get(CONF_FROM)) is not None:
+            self._match_from_state = process_state_match(from_state)
+        elif (not_from_state := config.get(CONF_NOT_FROM)) is not None:
+            self._match_from_state = process_state_match(not_from_state, invert=True)
+        else:
+            self._match_from_state = process_state_match(MATCH_ALL)
 
-    time_delta = config.get(CONF_FOR)
-    template.attach(hass, time_delta)
-    # If neither CONF_FROM or CONF_TO are specified,
-    # fire on all changes to the state or an attribute
-    match_all = all(
-        item not in config for item in (CONF_FROM, CONF_NOT_FROM, CONF_NOT_TO, CONF_TO)
-    )
-    unsub_track_same = {}
-    period: dict[str, timedelta] = {}
-    attribute = config.get(CONF_ATTRIBUTE)
-    job = HassJob(action)
+        if (to_state := config.get(CONF_TO)) is not None:
+            self._match_to_state = process_state_match(to_state)
+        elif (not_to_state := config.get(CONF_NOT_TO)) is not None:
+            self._match_to_state = process_state_match(not_to_state, invert=True)
+        else:
+            self._match_to_state = process_state_match(MATCH_ALL)
 
-    trigger_data = trigger_info["trigger_data"]
-    _variables = trigger_info["variables"] or {}
+        # If neither CONF_FROM or CONF_TO are specified,
+        # fire on all changes to the state or an attribute
+        self._match_all = all(
+            item not in config
+            for item in (CONF_FROM, CONF_NOT_FROM, CONF_NOT_TO, CONF_TO)
+        )
+        self._attribute = config.get(CONF_ATTRIBUTE)
+
+    @staticmethod
+    def key(config: ConfigType) -> Hashable | None:
+        """Return a key which is equal for triggers matching the same changes.
+
+        Returns None if the config holds values which can't be compared.
+        """
+        return config_key(
+            {
+                item: config[item]
+                for item in (
+                    CONF_ATTRIBUTE,
+                    CONF_FROM,
+                    CONF_NOT_FROM,
+                    CONF_TO,
+                    CONF_NOT_TO,
+                )
+                if item in config
+            },
+            location=False,
+        )
 
     @callback
-    def state_automation_listener(event: Event):
-        """Listen for state changes and calls action."""
-        entity: str = event.data["entity_id"]
+    def async_match(self, event: Event) -> tuple[Any, Any] | None:
+        """Return the old and new value if the event matches, otherwise None."""
+        attribute = self._attribute
         from_s: State | None = event.data.get("old_state")
         to_s: State | None = event.data.get("new_state")
 
@@ -154,15 +167,195 @@ async def async_attach_trigger(
         # we listen to just an attribute, we should ignore all
         # other attribute changes.
         if attribute is not None and old_value == new_value:
-            return
+            return None
 
         if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
+            not self._match_from_state(old_value)
+            or not self._match_to_state(new_value)
+            or (not self._match_all and old_value == new_value)
         ):
+            return None
+
+        return old_value, new_value
+
+
+class _StateTriggerSubscriber:
+    """A state trigger attached to the multiplexer."""
+
+    __slots__ = ("name", "entity_ids", "action", "matches")
+
+    def __init__(
+        self,
+        name: str,
+        entity_ids: list[str],
+        action: Callable[[Event, Any, Any], None],
+    ) -> None:
+        """Initialize the subscriber."""
+        self.name = name
+        self.entity_ids = entity_ids
+        self.action = action
+        self.matches = 0
+
+
+class _StateTriggerGroup:
+    """State triggers with the same matcher, evaluated once per state change."""
+
+    def __init__(self, hass: HomeAssistant, matcher: _StateMatcher) -> None:
+        """Initialize the group."""
+        self._hass = hass
+        self._matcher = matcher
+        self._subscribers: dict[str, list[_StateTriggerSubscriber]] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_add(self, subscriber: _StateTriggerSubscriber) -> None:
+        """Add a subscriber to the group."""
+        for entity_id in subscriber.entity_ids:
+            if entity_id not in self._subscribers:
+                self._subscribers[entity_id] = []
+                self._unsubs[entity_id] = async_track_state_change_event(
+                    self._hass, entity_id, self._async_state_changed
+                )
+            self._subscribers[entity_id].append(subscriber)
+
+    @callback
+    def async_remove(self, subscriber: _StateTriggerSubscriber) -> bool:
+        """Remove a subscriber, return True if the group is now empty."""
+        for entity_id in subscriber.entity_ids:
+            subscribers = self._subscribers[entity_id]
+            subscribers.remove(subscriber)
+            if not subscribers:
+                del self._subscribers[entity_id]
+                self._unsubs.pop(entity_id)()
+        return not self._subscribers
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Match the state change once and fan out to the subscribers."""
+        if (values := self._matcher.async_match(event)) is None:
             return
 
+        entity_id: str = event.data["entity_id"]
+        old_value, new_value = values
+        for subscriber in self._subscribers.get(entity_id, [])[:]:
+            subscriber.matches += 1
+            try:
+                subscriber.action(event, old_value, new_value)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while processing state trigger %s for %s",
+                    subscriber.name,
+                    entity_id,
+                )
+
+
+class StateTriggerMultiplexer:
+    """Share state listeners between state triggers.
+
+    Triggers with the same from/to/attribute config are grouped, so a state
+    change is matched once per group and only passed to the triggers it
+    matches.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the multiplexer."""
+        self._hass = hass
+        self._groups: dict[Hashable, _StateTriggerGroup] = {}
+        self._subscribers: list[_StateTriggerSubscriber] = []
+
+    @callback
+    def async_subscribe(
+        self,
+        config: ConfigType,
+        name: str,
+        action: Callable[[Event, Any, Any], None],
+    ) -> CALLBACK_TYPE:
+        """Subscribe a trigger to the state changes it matches."""
+        # Unvalidated configs, like those of wait_for_trigger, can hold a string
+        entity_ids = [
+            entity_id.lower() for entity_id in cv.ensure_list(config[CONF_ENTITY_ID])
+        ]
+        if not entity_ids:
+            return _remove_empty_subscriber
+
+        if (key := _StateMatcher.key(config)) is None:
+            # Don't share the listeners of triggers with unusual values
+            key = object()
+        if (group := self._groups.get(key)) is None:
+            group = self._groups[key] = _StateTriggerGroup(
+                self._hass, _StateMatcher(config)
+            )
+
+        subscriber = _StateTriggerSubscriber(name, entity_ids, action)
+        group.async_add(subscriber)
+        self._subscribers.append(subscriber)
+
+        @callback
+        def async_unsubscribe() -> None:
+            """Unsubscribe the trigger."""
+            self._subscribers.remove(subscriber)
+            if group.async_remove(subscriber):
+                del self._groups[key]
+
+        return async_unsubscribe
+
+    @callback
+    def async_stats(self) -> list[dict[str, Any]]:
+        """Return how often each attached trigger matched a state change."""
+        return [
+            {
+                "name": subscriber.name,
+                "entity_ids": subscriber.entity_ids,
+                "matches": subscriber.matches,
+            }
+            for subscriber in self._subscribers
+        ]
+
+
+@callback
+def _remove_empty_subscriber() -> None:
+    """Remove a subscription that does nothing."""
+
+
+@callback
+def async_get_multiplexer(hass: HomeAssistant) -> StateTriggerMultiplexer:
+    """Return the state trigger multiplexer."""
+    multiplexer: StateTriggerMultiplexer | None = hass.data.get(
+        DATA_STATE_TRIGGER_MULTIPLEXER
+    )
+    if multiplexer is None:
+        multiplexer = hass.data[
+            DATA_STATE_TRIGGER_MULTIPLEXER
+        ] = StateTriggerMultiplexer(hass)
+    return multiplexer
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+    *,
+    platform_type: str = "state",
+) -> CALLBACK_TYPE:
+    """Listen for state changes based on configuration."""
+    time_delta = config.get(CONF_FOR)
+    template.attach(hass, time_delta)
+    unsub_track_same = {}
+    period: dict[str, timedelta] = {}
+    attribute = config.get(CONF_ATTRIBUTE)
+    job = HassJob(action)
+
+    trigger_data = trigger_info["trigger_data"]
+    _variables = trigger_info["variables"] or {}
+
+    @callback
+    def state_automation_listener(event: Event, old_value: Any, new_value: Any):
+        """Call the action for a state change matching the trigger."""
+        entity: str = event.data["entity_id"]
+        from_s: State | None = event.data.get("old_state")
+        to_s: State | None = event.data.get("new_state")
+
         @callback
         def call_action():
             """Call action with right context."""
@@ -230,7 +423,9 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    unsub = async_get_multiplexer(hass).async_subscribe(
+        config, trigger_info["name"], state_automation_listener
+    )
 
     @callback
     def async_remove():
@@ -1,18 +1,26 @@
 """Ban logic for HTTP component."""
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine, Iterator
 from contextlib import suppress
 from datetime import datetime
 from http import HTTPStatus
-from ipaddress import IPv4Address, IPv6Address, ip_address
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+    ip_network,
+)
 import logging
 from socket import gethostbyaddr, herror
-from typing import Any, Final, TypeVar
+from time import monotonic
+from typing import Any, Final, TypeVar, cast
 
 from aiohttp.web import Application, Request, Response, StreamResponse, middleware
 from aiohttp.web_exceptions import HTTPForbidden, HTTPUnauthorized
+from lru import LRU  # pylint: disable=no-name-in-module
 from typing_extensions import Concatenate, ParamSpec
 import voluptuous as vol
 
@@ -40,6 +48,12 @@ NOTIFICATION_ID_LOGIN: Final = "http-login"
 IP_BANS_FILE: Final = "ip_bans.yaml"
 ATTR_BANNED_AT: Final = "banned_at"
 
+# Failed login attempts are tracked for at most this many addresses,
+# the addresses without a recent failed attempt are forgotten first
+MAX_TRACKED_ADDRESSES: Final = 4096
+# Seconds without a failed attempt before the attempts of an address expire
+FAILED_LOGIN_ATTEMPTS_EXPIRE: Final = 86400
+
 SCHEMA_IP_BAN_ENTRY: Final = vol.Schema(
     {vol.Optional("banned_at"): vol.Any(None, cv.datetime)}
 )
@@ -49,7 +63,7 @@ SCHEMA_IP_BAN_ENTRY: Final = vol.Schema(
 def setup_bans(hass: HomeAssistant, app: Application, login_threshold: int) -> None:
     """Create IP Ban middleware for the app."""
     app.middlewares.append(ban_middleware)
-    app[KEY_FAILED_LOGIN_ATTEMPTS] = defaultdict(int)
+    app[KEY_FAILED_LOGIN_ATTEMPTS] = FailedLoginAttempts(MAX_TRACKED_ADDRESSES)
     app[KEY_LOGIN_THRESHOLD] = login_threshold
     app[KEY_BAN_MANAGER] = IpBanManager(hass)
 
@@ -70,11 +84,10 @@ async def ban_middleware(
         _LOGGER.error("IP Ban middleware loaded but banned IPs not loaded")
         return await handler(request)
 
-    ip_bans_lookup = ban_manager.ip_bans_lookup
-    if ip_bans_lookup:
+    if ban_manager.ip_bans_lookup or ban_manager.ip_network_bans_lookup:
         # Verify if IP is not banned
         ip_address_ = ip_address(request.remote)  # type: ignore[arg-type]
-        if ip_address_ in ip_bans_lookup:
+        if ban_manager.async_is_banned(ip_address_):
             raise HTTPForbidden()
 
     try:
@@ -137,7 +150,7 @@ async def process_wrong_login(request: Request) -> None:
     if KEY_BAN_MANAGER not in request.app or request.app[KEY_LOGIN_THRESHOLD] < 1:
         return
 
-    request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr] += 1
+    failed_attempts = request.app[KEY_FAILED_LOGIN_ATTEMPTS].async_add(remote_addr)
 
     # Supervisor IP should never be banned
     if "hassio" in hass.config.components:
@@ -147,10 +160,7 @@ async def process_wrong_login(request: Request) -> None:
         if hassio.get_supervisor_ip() == str(remote_addr):
             return
 
-    if (
-        request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr]
-        >= request.app[KEY_LOGIN_THRESHOLD]
-    ):
+    if failed_attempts >= request.app[KEY_LOGIN_THRESHOLD]:
         ban_manager: IpBanManager = request.app[KEY_BAN_MANAGER]
         _LOGGER.warning("Banned IP %s for too many login attempts", remote_addr)
         await ban_manager.async_add_ban(remote_addr)
@@ -176,14 +186,76 @@ async def process_success_login(request: Request) -> None:
     if KEY_BAN_MANAGER not in request.app or request.app[KEY_LOGIN_THRESHOLD] < 1:
         return
 
-    if (
-        remote_addr in request.app[KEY_FAILED_LOGIN_ATTEMPTS]
-        and request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr] > 0
-    ):
+    if request.app[KEY_FAILED_LOGIN_ATTEMPTS].async_reset(remote_addr):
         _LOGGER.debug(
             "Login success, reset failed login attempts counter from %s", remote_addr
         )
-        request.app[KEY_FAILED_LOGIN_ATTEMPTS].pop(remote_addr)
+
+
+class FailedLoginAttempts:
+    """Count the recent failed login attempts per IP address.
+
+    Memory is bounded by keeping only the addresses with the most recent
+    failed attempts, and the attempts of an address expire after a day
+    without failures. When failed attempts come from more addresses than
+    tracked, for example during a flood of spoofed addresses, the counts of
+    the least recent addresses are forgotten, which resets their progress
+    towards a ban. This is logged as a warning.
+    """
+
+    def __init__(self, max_addresses: int) -> None:
+        """Initialize the counter."""
+        self._max_addresses = max_addresses
+        self._attempts = LRU(max_addresses)
+        self._eviction_logged = False
+
+    def __getitem__(self, remote_addr: IPv4Address | IPv6Address) -> int:
+        """Return the number of recent failed attempts of an address."""
+        if (attempts := self._attempts.get(remote_addr)) is None:
+            return 0
+        count, last_attempt = attempts
+        if monotonic() - last_attempt > FAILED_LOGIN_ATTEMPTS_EXPIRE:
+            return 0
+        return cast(int, count)
+
+    def __contains__(self, remote_addr: object) -> bool:
+        """Return if an address has recent failed attempts."""
+        return remote_addr in self._attempts and self[remote_addr] > 0  # type: ignore[index]
+
+    def __iter__(self) -> Iterator[IPv4Address | IPv6Address]:
+        """Iterate over the addresses with recent failed attempts."""
+        return iter([addr for addr in self._attempts.keys() if addr in self])
+
+    def __len__(self) -> int:
+        """Return the number of addresses with recent failed attempts."""
+        return sum(1 for addr in self._attempts.keys() if addr in self)
+
+    @callback
+    def async_add(self, remote_addr: IPv4Address | IPv6Address) -> int:
+        """Count a failed attempt, return the recent failed attempts."""
+        count = self[remote_addr] + 1
+        if (
+            remote_addr not in self._attempts
+            and len(self._attempts) >= self._max_addresses
+            and not self._eviction_logged
+        ):
+            self._eviction_logged = True
+            _LOGGER.warning(
+                (
+                    "Failed login attempts come from more than %s addresses, the"
+                    " attempts of the least recent addresses are forgotten"
+                ),
+                self._max_addresses,
+            )
+        self._attempts[remote_addr] = (count, monotonic())
+        return count
+
+    @callback
+    def async_reset(self, remote_addr: IPv4Address | IPv6Address) -> bool:
+        """Forget the failed attempts of an address, return if there were any."""
+        count = self[remote_addr]
+        self._attempts.pop(remote_addr, None)
+        return count > 0
 
 
 class IpBan:
@@ -191,13 +263,22 @@ class IpBan:
 
     def __init__(
         self,
-        ip_ban: str | IPv4Address | IPv6Address,
+        ip_ban: str | IPv4Address | IPv6Address | IPv4Network | IPv6Network,
         banned_at: datetime | None = None,
     ) -> None:
-        """Initialize IP Ban object."""
-        self.ip_address = ip_address(ip_ban)
+        """Initialize IP Ban object.
+
+        A network in CIDR notation bans all of its addresses.
+        """
+        self.ip_network = ip_network(ip_ban)
+        self.ip_address = self.ip_network.network_address
         self.banned_at = banned_at or dt_util.utcnow()
 
+    @property
+    def is_network(self) -> bool:
+        """Return if the ban covers more than one address."""
+        return self.ip_network.num_addresses > 1
+
 
 class IpBanManager:
     """Manage IP bans."""
@@ -207,6 +288,9 @@ class IpBanManager:
         self.hass = hass
         self.path = hass.config.path(IP_BANS_FILE)
         self.ip_bans_lookup: dict[IPv4Address | IPv6Address, IpBan] = {}
+        self.ip_network_bans_lookup: dict[IPv4Network | IPv6Network, IpBan] = {}
+        # Prefix lengths of the banned networks per IP version
+        self._network_prefixes: dict[int, set[int]] = {}
 
     async def async_load(self) -> None:
         """Load the existing IP bans."""
@@ -220,17 +304,43 @@ class IpBanManager:
             _LOGGER.error("Unable to load %s: %s", self.path, str(err))
             return
 
-        ip_bans_lookup: dict[IPv4Address | IPv6Address, IpBan] = {}
+        self.ip_bans_lookup = {}
+        self.ip_network_bans_lookup = {}
+        self._network_prefixes = {}
         for ip_ban, ip_info in list_.items():
             try:
                 ip_info = SCHEMA_IP_BAN_ENTRY(ip_info)
                 ban = IpBan(ip_ban, ip_info["banned_at"])
-                ip_bans_lookup[ban.ip_address] = ban
-            except vol.Invalid as err:
+            except (vol.Invalid, ValueError) as err:
                 _LOGGER.error("Failed to load IP ban %s: %s", ip_info, err)
                 continue
+            self._async_index_ban(ban)
 
-        self.ip_bans_lookup = ip_bans_lookup
+    @callback
+    def _async_index_ban(self, ip_ban: IpBan) -> None:
+        """Add a ban to the lookups."""
+        if not ip_ban.is_network:
+            self.ip_bans_lookup[ip_ban.ip_address] = ip_ban
+            return
+        network = ip_ban.ip_network
+        self.ip_network_bans_lookup[network] = ip_ban
+        self._network_prefixes.setdefault(network.version, set()).add(network.prefixlen)
+
+    @callback
+    def async_is_banned(self, remote_addr: IPv4Address | IPv6Address) -> bool:
+        """Return if an address is banned.
+
+        Networks are matched with one lookup per banned prefix length.
+        """
+        if remote_addr in self.ip_bans_lookup:
+            return True
+        for prefixlen in self._network_prefixes.get(remote_addr.version, ()):
+            if (
+                ip_network((remote_addr, prefixlen), strict=False)
+                in self.ip_network_bans_lookup
+            ):
+                return True
+        return False
 
     def _add_ban(self, ip_ban: IpBan) -> None:
         """Update config file with new banned IP address."""
@@ -243,5 +353,6 @@ class IpBanManager:
 
     async def async_add_ban(self, remote_addr: IPv4Address | IPv6Address) -> None:
         """Add a new IP address to the banned list."""
-        new_ban = self.ip_bans_lookup[remote_addr] = IpBan(remote_addr)
+        new_ban = IpBan(remote_addr)
+        self._async_index_ban(new_ban)
         await self.hass.async_add_executor_job(self._add_ban, new_ban)
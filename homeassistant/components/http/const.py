@@ -5,3 +5,5 @@ KEY_AUTHENTICATED: Final = "ha_authenticated"
 KEY_HASS: Final = "hass"
 KEY_HASS_USER: Final = "hass_user"
 KEY_HASS_REFRESH_TOKEN_ID: Final = "hass_refresh_token_id"
+
+CONTENT_TYPE_NDJSON: Final = "application/x-ndjson"
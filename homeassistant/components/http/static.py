@@ -1,12 +1,16 @@
 """Static file handling for HTTP component."""
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+import mimetypes
 from pathlib import Path
+import stat
+from time import monotonic
 from typing import Final
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU  # pylint: disable=no-name-in-module
@@ -20,6 +24,170 @@ CACHE_HEADERS: Final[Mapping[str, str]] = {
     hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"
 }
 PATH_CACHE = LRU(512)
+FILE_CACHE_MAX_FILES: Final = 128
+FILE_CACHE_MAX_SIZE: Final = 256 * 1024
+# Total size of the file contents kept in memory
+FILE_CACHE_MAX_BYTES: Final = 8 * 1024 * 1024
+# Seconds before the metadata of a cached file is read again
+FILE_CACHE_REVALIDATE: Final = 60
+
+# Precompressed siblings in order of preference
+PRECOMPRESSED_SUFFIXES: Final = (("br", ".br"), ("gzip", ".gz"))
+
+
+class _FileVariant:
+    """A file or one of its precompressed siblings."""
+
+    __slots__ = ("path", "encoding", "etag", "last_modified", "body")
+
+    def __init__(
+        self,
+        path: Path,
+        encoding: str | None,
+        etag: str,
+        last_modified: float,
+        body: bytes | None,
+    ) -> None:
+        """Initialize the variant."""
+        self.path = path
+        self.encoding = encoding
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+
+
+class _CachedFile:
+    """A served file with its precompressed siblings."""
+
+    __slots__ = ("content_type", "variants", "loaded", "size")
+
+    def __init__(self, content_type: str, variants: list[_FileVariant]) -> None:
+        """Initialize the cached file."""
+        self.content_type = content_type
+        self.variants = variants
+        self.loaded = monotonic()
+        self.size = sum(len(variant.body or b"") for variant in variants)
+
+    def select(self, accept_encoding: str) -> _FileVariant:
+        """Return the smallest variant the client accepts."""
+        accepted = _accepted_encodings(accept_encoding)
+        for variant in self.variants:
+            if (
+                variant.encoding is None
+                or accepted.get(variant.encoding, accepted.get("*", 0)) > 0
+            ):
+                return variant
+        raise AssertionError("Uncompressed variant missing")
+
+
+class _FileCache:
+    """Cache of served files bounded by the number and size of their contents."""
+
+    def __init__(self, max_files: int, max_bytes: int) -> None:
+        """Initialize the cache."""
+        self._files = LRU(max_files, self._evicted)
+        self._max_bytes = max_bytes
+        self.size = 0
+
+    def _evicted(self, filepath: Path, cached: _CachedFile) -> None:
+        """Account a file evicted by the number of files."""
+        self.size -= cached.size
+
+    def get(self, filepath: Path) -> _CachedFile | None:
+        """Return a cached file."""
+        return self._files.get(filepath)  # type: ignore[no-any-return]
+
+    def __setitem__(self, filepath: Path, cached: _CachedFile) -> None:
+        """Cache a file, evicting the least recently used above the size limit."""
+        self.pop(filepath)
+        self._files[filepath] = cached
+        self.size += cached.size
+        while self.size > self._max_bytes and len(self._files) > 1:
+            self.size -= self._files.popitem()[1].size
+
+    def pop(self, filepath: Path) -> None:
+        """Remove a file from the cache."""
+        if (cached := self._files.pop(filepath, None)) is not None:
+            self.size -= cached.size
+
+    def values(self) -> Iterable[_CachedFile]:
+        """Return the cached files."""
+        return self._files.values()  # type: ignore[no-any-return]
+
+    def clear(self) -> None:
+        """Remove all files from the cache."""
+        self._files.clear()
+        self.size = 0
+
+
+# Metadata of served files and the content of small files
+FILE_CACHE = _FileCache(FILE_CACHE_MAX_FILES, FILE_CACHE_MAX_BYTES)
+
+
+@lru_cache(maxsize=64)
+def _accepted_encodings(accept_encoding: str) -> Mapping[str, float]:
+    """Parse an Accept-Encoding header into the quality of each coding."""
+    accepted: dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if not (name := name.strip().lower()):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0
+        accepted[name] = quality
+    return accepted
+
+
+def _load_variant(path: Path, encoding: str | None) -> _FileVariant | None:
+    """Read the metadata and, if small, the content of a file."""
+    try:
+        file_stat = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None
+    body = path.read_bytes() if file_stat.st_size <= FILE_CACHE_MAX_SIZE else None
+    return _FileVariant(
+        path,
+        encoding,
+        # The same etag FileResponse uses
+        f"{file_stat.st_mtime_ns:x}-{file_stat.st_size:x}",
+        file_stat.st_mtime,
+        body,
+    )
+
+
+def _load_file(filepath: Path) -> _CachedFile:
+    """Load a file and its precompressed siblings."""
+    variants = [
+        variant
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES
+        if (
+            variant := _load_variant(
+                filepath.with_name(filepath.name + suffix), encoding
+            )
+        )
+    ]
+    if (variant := _load_variant(filepath, None)) is None:
+        raise FileNotFoundError
+    variants.append(variant)
+    content_type = mimetypes.guess_type(str(filepath))[0] or "application/octet-stream"
+    return _CachedFile(content_type, variants)
+
+
+def _is_not_modified(request: Request, variant: _FileVariant) -> bool:
+    """Return if the client already has the variant."""
+    if (if_none_match := request.if_none_match) is not None:
+        return any(etag.value in (variant.etag, "*") for etag in if_none_match)
+    if (if_modified_since := request.if_modified_since) is not None:
+        return variant.last_modified <= if_modified_since.timestamp()
+    return False
 
 
 def _get_file_path(
@@ -62,10 +230,43 @@ class CachingStaticResource(StaticResource):
             request.app.logger.exception(error)
             raise HTTPNotFound() from error
 
-        if filepath:
+        if not filepath:
+            return await super()._handle(request)
+
+        cached = FILE_CACHE.get(filepath)
+        if cached is None or monotonic() - cached.loaded > FILE_CACHE_REVALIDATE:
+            try:
+                cached = FILE_CACHE[filepath] = await hass.async_add_executor_job(
+                    _load_file, filepath
+                )
+            except OSError as error:
+                PATH_CACHE.pop(key, None)
+                raise HTTPNotFound() from error
+
+        variant = cached.select(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+        headers = {**CACHE_HEADERS, hdrs.CONTENT_TYPE: cached.content_type}
+        if len(cached.variants) > 1:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+        if variant.encoding:
+            headers[hdrs.CONTENT_ENCODING] = variant.encoding
+
+        # Conditional and range requests of large files are handled by
+        # FileResponse, which reads the metadata again
+        if variant.body is None or request.method != hdrs.METH_GET:
+            return FileResponse(
+                variant.path, chunk_size=self._chunk_size, headers=headers
+            )
+
+        if _is_not_modified(request, variant):
+            del headers[hdrs.CONTENT_TYPE]
+            headers.pop(hdrs.CONTENT_ENCODING, None)
+            response = Response(status=304, headers=headers)
+        elif hdrs.RANGE in request.headers:
             return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                headers=CACHE_HEADERS,
+                variant.path, chunk_size=self._chunk_size, headers=headers
             )
-        return await super()._handle(request)
+        else:
+            response = Response(body=variant.body, headers=headers)
+        response.etag = variant.etag
+        response.last_modified = variant.last_modified
+        return response
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterable, Awaitable, Callable
 from http import HTTPStatus
 import logging
 from typing import Any
@@ -22,10 +22,13 @@ from homeassistant.const import CONTENT_TYPE_JSON
 from homeassistant.core import Context, is_callback
 from homeassistant.helpers.json import JSON_ENCODE_EXCEPTIONS, json_bytes
 
-from .const import KEY_AUTHENTICATED, KEY_HASS
+from .const import CONTENT_TYPE_NDJSON, KEY_AUTHENTICATED, KEY_HASS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Encoded items are buffered up to this size before they are written
+STREAM_CHUNK_SIZE = 65536
+
 
 class HomeAssistantView:
     """Base view for all views."""
@@ -65,6 +68,55 @@ class HomeAssistantView:
         response.enable_compression()
         return response
 
+    @staticmethod
+    async def json_stream(
+        request: web.Request, items: AsyncIterable[Any]
+    ) -> web.StreamResponse:
+        """Stream items as a JSON array using chunked transfer encoding.
+
+        Items are encoded one by one, so the response body is never held in
+        memory. Clients which accept application/x-ndjson get one JSON
+        document per line instead. Items which cannot be serialized are
+        logged and left out as the status has already been sent.
+        """
+        ndjson = CONTENT_TYPE_NDJSON in request.headers.get("Accept", "")
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": CONTENT_TYPE_NDJSON if ndjson else CONTENT_TYPE_JSON
+            }
+        )
+        response.enable_chunked_encoding()
+        response.enable_compression()
+        await response.prepare(request)
+
+        separator = b"\n" if ndjson else b","
+        buffer = bytearray() if ndjson else bytearray(b"[")
+        first = True
+        async for item in items:
+            try:
+                encoded = json_bytes(item)
+            except JSON_ENCODE_EXCEPTIONS as err:
+                _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, item)
+                continue
+            if ndjson:
+                buffer += encoded
+                buffer += separator
+            else:
+                if not first:
+                    buffer += separator
+                buffer += encoded
+            first = False
+            if len(buffer) >= STREAM_CHUNK_SIZE:
+                await response.write(bytes(buffer))
+                buffer.clear()
+
+        if not ndjson:
+            buffer += b"]"
+        if buffer:
+            await response.write(bytes(buffer))
+        await response.write_eof()
+        return response
+
     def json_message(
         self,
         message: str,
@@ -450,6 +450,7 @@ def _ws_formatted_get_events(
     }
 )
 @websocket_api.async_response
+@websocket_api.limit_concurrency
 async def ws_get_events(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
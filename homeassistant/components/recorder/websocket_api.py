@@ -109,6 +109,7 @@ def _ws_get_statistic_during_period(
     }
 )
 @websocket_api.async_response
+@websocket_api.limit_concurrency
 async def ws_get_statistic_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
@@ -230,6 +231,7 @@ async def ws_handle_get_statistics_during_period(
     }
 )
 @websocket_api.async_response
+@websocket_api.limit_concurrency
 async def ws_get_statistics_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
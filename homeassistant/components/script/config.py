@@ -26,7 +26,11 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_per_platform, config_validation as cv
+from homeassistant.helpers import (
+    config_item_cache,
+    config_per_platform,
+    config_validation as cv,
+)
 from homeassistant.helpers.script import (
     SCRIPT_MODE_SINGLE,
     async_validate_actions_config,
@@ -185,12 +189,27 @@ async def _try_async_validate_config_item(
     object_id: str,
     config: ConfigType,
 ) -> ScriptConfig | None:
-    """Validate config item."""
+    """Validate config item.
+
+    Scripts which are unchanged since they were last validated are reused
+    instead of being validated again. Blueprint scripts are always
+    validated since the blueprint may have changed.
+    """
+    cache = None
+    if not is_blueprint_instance_config(config):
+        cache = config_item_cache.async_get(hass)
+        if (cached := cache.async_get(DOMAIN, object_id, config)) is not None:
+            return cached  # type: ignore[no-any-return]
+
     try:
-        return await _async_validate_config_item(hass, object_id, config, True)
+        script_config = await _async_validate_config_item(hass, object_id, config, True)
     except (vol.Invalid, HomeAssistantError):
         return None
 
+    if cache is not None:
+        cache.async_set(DOMAIN, object_id, config, script_config)
+    return script_config
+
 
 async def async_validate_config_item(
     hass: HomeAssistant,
@@ -215,6 +234,7 @@ async def async_validate_config(hass, config):
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
+    config_item_cache.async_get(hass).async_retain(DOMAIN, list(scripts.values()))
     config = config_without_domain(config, DOMAIN)
     config[DOMAIN] = scripts
 
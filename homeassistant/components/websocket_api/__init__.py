@@ -26,6 +26,7 @@ from .const import (  # noqa: F401
 )
 from .decorators import (  # noqa: F401
     async_response,
+    limit_concurrency,
     require_admin,
     websocket_command,
     ws_require_user,
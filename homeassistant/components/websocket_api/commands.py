@@ -37,7 +37,11 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_IMPORT_TIME,
+    DATA_SETUP_TIME,
+    async_get_loaded_integrations,
+)
 from homeassistant.util.json import (
     find_paths_unserializable_data,
     format_unserializable_data,
@@ -46,6 +50,9 @@ from homeassistant.util.json import (
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .const import ERR_NOT_FOUND
+from .entity_subscriptions import async_get_hub
+from .metrics import async_get_metrics
+from .state_snapshot import async_get_snapshot
 
 
 @callback
@@ -73,6 +80,8 @@ def async_register_commands(
     async_reg(hass, handle_unsubscribe_events)
     async_reg(hass, handle_validate_config)
     async_reg(hass, handle_subscribe_entities)
+    async_reg(hass, handle_subscribe_entities_stats)
+    async_reg(hass, handle_command_metrics)
     async_reg(hass, handle_supported_features)
     async_reg(hass, handle_integration_descriptions)
 
@@ -112,18 +121,14 @@ def handle_subscribe_events(
             ):
                 return
 
-            connection.send_message(
-                lambda: messages.cached_event_message(msg["id"], event)
-            )
+            connection.send_message(messages.CachedEventMessage(msg["id"], event))
 
     else:
 
         @callback
         def forward_events(event: Event) -> None:
             """Forward events to websocket."""
-            connection.send_message(
-                lambda: messages.cached_event_message(msg["id"], event)
-            )
+            connection.send_message(messages.CachedEventMessage(msg["id"], event))
 
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         event_type, forward_events, run_immediately=True
@@ -241,7 +246,27 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
-    states = _async_get_allowed_states(hass, connection)
+    snapshot = async_get_snapshot(hass)
+    states: list[State] | None = None
+    if not connection.user.permissions.access_all_entities("read"):
+        states = _async_get_allowed_states(hass, connection)
+
+    if connection.msgpack:
+        if (packed_states := snapshot.async_states_msgpack(states)) is not None:
+            connection.send_message(
+                messages.msgpack_result_message(msg["id"], packed_states)
+            )
+            return
+    elif (serialized_states := snapshot.async_states_json(states)) is not None:
+        connection.send_message(
+            JSON_DUMP(messages.result_message(msg["id"], ["TO_REPLACE"])).replace(
+                '"TO_REPLACE"', serialized_states
+            )
+        )
+        return
+
+    if states is None:
+        states = hass.states.async_all()
 
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
@@ -287,28 +312,41 @@ def handle_subscribe_entities(
     """Handle subscribe entities command."""
     entity_ids = set(msg.get("entity_ids", []))
 
-    @callback
-    def forward_entity_changes(event: Event) -> None:
-        """Forward entity state changed events to websocket."""
-        if not connection.user.permissions.check_entity(
-            event.data["entity_id"], POLICY_READ
-        ):
-            return
-        if entity_ids and event.data["entity_id"] not in entity_ids:
-            return
-
-        connection.send_message(
-            lambda: messages.cached_state_diff_message(msg["id"], event)
-        )
-
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED, forward_entity_changes, run_immediately=True
+    connection.subscriptions[msg["id"]] = async_get_hub(hass).async_subscribe(
+        connection, msg["id"], entity_ids
     )
     connection.send_result(msg["id"])
+
+    snapshot = async_get_snapshot(hass)
+    snapshot_states: list[State] | None = None
+    if entity_ids or not connection.user.permissions.access_all_entities("read"):
+        snapshot_states = [
+            state for state in states if not entity_ids or state.entity_id in entity_ids
+        ]
+
+    if connection.msgpack:
+        packed_states = snapshot.async_compressed_states_msgpack(snapshot_states)
+        if packed_states is not None:
+            connection.send_message(
+                messages.msgpack_entities_added_message(msg["id"], packed_states)
+            )
+            return
+    elif (
+        serialized_states := snapshot.async_compressed_states_json(snapshot_states)
+    ) is not None:
+        connection.send_message(
+            JSON_DUMP(
+                messages.event_message(
+                    msg["id"], {messages.ENTITY_EVENT_ADD: "TO_REPLACE"}
+                )
+            ).replace('"TO_REPLACE"', f"{{{serialized_states}}}")
+        )
+        return
+
     data: dict[str, dict[str, dict]] = {
         messages.ENTITY_EVENT_ADD: {
             state.entity_id: state.as_compressed_state()
@@ -347,6 +385,27 @@ def handle_subscribe_entities(
     connection.send_message(JSON_DUMP(messages.event_message(msg["id"], data)))
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "subscribe_entities/stats"})
+def handle_subscribe_entities_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities stats command."""
+    connection.send_result(
+        msg["id"], async_get_hub(hass).async_connection_stats(connection)
+    )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "command_metrics"})
+@decorators.require_admin
+def handle_command_metrics(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle command metrics command."""
+    connection.send_result(msg["id"], async_get_metrics(hass).async_as_dict())
+
+
 @decorators.websocket_command({vol.Required("type"): "get_services"})
 @decorators.async_response
 async def handle_get_services(
@@ -410,15 +469,27 @@ async def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
-    connection.send_result(
-        msg["id"],
-        [
-            {"domain": integration, "seconds": timedelta.total_seconds()}
-            for integration, timedelta in cast(
-                dict[str, dt.timedelta], hass.data[DATA_SETUP_TIME]
-            ).items()
-        ],
-    )
+    import_time: dict[str, dt.timedelta] = hass.data.get(DATA_IMPORT_TIME, {})
+    entry_times: dict[str, list[dict[str, Any]]] = {}
+    for entry_id, seconds in hass.config_entries.setup_times.items():
+        if entry := hass.config_entries.async_get_entry(entry_id):
+            entry_times.setdefault(entry.domain, []).append(
+                {"entry_id": entry_id, "seconds": seconds}
+            )
+    setup_info: list[dict[str, Any]] = []
+    for integration, timedelta in cast(
+        dict[str, dt.timedelta], hass.data[DATA_SETUP_TIME]
+    ).items():
+        info: dict[str, Any] = {
+            "domain": integration,
+            "seconds": timedelta.total_seconds(),
+        }
+        if integration in import_time:
+            info["import_seconds"] = import_time[integration].total_seconds()
+        if integration in entry_times:
+            info["config_entries"] = entry_times[integration]
+        setup_info.append(info)
+    connection.send_result(msg["id"], setup_info)
 
 
 @callback
@@ -492,6 +563,7 @@ async def handle_render_template(
             _template_listener,
             raise_on_template_error=True,
             strict=msg["strict"],
+            use_render_cache=True,
         )
     except TemplateError as ex:
         connection.send_error(msg["id"], const.ERR_TEMPLATE_ERROR, str(ex))
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Hashable
 from contextvars import ContextVar
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
@@ -14,6 +15,8 @@ from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
 
 from . import const, messages
+from .metrics import async_get_metrics
+from .scheduler import async_get_scheduler
 
 if TYPE_CHECKING:
     from .http import WebSocketAdapter
@@ -31,7 +34,9 @@ class ActiveConnection:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+        send_message: Callable[
+            [str | bytes | dict[str, Any] | Callable[[], str]], None
+        ],
         user: User,
         refresh_token: RefreshToken,
     ) -> None:
@@ -46,6 +51,11 @@ class ActiveConnection:
         self.supported_features: dict[str, float] = {}
         current_connection.set(self)
 
+    @property
+    def msgpack(self) -> bool:
+        """Return if the client gets messages as MessagePack."""
+        return const.FEATURE_MSGPACK_MESSAGES in self.supported_features
+
     def context(self, msg: dict[str, Any]) -> Context:
         """Return a context."""
         return Context(user_id=self.user.id)
@@ -98,10 +108,15 @@ class ActiveConnection:
 
         handler, schema = handlers[msg["type"]]
 
+        start = perf_counter()
         try:
             handler(self.hass, self, schema(msg))
         except Exception as err:  # pylint: disable=broad-except
             self.async_handle_exception(msg, err)
+        if not getattr(handler, "_ws_async_response", False):
+            async_get_metrics(self.hass).async_record(
+                msg["type"], perf_counter() - start
+            )
 
         self.last_id = cur_id
 
@@ -110,6 +125,7 @@ class ActiveConnection:
         """Handle closing down connection."""
         for unsub in self.subscriptions.values():
             unsub()
+        async_get_scheduler(self.hass).async_remove_connection(self)
 
     @callback
     def async_handle_exception(self, msg: dict[str, Any], err: Exception) -> None:
@@ -50,4 +50,20 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
+# Data used to store the shared entity subscription hub
+DATA_ENTITY_SUBSCRIPTIONS: Final = f"{DOMAIN}.entity_subscriptions"
+
+# Data used to store the serialized state snapshot
+DATA_STATE_SNAPSHOT: Final = f"{DOMAIN}.state_snapshot"
+
+# Data used to store the scheduler and latency metrics of commands
+DATA_COMMAND_SCHEDULER: Final = f"{DOMAIN}.command_scheduler"
+DATA_COMMAND_METRICS: Final = f"{DOMAIN}.command_metrics"
+
+# Limits for commands decorated with limit_concurrency
+MAX_CONCURRENT_LIMITED_COMMANDS: Final = 4
+MAX_CONNECTION_LIMITED_COMMANDS: Final = 2
+
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_COALESCE_ENTITY_UPDATES = "coalesce_entity_updates"
+FEATURE_MSGPACK_MESSAGES = "msgpack_messages"
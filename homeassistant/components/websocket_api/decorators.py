@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 from functools import wraps
+from time import perf_counter
 from typing import Any
 
 import voluptuous as vol
@@ -14,6 +15,8 @@ from homeassistant.exceptions import Unauthorized
 
 from . import const, messages
 from .connection import ActiveConnection
+from .metrics import async_get_metrics
+from .scheduler import async_get_scheduler
 
 
 async def _handle_async_response(
@@ -23,10 +26,14 @@ async def _handle_async_response(
     msg: dict[str, Any],
 ) -> None:
     """Create a response and handle exception."""
+    # Handlers may pop the type from the message
+    command = msg["type"]
+    start = perf_counter()
     try:
         await func(hass, connection, msg)
     except Exception as err:  # pylint: disable=broad-except
         connection.async_handle_exception(msg, err)
+    async_get_metrics(hass).async_record(command, perf_counter() - start)
 
 
 def async_response(
@@ -44,9 +51,30 @@ def async_response(
         # event we do not want to block for websocket responders
         asyncio.create_task(_handle_async_response(func, hass, connection, msg))
 
+    # The latency is recorded when the scheduled handler is done
+    schedule_handler._ws_async_response = True  # type: ignore[attr-defined]
     return schedule_handler
 
 
+def limit_concurrency(
+    func: const.AsyncWebSocketCommandHandler,
+) -> const.AsyncWebSocketCommandHandler:
+    """Decorate an expensive async command to limit how many run at once.
+
+    Commands which exceed the limits wait for a free slot.
+    """
+
+    @wraps(func)
+    async def limited_handler(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        """Run the handler in a free slot."""
+        async with async_get_scheduler(hass).async_slot(connection):
+            await func(hass, connection, msg)
+
+    return limited_handler
+
+
 def require_admin(func: const.WebSocketCommandHandler) -> const.WebSocketCommandHandler:
     """Websocket decorator to require user to be an admin."""
 
@@ -0,0 +1,243 @@
+"""Shared state changed listener for subscribe_entities subscriptions."""
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any
+
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from . import messages
+from .connection import ActiveConnection
+from .const import DATA_ENTITY_SUBSCRIPTIONS, FEATURE_COALESCE_ENTITY_UPDATES
+
+
+class _EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = ("connection", "msg_id", "entity_ids")
+
+    def __init__(
+        self, connection: ActiveConnection, msg_id: int, entity_ids: set[str]
+    ) -> None:
+        """Initialize the subscription."""
+        self.connection = connection
+        self.msg_id = msg_id
+        self.entity_ids = entity_ids
+
+    @callback
+    def async_send(self, event: Event) -> None:
+        """Send a state changed event to the connection."""
+        self.connection.send_message(
+            messages.CachedStateDiffMessage(self.msg_id, event)
+        )
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return statistics of the subscription."""
+        return {"id": self.msg_id, "coalesce": False}
+
+
+class _CoalescingEntitySubscription(_EntitySubscription):
+    """A subscription which keeps only the latest change per entity.
+
+    While a message is waiting in the write queue of the connection,
+    further changes are merged into it instead of being queued, so the
+    backlog of a slow client is bounded by the number of entities.
+    """
+
+    __slots__ = ("_pending", "sent", "coalesced", "max_pending")
+
+    def __init__(
+        self, connection: ActiveConnection, msg_id: int, entity_ids: set[str]
+    ) -> None:
+        """Initialize the subscription."""
+        super().__init__(connection, msg_id, entity_ids)
+        self._pending: dict[str, tuple[Event, Event]] = {}
+        self.sent = 0
+        self.coalesced = 0
+        self.max_pending = 0
+
+    @callback
+    def async_send(self, event: Event) -> None:
+        """Queue a state changed event, merging it into a pending message."""
+        pending = self._pending
+        if not pending:
+            pending[event.data["entity_id"]] = (event, event)
+            self.connection.send_message(_PendingChangesMessage(self))
+            return
+
+        self.coalesced += 1
+        entity_id: str = event.data["entity_id"]
+        if (queued := pending.get(entity_id)) is None:
+            pending[entity_id] = (event, event)
+            self.max_pending = max(self.max_pending, len(pending))
+        else:
+            pending[entity_id] = (queued[0], event)
+
+    @callback
+    def async_flush(self) -> messages.EventMessage:
+        """Take the pending changes, called when the message is written."""
+        pending = self._pending
+        self._pending = {}
+        self.sent += 1
+        if len(pending) == 1:
+            first, last = next(iter(pending.values()))
+            if first is last:
+                # Share the serialized diff with the other connections
+                return messages.CachedStateDiffMessage(self.msg_id, first)
+        return messages.coalesced_state_diff_message(
+            self.msg_id,
+            {
+                entity_id: (first.data["old_state"], last.data["new_state"])
+                for entity_id, (first, last) in pending.items()
+            },
+        )
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return statistics of the subscription."""
+        return {
+            "id": self.msg_id,
+            "coalesce": True,
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "pending": len(self._pending),
+            "max_pending": self.max_pending,
+        }
+
+
+class _PendingChangesMessage(messages.LazyMessage):
+    """The pending changes of a subscription, taken when written."""
+
+    __slots__ = ("_subscription",)
+
+    def __init__(self, subscription: _CoalescingEntitySubscription) -> None:
+        """Initialize the message."""
+        self._subscription = subscription
+
+    def __call__(self) -> str:
+        """Return the message serialized to JSON."""
+        return self._subscription.async_flush()()
+
+    def as_msgpack(self) -> bytes:
+        """Return the message serialized to MessagePack."""
+        return self._subscription.async_flush().as_msgpack()
+
+
+class EntitySubscriptionHub:
+    """Forward state changes to subscribe_entities subscriptions.
+
+    All subscriptions share a single state changed listener. Subscriptions
+    limited to a set of entities are indexed by entity id so a state change
+    only visits the subscriptions it is relevant for, permissions are checked
+    once per permission set and the diff is serialized once per event.
+
+    Connections which announce the coalesce_entity_updates feature get
+    subscriptions that merge changes while the client is lagging behind.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        self._all_entities: dict[int, _EntitySubscription] = {}
+        self._by_entity_id: dict[str, dict[int, _EntitySubscription]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self, connection: ActiveConnection, msg_id: int, entity_ids: set[str]
+    ) -> CALLBACK_TYPE:
+        """Subscribe a connection to state changes of the given entities.
+
+        An empty set of entity ids subscribes to all entities.
+        """
+        subscription_cls = (
+            _CoalescingEntitySubscription
+            if connection.supported_features.get(FEATURE_COALESCE_ENTITY_UPDATES)
+            else _EntitySubscription
+        )
+        subscription = subscription_cls(connection, msg_id, entity_ids)
+        key = id(subscription)
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._by_entity_id.setdefault(entity_id, {})[key] = subscription
+        else:
+            self._all_entities[key] = subscription
+
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward, run_immediately=True
+            )
+
+        @callback
+        def async_unsubscribe() -> None:
+            """Remove the subscription."""
+            if entity_ids:
+                for entity_id in entity_ids:
+                    subscriptions = self._by_entity_id[entity_id]
+                    del subscriptions[key]
+                    if not subscriptions:
+                        del self._by_entity_id[entity_id]
+            else:
+                del self._all_entities[key]
+
+            if not self._all_entities and not self._by_entity_id and self._unsub:
+                self._unsub()
+                self._unsub = None
+
+        return async_unsubscribe
+
+    @callback
+    def _async_forward(self, event: Event) -> None:
+        """Forward a state changed event to the matching subscriptions."""
+        entity_id: str = event.data["entity_id"]
+        if by_entity_id := self._by_entity_id.get(entity_id):
+            subscriptions = chain(self._all_entities.values(), by_entity_id.values())
+        elif self._all_entities:
+            subscriptions = iter(self._all_entities.values())
+        else:
+            return
+
+        # Users sharing the same permissions only need to be checked once.
+        # The dict only lives for this event while every permissions object
+        # is referenced by a subscription, so an id can't be reused by
+        # another object before the dict is gone.
+        allowed: dict[int, bool] = {}
+        for subscription in list(subscriptions):
+            permissions = subscription.connection.user.permissions
+            if (may_read := allowed.get(id(permissions))) is None:
+                may_read = allowed[id(permissions)] = permissions.check_entity(
+                    entity_id, POLICY_READ
+                )
+            if not may_read:
+                continue
+            subscription.async_send(event)
+
+    @callback
+    def async_connection_stats(
+        self, connection: ActiveConnection
+    ) -> list[dict[str, Any]]:
+        """Return statistics of the subscriptions of a connection."""
+        subscriptions = chain(
+            self._all_entities.values(),
+            *(by_entity_id.values() for by_entity_id in self._by_entity_id.values()),
+        )
+        return [
+            subscription.async_stats()
+            for subscription in {
+                id(subscription): subscription
+                for subscription in subscriptions
+                if subscription.connection is connection
+            }.values()
+        ]
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> EntitySubscriptionHub:
+    """Return the entity subscription hub."""
+    hub: EntitySubscriptionHub | None = hass.data.get(DATA_ENTITY_SUBSCRIPTIONS)
+    if hub is None:
+        hub = hass.data[DATA_ENTITY_SUBSCRIPTIONS] = EntitySubscriptionHub(hass)
+    return hub
@@ -6,7 +6,7 @@ from collections.abc import Callable
 from contextlib import suppress
 import datetime as dt
 import logging
-from typing import TYPE_CHECKING, Any, Final
+from typing import TYPE_CHECKING, Any, Final, cast
 
 from aiohttp import WSMsgType, web
 import async_timeout
@@ -31,7 +31,13 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json
+from .messages import (
+    LazyMessage,
+    json_to_msgpack,
+    message_to_json,
+    message_to_msgpack,
+    msgpack_array,
+)
 
 if TYPE_CHECKING:
     from .connection import ActiveConnection
@@ -80,13 +86,11 @@ class WebSocketHandler:
         # Exceptions if Socket disconnected or cancelled by connection handler
         to_write = self._to_write
         logger = self._logger
-        wsock = self.wsock
         try:
             with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
                 while not self.wsock.closed:
                     if (process := await to_write.get()) is None:
                         return
-                    message = process if isinstance(process, str) else process()
 
                     if (
                         to_write.empty()
@@ -94,29 +98,62 @@ class WebSocketHandler:
                         or FEATURE_COALESCE_MESSAGES
                         not in self.connection.supported_features
                     ):
+                        message = self._serialize(process)
                         logger.debug("Sending %s", message)
-                        await wsock.send_str(message)
+                        await self._send(message)
                         continue
 
-                    messages: list[str] = [message]
+                    messages = [self._serialize(process)]
                     while not to_write.empty():
                         if (process := to_write.get_nowait()) is None:
                             return
-                        messages.append(
-                            process if isinstance(process, str) else process()
-                        )
+                        messages.append(self._serialize(process))
 
-                    coalesced_messages = "[" + ",".join(messages) + "]"
+                    coalesced_messages = (
+                        msgpack_array(cast(list[bytes], messages))
+                        if self._msgpack
+                        else "[" + ",".join(cast(list[str], messages)) + "]"
+                    )
                     self._logger.debug("Sending %s", coalesced_messages)
-                    await self.wsock.send_str(coalesced_messages)
+                    await self._send(coalesced_messages)
         finally:
             # Clean up the peaker checker when we shut down the writer
             if self._peak_checker_unsub is not None:
                 self._peak_checker_unsub()
                 self._peak_checker_unsub = None
 
+    @property
+    def _msgpack(self) -> bool:
+        """Return if the client gets messages as MessagePack."""
+        return self.connection is not None and self.connection.msgpack
+
+    def _serialize(self, process: str | bytes | Callable[[], str]) -> str | bytes:
+        """Serialize a queued message in the format of the client.
+
+        Lazy messages share their serialized payload between connections in
+        either format. Only messages handed over as JSON are converted, large
+        messages are serialized to MessagePack by their handlers.
+        """
+        as_msgpack = self._msgpack
+        if isinstance(process, LazyMessage):
+            return process.as_msgpack() if as_msgpack else process()
+        if callable(process):
+            process = process()
+        if as_msgpack and isinstance(process, str):
+            return json_to_msgpack(process)
+        return process
+
+    async def _send(self, message: str | bytes) -> None:
+        """Send a serialized message."""
+        if isinstance(message, bytes):
+            await self.wsock.send_bytes(message)
+            return
+        await self.wsock.send_str(message)
+
     @callback
-    def _send_message(self, message: str | dict[str, Any] | Callable[[], str]) -> None:
+    def _send_message(
+        self, message: str | bytes | dict[str, Any] | Callable[[], str]
+    ) -> None:
         """Send a message to the client.
 
         Closes connection if the client is not reading the messages.
@@ -124,7 +161,11 @@ class WebSocketHandler:
         Async friendly.
         """
         if isinstance(message, dict):
-            message = message_to_json(message)
+            message = (
+                message_to_msgpack(message)
+                if self._msgpack
+                else message_to_json(message)
+            )
 
         try:
             self._to_write.put_nowait(message)
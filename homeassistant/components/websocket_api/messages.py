@@ -1,10 +1,14 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
+from contextlib import suppress
+from datetime import datetime
 from functools import lru_cache
 import logging
 from typing import Any, Final
 
+import msgpack
 import voluptuous as vol
 
 from homeassistant.const import (
@@ -16,7 +20,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.json import JSON_DUMP, json_encoder_default, json_loads
 from homeassistant.util.json import (
     find_paths_unserializable_data,
     format_unserializable_data,
@@ -46,6 +50,95 @@ ENTITY_EVENT_ADD = "a"
 ENTITY_EVENT_REMOVE = "r"
 ENTITY_EVENT_CHANGE = "c"
 
+# An event message is a map of id, type and event, the id goes in between
+_MSGPACK_EVENT_MESSAGE_START: Final = b"".join(
+    (msgpack.Packer().pack_map_header(3), msgpack.packb("id"))
+)
+_MSGPACK_EVENT_MESSAGE_TYPE: Final = b"".join(
+    msgpack.packb(value) for value in ("type", "event", "event")
+)
+# A result message is a map of id, type, success and result
+_MSGPACK_RESULT_MESSAGE_START: Final = b"".join(
+    (msgpack.Packer().pack_map_header(4), msgpack.packb("id"))
+)
+_MSGPACK_RESULT_MESSAGE_TYPE: Final = b"".join(
+    msgpack.packb(value)
+    for value in ("type", const.TYPE_RESULT, "success", True, "result")
+)
+# The add event of subscribe_entities is a map of the added states
+_MSGPACK_ENTITIES_ADDED_START: Final = b"".join(
+    (msgpack.Packer().pack_map_header(1), msgpack.packb(ENTITY_EVENT_ADD))
+)
+
+
+class LazyMessage(ABC):
+    """A message serialized when it is written to a connection.
+
+    Calling it returns the message as JSON, as_msgpack returns it as
+    MessagePack for connections which support it.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def __call__(self) -> str:
+        """Return the message serialized to JSON."""
+
+    @abstractmethod
+    def as_msgpack(self) -> bytes:
+        """Return the message serialized to MessagePack."""
+
+
+class EventMessage(LazyMessage):
+    """An event message serialized when it is written."""
+
+    __slots__ = ("iden", "event")
+
+    def __init__(self, iden: int, event: Any) -> None:
+        """Initialize the message."""
+        self.iden = iden
+        self.event = event
+
+    def __call__(self) -> str:
+        """Return the message serialized to JSON."""
+        return message_to_json(event_message(self.iden, self.event))
+
+    def as_msgpack(self) -> bytes:
+        """Return the message serialized to MessagePack."""
+        return message_to_msgpack(event_message(self.iden, self.event))
+
+
+class CachedEventMessage(EventMessage):
+    """An event message of which the serialized event is shared.
+
+    The event is serialized once per format for all connections, only the
+    id is filled in per connection.
+    """
+
+    __slots__ = ()
+
+    def __call__(self) -> str:
+        """Return the message serialized to JSON."""
+        return cached_event_message(self.iden, self.event)
+
+    def as_msgpack(self) -> bytes:
+        """Return the message serialized to MessagePack."""
+        return msgpack_event_message(self.iden, _cached_event_msgpack(self.event))
+
+
+class CachedStateDiffMessage(EventMessage):
+    """A state diff event message of which the serialized diff is shared."""
+
+    __slots__ = ()
+
+    def __call__(self) -> str:
+        """Return the message serialized to JSON."""
+        return cached_state_diff_message(self.iden, self.event)
+
+    def as_msgpack(self) -> bytes:
+        """Return the message serialized to MessagePack."""
+        return msgpack_event_message(self.iden, _cached_state_diff_msgpack(self.event))
+
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
@@ -111,6 +204,46 @@ def _cached_state_diff_message(event: Event) -> str:
     return message_to_json(event_message(IDEN_TEMPLATE, _state_diff_event(event)))
 
 
+@lru_cache(maxsize=128)
+def _cached_event_msgpack(event: Event) -> bytes:
+    """Cache and serialize the event to MessagePack."""
+    return msgpack_dumps(event)
+
+
+@lru_cache(maxsize=128)
+def _cached_state_diff_msgpack(event: Event) -> bytes:
+    """Cache and serialize the state diff of the event to MessagePack."""
+    return msgpack_dumps(_state_diff_event(event))
+
+
+def msgpack_event_message(iden: int, packed_event: bytes) -> bytes:
+    """Return an event message around an event serialized to MessagePack."""
+    return (
+        _MSGPACK_EVENT_MESSAGE_START
+        + msgpack.packb(iden)
+        + _MSGPACK_EVENT_MESSAGE_TYPE
+        + packed_event
+    )
+
+
+def msgpack_entities_added_message(iden: int, packed_states: bytes) -> bytes:
+    """Return a subscribe_entities event adding states serialized to MessagePack.
+
+    The states are a map of entity ids to compressed states.
+    """
+    return msgpack_event_message(iden, _MSGPACK_ENTITIES_ADDED_START + packed_states)
+
+
+def msgpack_result_message(iden: int, packed_result: bytes) -> bytes:
+    """Return a success result message around a result serialized to MessagePack."""
+    return (
+        _MSGPACK_RESULT_MESSAGE_START
+        + msgpack.packb(iden)
+        + _MSGPACK_RESULT_MESSAGE_TYPE
+        + packed_result
+    )
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
@@ -135,6 +268,36 @@ def _state_diff_event(event: Event) -> dict:
     return _state_diff(event_old_state, event_new_state)
 
 
+def coalesced_state_diff_message(
+    iden: int, changes: dict[str, tuple[State | None, State | None]]
+) -> EventMessage:
+    """Return an event message for multiple coalesced state changes.
+
+    Each entity is mapped to the state the client last received and
+    the current state.
+    """
+    added: dict[str, dict[str, Any]] = {}
+    changed: dict[str, dict[str, Any]] = {}
+    removed: list[str] = []
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            if old_state is not None:
+                removed.append(entity_id)
+        elif old_state is None:
+            added[entity_id] = new_state.as_compressed_state()
+        else:
+            changed.update(_state_diff(old_state, new_state)[ENTITY_EVENT_CHANGE])
+
+    event: dict[str, Any] = {}
+    if added:
+        event[ENTITY_EVENT_ADD] = added
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removed:
+        event[ENTITY_EVENT_REMOVE] = removed
+    return EventMessage(iden, event)
+
+
 @lru_cache(maxsize=128)
 def _state_diff(
     old_state: State, new_state: State
@@ -186,3 +349,47 @@ def message_to_json(message: dict[str, Any]) -> str:
                 message["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
             )
         )
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Convert objects MessagePack does not support as they are sent as JSON."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    with suppress(TypeError):
+        return json_encoder_default(obj)
+    return json_loads(JSON_DUMP(obj))
+
+
+def msgpack_dumps(obj: Any) -> bytes:
+    """Serialize an object to MessagePack."""
+    return msgpack.packb(obj, default=_msgpack_default)  # type: ignore[no-any-return]
+
+
+def message_to_msgpack(message: dict[str, Any]) -> bytes:
+    """Serialize a websocket message to MessagePack."""
+    try:
+        return msgpack_dumps(message)
+    except (ValueError, TypeError, OverflowError):
+        _LOGGER.error(
+            "Unable to serialize to MessagePack. Bad data found at %s",
+            format_unserializable_data(
+                find_paths_unserializable_data(
+                    message, dump=msgpack_dumps  # type: ignore[arg-type]
+                )
+            ),
+        )
+        return msgpack_dumps(
+            error_message(
+                message["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
+            )
+        )
+
+
+def json_to_msgpack(message: str) -> bytes:
+    """Convert a message serialized to JSON to MessagePack."""
+    return msgpack.packb(json_loads(message))  # type: ignore[no-any-return]
+
+
+def msgpack_array(messages: list[bytes]) -> bytes:
+    """Join messages serialized to MessagePack into an array."""
+    return msgpack.Packer().pack_array_header(len(messages)) + b"".join(messages)
@@ -0,0 +1,77 @@
+"""Latency metrics of websocket commands."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_COMMAND_METRICS
+
+# Upper bounds of the histogram buckets in seconds
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+_BUCKET_KEYS = (*(str(bound) for bound in LATENCY_BUCKETS), "+Inf")
+
+
+class CommandLatency:
+    """Latency histogram of a command type."""
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        # The last bucket counts everything above the largest bound
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @callback
+    def async_add(self, seconds: float) -> None:
+        """Add a measurement."""
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dict."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            # Keyed by the upper bound of the bucket in seconds
+            "buckets": dict(zip(_BUCKET_KEYS, self.buckets, strict=True)),
+        }
+
+
+class CommandMetrics:
+    """Collect the latency of handled websocket commands per type."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.latencies: dict[str, CommandLatency] = {}
+
+    @callback
+    def async_as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the latency histograms by command type."""
+        return {
+            command: latency.as_dict()
+            for command, latency in sorted(self.latencies.items())
+        }
+
+    @callback
+    def async_record(self, command: str, seconds: float) -> None:
+        """Record the latency of a handled command."""
+        if (latency := self.latencies.get(command)) is None:
+            latency = self.latencies[command] = CommandLatency()
+        latency.async_add(seconds)
+
+
+@callback
+def async_get_metrics(hass: HomeAssistant) -> CommandMetrics:
+    """Return the command metrics."""
+    metrics: CommandMetrics | None = hass.data.get(DATA_COMMAND_METRICS)
+    if metrics is None:
+        metrics = hass.data[DATA_COMMAND_METRICS] = CommandMetrics()
+    return metrics
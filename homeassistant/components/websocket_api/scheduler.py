@@ -0,0 +1,166 @@
+"""Limit the concurrency of expensive websocket commands."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DATA_COMMAND_SCHEDULER,
+    MAX_CONCURRENT_LIMITED_COMMANDS,
+    MAX_CONNECTION_LIMITED_COMMANDS,
+)
+
+if TYPE_CHECKING:
+    from .connection import ActiveConnection
+
+
+class CommandScheduler:
+    """Run a limited number of expensive commands at the same time.
+
+    Commands beyond the global or the per connection limit wait in a queue
+    per user. Free slots are handed to the users in turn, so a single user
+    with many queued commands cannot starve the others.
+    """
+
+    def __init__(self, limit: int, connection_limit: int) -> None:
+        """Initialize the scheduler."""
+        self._limit = limit
+        self._connection_limit = connection_limit
+        self._running = 0
+        self._running_by_connection: dict[ActiveConnection, int] = {}
+        self._waiting: dict[
+            str, deque[tuple[ActiveConnection, asyncio.Future[None]]]
+        ] = {}
+        # When each user was last handed a slot
+        self._turns: dict[str, int] = {}
+        self._turn = 0
+
+    @property
+    def running(self) -> int:
+        """Return the number of running commands."""
+        return self._running
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of waiting commands."""
+        return sum(len(queue) for queue in self._waiting.values())
+
+    @asynccontextmanager
+    async def async_slot(self, connection: ActiveConnection) -> AsyncIterator[None]:
+        """Wait for a free slot and hold it while the command runs."""
+        await self._async_acquire(connection)
+        try:
+            yield
+        finally:
+            self._async_release(connection)
+
+    async def _async_acquire(self, connection: ActiveConnection) -> None:
+        """Wait until the command is allowed to run."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        user_id = connection.user.id
+        self._waiting.setdefault(user_id, deque()).append((connection, future))
+        self._async_dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                self._async_remove_waiting(user_id, connection, future)
+            else:
+                # The slot was handed over right before the cancellation
+                self._async_release(connection)
+            raise
+
+    @callback
+    def async_remove_connection(self, connection: ActiveConnection) -> None:
+        """Cancel the waiting commands of a closed connection."""
+        for user_id, queue in list(self._waiting.items()):
+            for entry in [entry for entry in queue if entry[0] is connection]:
+                queue.remove(entry)
+                entry[1].cancel()
+            if not queue:
+                del self._waiting[user_id]
+
+    @callback
+    def _async_remove_waiting(
+        self,
+        user_id: str,
+        connection: ActiveConnection,
+        future: asyncio.Future[None],
+    ) -> None:
+        """Remove a cancelled command from the queue."""
+        entry = (connection, future)
+        # Commands of closed connections were already removed
+        if (queue := self._waiting.get(user_id)) is None or entry not in queue:
+            return
+        queue.remove(entry)
+        if not queue:
+            del self._waiting[user_id]
+
+    @callback
+    def _async_release(self, connection: ActiveConnection) -> None:
+        """Free the slot of a finished command."""
+        self._running -= 1
+        if running := self._running_by_connection[connection] - 1:
+            self._running_by_connection[connection] = running
+        else:
+            del self._running_by_connection[connection]
+        self._async_dispatch()
+
+    @callback
+    def _async_dispatch(self) -> None:
+        """Start waiting commands while slots are available."""
+        while self._running < self._limit:
+            # Hand the slot to the user who was served the longest time ago
+            candidates = (
+                (self._turns.get(user_id, -1), user_id, entry)
+                for user_id, queue in self._waiting.items()
+                if (entry := self._async_next_runnable(queue)) is not None
+            )
+            if (candidate := min(candidates, default=None, key=_turn)) is None:
+                return
+
+            _, user_id, entry = candidate
+            queue = self._waiting[user_id]
+            queue.remove(entry)
+            if not queue:
+                del self._waiting[user_id]
+            self._turn += 1
+            self._turns[user_id] = self._turn
+
+            connection, future = entry
+            self._running += 1
+            self._running_by_connection[connection] = (
+                self._running_by_connection.get(connection, 0) + 1
+            )
+            future.set_result(None)
+
+    @callback
+    def _async_next_runnable(
+        self, queue: deque[tuple[ActiveConnection, asyncio.Future[None]]]
+    ) -> tuple[ActiveConnection, asyncio.Future[None]] | None:
+        """Return the first command of a queue within its connection limit."""
+        for entry in queue:
+            if self._running_by_connection.get(entry[0], 0) < self._connection_limit:
+                return entry
+        return None
+
+
+def _turn(candidate: tuple[int, str, Any]) -> int:
+    """Return the turn of a dispatch candidate."""
+    return candidate[0]
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> CommandScheduler:
+    """Return the command scheduler."""
+    scheduler: CommandScheduler | None = hass.data.get(DATA_COMMAND_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_COMMAND_SCHEDULER] = CommandScheduler(
+            MAX_CONCURRENT_LIMITED_COMMANDS, MAX_CONNECTION_LIMITED_COMMANDS
+        )
+    return scheduler
@@ -0,0 +1,186 @@
+"""Serialized snapshot of the state machine for new websocket subscribers."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Generic, TypeVar
+
+import msgpack
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.json import JSON_DUMP
+
+from .const import DATA_STATE_SNAPSHOT
+from .messages import msgpack_dumps
+
+_T = TypeVar("_T", str, bytes)
+
+
+def _state_fragment(state: State) -> str:
+    """Serialize a state for get_states."""
+    return JSON_DUMP(state)
+
+
+def _compressed_state_fragment(state: State) -> str:
+    """Serialize a state as a member of the subscribe_entities add event."""
+    return f"{JSON_DUMP(state.entity_id)}:{JSON_DUMP(state.as_compressed_state())}"
+
+
+def _state_msgpack_fragment(state: State) -> bytes:
+    """Serialize a state for get_states to MessagePack."""
+    return msgpack_dumps(state)
+
+
+def _compressed_state_msgpack_fragment(state: State) -> bytes:
+    """Serialize a state as a key and value of the subscribe_entities add event."""
+    return msgpack_dumps(state.entity_id) + msgpack_dumps(state.as_compressed_state())
+
+
+def _join_json(fragments: list[str]) -> str:
+    """Join JSON fragments, the caller adds the brackets."""
+    return ",".join(fragments)
+
+
+def _join_msgpack_array(fragments: list[bytes]) -> bytes:
+    """Join MessagePack fragments into an array."""
+    return msgpack.Packer().pack_array_header(len(fragments)) + b"".join(fragments)
+
+
+def _join_msgpack_map(fragments: list[bytes]) -> bytes:
+    """Join MessagePack key and value fragments into a map."""
+    return msgpack.Packer().pack_map_header(len(fragments)) + b"".join(fragments)
+
+
+class _Fragments(Generic[_T]):
+    """Serialized fragments of the states in one format."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        serialize: Callable[[State], _T],
+        join: Callable[[list[_T]], _T],
+    ) -> None:
+        """Initialize the fragments."""
+        self._hass = hass
+        self._serialize = serialize
+        self._join = join
+        self._fragments: dict[str, tuple[State, _T]] = {}
+        self._all: _T | None = None
+
+    @callback
+    def async_drop(self, entity_id: str) -> None:
+        """Drop the fragment of a changed state."""
+        self._fragments.pop(entity_id, None)
+        self._all = None
+
+    @callback
+    def async_get(self, states: Iterable[State] | None) -> _T | None:
+        """Return the joined fragments of states, defaults to all states.
+
+        Returns None if a state cannot be serialized.
+        """
+        if states is not None:
+            return self._async_join(states)
+        if self._all is None:
+            self._all = self._async_join(self._hass.states.async_all())
+        return self._all
+
+    @callback
+    def _async_join(self, states: Iterable[State]) -> _T | None:
+        """Join the fragments of states, return None if one cannot be serialized."""
+        fragments = self._fragments
+        joined: list[_T] = []
+        for state in states:
+            cached = fragments.get(state.entity_id)
+            if cached is None or cached[0] is not state:
+                try:
+                    cached = fragments[state.entity_id] = (
+                        state,
+                        self._serialize(state),
+                    )
+                except (ValueError, TypeError, OverflowError):
+                    return None
+            joined.append(cached[1])
+        return self._join(joined)
+
+
+class StateSnapshot:
+    """Keep the serialized states of the state machine.
+
+    Every state is serialized once per format and the fragment is reused
+    until the state changes, so new connections only join the cached
+    fragments. The joined snapshot of all states is kept until the next state
+    change for users which can read all entities.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot."""
+        self._states = _Fragments(hass, _state_fragment, _join_json)
+        self._compressed_states = _Fragments(
+            hass, _compressed_state_fragment, _join_json
+        )
+        self._states_msgpack = _Fragments(
+            hass, _state_msgpack_fragment, _join_msgpack_array
+        )
+        self._compressed_states_msgpack = _Fragments(
+            hass, _compressed_state_msgpack_fragment, _join_msgpack_map
+        )
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Drop the fragments of a changed state."""
+        entity_id: str = event.data["entity_id"]
+        self._states.async_drop(entity_id)
+        self._compressed_states.async_drop(entity_id)
+        self._states_msgpack.async_drop(entity_id)
+        self._compressed_states_msgpack.async_drop(entity_id)
+
+    @callback
+    def async_states_json(self, states: Iterable[State] | None = None) -> str | None:
+        """Return the JSON array members of the states, defaults to all states.
+
+        Returns None if a state cannot be serialized.
+        """
+        return self._states.async_get(states)
+
+    @callback
+    def async_compressed_states_json(
+        self, states: Iterable[State] | None = None
+    ) -> str | None:
+        """Return the JSON object members of the compressed states.
+
+        Defaults to all states. Returns None if a state cannot be serialized.
+        """
+        return self._compressed_states.async_get(states)
+
+    @callback
+    def async_states_msgpack(
+        self, states: Iterable[State] | None = None
+    ) -> bytes | None:
+        """Return the states as a MessagePack array, defaults to all states.
+
+        Returns None if a state cannot be serialized.
+        """
+        return self._states_msgpack.async_get(states)
+
+    @callback
+    def async_compressed_states_msgpack(
+        self, states: Iterable[State] | None = None
+    ) -> bytes | None:
+        """Return the compressed states as a MessagePack map by entity id.
+
+        Defaults to all states. Returns None if a state cannot be serialized.
+        """
+        return self._compressed_states_msgpack.async_get(states)
+
+
+@callback
+def async_get_snapshot(hass: HomeAssistant) -> StateSnapshot:
+    """Return the state snapshot."""
+    snapshot: StateSnapshot | None = hass.data.get(DATA_STATE_SNAPSHOT)
+    if snapshot is None:
+        snapshot = hass.data[DATA_STATE_SNAPSHOT] = StateSnapshot(hass)
+    return snapshot
@@ -0,0 +1,41 @@
+"""Provide info to system health."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+from .metrics import CommandLatency, async_get_metrics
+from .scheduler import async_get_scheduler
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    scheduler = async_get_scheduler(hass)
+    latencies = async_get_metrics(hass).latencies
+    handled = sum(latency.count for latency in latencies.values())
+    total = sum(latency.total for latency in latencies.values())
+    info: dict[str, Any] = {
+        "limited_commands_running": scheduler.running,
+        "limited_commands_waiting": scheduler.waiting,
+        "commands_handled": handled,
+        "mean_latency": f"{total / handled * 1000 if handled else 0:.1f} ms",
+    }
+    if latencies:
+        command, latency = max(latencies.items(), key=_max_latency)
+        info["slowest_command"] = f"{command} ({latency.max * 1000:.1f} ms)"
+    return info
+
+
+def _max_latency(item: tuple[str, CommandLatency]) -> float:
+    """Return the maximum latency of a command type."""
+    return item[1].max
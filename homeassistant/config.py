@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Hashable, Sequence
 from contextlib import suppress
+from copy import copy
+from datetime import date, datetime, time, timedelta
+from enum import Enum
 import logging
 import os
 from pathlib import Path
@@ -14,6 +17,7 @@ from typing import Any
 from urllib.parse import urlparse
 
 from awesomeversion import AwesomeVersion
+from lru import LRU  # pylint: disable=no-name-in-module
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
@@ -60,12 +64,16 @@ from .helpers import (
     issue_registry as ir,
 )
 from .helpers.entity_values import EntityValues
+from .helpers.storage import STORAGE_DIR
+from .helpers.template import Template
 from .helpers.typing import ConfigType
 from .loader import Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
 from .util.yaml import SECRET_YAML, Secrets, load_yaml
+from .util.yaml.cache import NODE_CACHE
+from .util.yaml.objects import NodeListClass
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -76,10 +84,25 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
+DATA_VALIDATED_CONFIG = "validated_config"
+VALIDATED_CONFIG_CACHE_SIZE = 4096
+_IMMUTABLE_CONFIG_TYPES = {
+    bool,
+    date,
+    datetime,
+    float,
+    int,
+    str,
+    time,
+    timedelta,
+    type(None),
+    re.Pattern,
+}
 
 AUTOMATION_CONFIG_PATH = "automations.yaml"
 SCRIPT_CONFIG_PATH = "scripts.yaml"
 SCENE_CONFIG_PATH = "scenes.yaml"
+YAML_NODE_CACHE_FILE = "core.yaml_node_cache"
 
 LOAD_EXCEPTIONS = (ImportError, FileNotFoundError)
 INTEGRATION_LOAD_EXCEPTIONS = (
@@ -402,9 +425,10 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     # Not using async_add_executor_job because this is an internal method.
     config = await hass.loop.run_in_executor(
         None,
-        load_yaml_config_file,
+        load_yaml_config_file_cached,
         hass.config.path(YAML_CONFIG_FILE),
         secrets,
+        hass.config.path(STORAGE_DIR, YAML_NODE_CACHE_FILE),
     )
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
@@ -436,6 +460,19 @@ def load_yaml_config_file(
     return conf_dict
 
 
+def load_yaml_config_file_cached(
+    config_path: str, secrets: Secrets | None, cache_path: str
+) -> dict[Any, Any]:
+    """Parse a YAML configuration file using the node cache stored at cache_path.
+
+    Unchanged files, including the included ones, are not parsed again.
+
+    This method needs to run in an executor.
+    """
+    with NODE_CACHE.activate(cache_path):
+        return load_yaml_config_file(config_path, secrets)
+
+
 def process_ha_config_upgrade(hass: HomeAssistant) -> None:
     """Upgrade configuration if necessary.
 
@@ -832,6 +869,158 @@ async def merge_packages_config(
     return config
 
 
+def _freeze_config(config: Any, location: bool) -> Hashable:
+    """Return a hashable copy of a raw config block."""
+    if isinstance(config, (str, dict, list)):
+        if isinstance(config, str):
+            frozen: Hashable = str(config)
+        elif isinstance(config, dict):
+            frozen = (
+                dict,
+                tuple(
+                    (_freeze_config(key, location), _freeze_config(value, location))
+                    for key, value in config.items()
+                ),
+            )
+        else:
+            frozen = (list, tuple(_freeze_config(value, location) for value in config))
+        # The YAML loader adds the file and line to the loaded objects
+        if location and hasattr(config, "__config_file__"):
+            return (frozen, config.__config_file__, config.__line__)
+        return frozen
+    # bool is part of the key as True == 1
+    if config is None or type(config) in (bool, int, float):
+        return (type(config), config)
+    raise TypeError(f"Unexpected config value {type(config)}")
+
+
+def config_key(config: Any, *, location: bool = True) -> Hashable | None:
+    """Return a key of a raw config block for the validation cache.
+
+    The file and line of the YAML nodes are part of the key, as validated
+    config keeps them for error messages. Pass location=False to get a key
+    which only depends on the values.
+
+    Returns None if the block contains values not loaded from YAML.
+    """
+    try:
+        return _freeze_config(config, location)
+    except TypeError:
+        return None
+
+
+def _copy_config(config: Any) -> Any:
+    """Copy the containers and templates of a validated config.
+
+    Immutable values are shared. Raises TypeError for any other value as it
+    could be changed by its consumer.
+    """
+    config_type = type(config)
+    if config_type in _IMMUTABLE_CONFIG_TYPES or isinstance(config, Enum):
+        return config
+    if config_type in (dict, OrderedDict):
+        copied: Any = config_type(
+            (_copy_config(key), _copy_config(value)) for key, value in config.items()
+        )
+    elif config_type in (list, NodeListClass, set, tuple):
+        copied = config_type(_copy_config(value) for value in config)
+    elif config_type is Template:
+        return copy(config)
+    elif isinstance(config, str):
+        return config
+    else:
+        raise TypeError(f"Unable to copy config value {config_type}")
+    # Keep the file and line references of the YAML loader
+    if hasattr(config, "__dict__"):
+        copied.__dict__.update(config.__dict__)
+    return copied
+
+
+@callback
+def _async_get_validated_config(hass: HomeAssistant) -> LRU:
+    """Return the cache of validated config blocks."""
+    validated: LRU | None = hass.data.get(DATA_VALIDATED_CONFIG)
+    if validated is None:
+        validated = hass.data[DATA_VALIDATED_CONFIG] = LRU(VALIDATED_CONFIG_CACHE_SIZE)
+    return validated
+
+
+@callback
+def _async_cache_validated(
+    hass: HomeAssistant, schema: Callable[[Any], Any], key: Hashable, validated: Any
+) -> None:
+    """Store a copy of a reusable validation result."""
+    try:
+        copied = _copy_config(validated)
+    except TypeError:
+        return
+    _async_get_validated_config(hass)[(id(schema), key)] = (schema, copied)
+
+
+@callback
+def _async_get_cached(
+    hass: HomeAssistant, schema: Callable[[Any], Any], key: Hashable | None
+) -> Any | None:
+    """Return a copy of a cached validation result or None."""
+    if key is None:
+        return None
+    cached = _async_get_validated_config(hass).get((id(schema), key))
+    if cached is None or cached[0] is not schema:
+        return None
+    return _copy_config(cached[1])
+
+
+@callback
+def async_validate_cached(
+    hass: HomeAssistant,
+    schema: Callable[[Any], Any],
+    config: Any,
+    key: Hashable | None = None,
+) -> Any:
+    """Validate a config block, reusing the result if the block did not change.
+
+    The key defaults to the config_key of the block. Invalid config and
+    results of validators which checked the file system or logged a warning
+    are not cached.
+    """
+    if key is None:
+        key = config_key(config)
+    if (cached := _async_get_cached(hass, schema, key)) is not None:
+        return cached
+    validated, reusable = cv.validate_reusable(schema, config)
+    if reusable and key is not None:
+        _async_cache_validated(hass, schema, key, validated)
+    return validated
+
+
+@callback
+def async_validate_component_cached(
+    hass: HomeAssistant,
+    domain: str,
+    schema: Callable[[ConfigType], ConfigType],
+    config: ConfigType,
+) -> ConfigType:
+    """Validate the full config with a CONFIG_SCHEMA, reusing unchanged results.
+
+    Only the config of the domain is used as key and cached, the config of
+    the other domains is passed through.
+    """
+    cache_key = config_key(
+        {key: config[key] for key in extract_domain_configs(config, domain)}
+    )
+    if (cached := _async_get_cached(hass, schema, cache_key)) is not None:
+        return {**config_without_domain(config, domain), **cached}
+    processed, reusable = cv.validate_reusable(schema, config)
+    if reusable and cache_key is not None:
+        _async_cache_validated(
+            hass,
+            schema,
+            cache_key,
+            {key: processed[key] for key in extract_domain_configs(processed, domain)},
+        )
+    return processed
+
+
 async def async_process_component_config(  # noqa: C901
     hass: HomeAssistant, config: ConfigType, integration: Integration
 ) -> ConfigType | None:
@@ -877,7 +1066,9 @@ async def async_process_component_config(  # noqa: C901
     # No custom config validator, proceed with schema validation
     if hasattr(component, "CONFIG_SCHEMA"):
         try:
-            return component.CONFIG_SCHEMA(config)  # type: ignore[no-any-return]
+            return async_validate_component_cached(
+                hass, domain, component.CONFIG_SCHEMA, config
+            )
         except vol.Invalid as ex:
             async_log_exception(ex, domain, config, hass, integration.documentation)
             return None
@@ -894,9 +1085,12 @@ async def async_process_component_config(  # noqa: C901
 
     platforms = []
     for p_name, p_config in config_per_platform(config, domain):
+        p_key = config_key(p_config)
         # Validate component specific platform schema
         try:
-            p_validated = component_platform_schema(p_config)
+            p_validated = async_validate_cached(
+                hass, component_platform_schema, p_config, p_key
+            )
         except vol.Invalid as ex:
             async_log_exception(ex, domain, p_config, hass, integration.documentation)
             continue
@@ -933,7 +1127,9 @@ async def async_process_component_config(  # noqa: C901
         # Validate platform specific schema
         if hasattr(platform, "PLATFORM_SCHEMA"):
             try:
-                p_validated = platform.PLATFORM_SCHEMA(p_config)
+                p_validated = async_validate_cached(
+                    hass, platform.PLATFORM_SCHEMA, p_config, p_key
+                )
             except vol.Invalid as ex:
                 async_log_exception(
                     ex,
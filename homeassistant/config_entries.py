@@ -3,13 +3,22 @@ from __future__ import annotations
 
 import asyncio
 from collections import ChainMap
-from collections.abc import Callable, Coroutine, Generator, Iterable, Mapping
+from collections.abc import (
+    AsyncGenerator,
+    Callable,
+    Coroutine,
+    Generator,
+    Iterable,
+    Mapping,
+)
+from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from copy import deepcopy
 from enum import Enum
 import functools
 import logging
 from random import randint
+import time
 from types import MappingProxyType, MethodType
 from typing import TYPE_CHECKING, Any, Optional, TypeVar, cast
 import weakref
@@ -34,6 +43,7 @@ from .helpers.event import (
     async_call_later,
 )
 from .helpers.frame import report
+from .helpers.startup_timeline import startup_span
 from .helpers.typing import UNDEFINED, ConfigType, DiscoveryInfoType, UndefinedType
 from .setup import DATA_SETUP_DONE, async_process_deps_reqs, async_setup_component
 from .util import uuid as uuid_util
@@ -171,6 +181,13 @@ DISABLED_USER = ConfigEntryDisabler.USER.value
 
 RELOAD_AFTER_UPDATE_DELAY = 30
 
+# Limit of config entries running async_setup_entry at the same time
+MAX_CONCURRENT_ENTRY_SETUPS = 32
+
+# During startup, config entries still setting up after this many seconds
+# continue in the background instead of holding up their integration
+ENTRY_SETUP_STARTUP_WAIT = 60
+
 # Deprecated: Connection classes
 # These aren't used anymore since 2021.6.0
 # Mainly here not to break custom integrations.
@@ -324,8 +341,13 @@ class ConfigEntry:
         *,
         integration: loader.Integration | None = None,
         tries: int = 0,
+        limit_concurrency: bool = False,
     ) -> None:
-        """Set up an entry."""
+        """Set up an entry.
+
+        With limit_concurrency, async_setup_entry waits for one of the
+        MAX_CONCURRENT_ENTRY_SETUPS setup slots.
+        """
         current_entry.set(self)
         if self.source == SOURCE_IGNORE or self.disabled_by:
             return
@@ -379,7 +401,15 @@ class ConfigEntry:
         error_reason = None
 
         try:
-            result = await component.async_setup_entry(hass, self)
+            async with hass.config_entries.async_setup_slot(self, limit_concurrency):
+                with startup_span(
+                    hass,
+                    "setup entry",
+                    "config_entry",
+                    f"{self.domain} ({self.title})",
+                    entry_id=self.entry_id,
+                ):
+                    result = await component.async_setup_entry(hass, self)
 
             if not isinstance(result, bool):
                 _LOGGER.error(
@@ -913,6 +943,11 @@ class ConfigEntries:
         self._store = storage.Store[dict[str, list[dict[str, Any]]]](
             hass, STORAGE_VERSION, STORAGE_KEY
         )
+        self._setup_semaphore = asyncio.Semaphore(MAX_CONCURRENT_ENTRY_SETUPS)
+        self._setup_slot_holders: set[asyncio.Task[Any]] = set()
+        self._background_setups: dict[asyncio.Task[None], ConfigEntry] = {}
+        # Total time spent in async_setup_entry by entry id
+        self.setup_times: dict[str, float] = {}
         EntityRegistryDisabledHandler(hass).async_setup()
 
     @callback
@@ -968,6 +1003,7 @@ class ConfigEntries:
         await entry.async_remove(self.hass)
 
         del self._entries[entry.entry_id]
+        self.setup_times.pop(entry.entry_id, None)
         self._domain_index[entry.domain].remove(entry.entry_id)
         if not self._domain_index[entry.domain]:
             del self._domain_index[entry.domain]
@@ -1010,8 +1046,120 @@ class ConfigEntries:
         self._async_dispatch(ConfigEntryChange.REMOVED, entry)
         return {"require_restart": not unload_success}
 
+    @asynccontextmanager
+    async def async_setup_slot(
+        self, entry: ConfigEntry, limit_concurrency: bool
+    ) -> AsyncGenerator[None, None]:
+        """Account the setup time of an entry, holding a setup slot if limited.
+
+        The slot belongs to the current task. Neither the tasks it creates nor
+        the setups it awaits hold it, a task only skips the limit for entries
+        it sets up itself while holding a slot.
+        """
+        task = asyncio.current_task()
+        assert task is not None
+        acquire = limit_concurrency and task not in self._setup_slot_holders
+        if acquire:
+            await self._setup_semaphore.acquire()
+            self._setup_slot_holders.add(task)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._async_add_setup_time(entry, time.monotonic() - start)
+            # The slot is not held if reacquiring it was cancelled
+            if acquire and task in self._setup_slot_holders:
+                self._setup_slot_holders.remove(task)
+                self._setup_semaphore.release()
+
+    @asynccontextmanager
+    async def async_release_setup_slot(self) -> AsyncGenerator[None, None]:
+        """Release the setup slot of the current task while it waits.
+
+        An entry waiting for the setup of another integration must not hold a
+        slot the entries of that integration may be waiting for.
+        """
+        task = asyncio.current_task()
+        if task not in self._setup_slot_holders:
+            yield
+            return
+
+        self._setup_slot_holders.remove(task)
+        self._setup_semaphore.release()
+        try:
+            yield
+        finally:
+            await self._setup_semaphore.acquire()
+            self._setup_slot_holders.add(task)
+
+    @callback
+    def _async_add_setup_time(self, entry: ConfigEntry, time_taken: float) -> None:
+        """Add time spent setting up an entry, including retries."""
+        self.setup_times[entry.entry_id] = (
+            self.setup_times.get(entry.entry_id, 0) + time_taken
+        )
+
+    async def async_setup_integration_entries(
+        self, integration: loader.Integration
+    ) -> None:
+        """Set up all config entries of an integration concurrently.
+
+        During startup, entries still setting up after ENTRY_SETUP_STARTUP_WAIT
+        seconds continue in the background, so a slow or offline device does
+        not hold up the integrations depending on this one and the start of
+        Home Assistant.
+        """
+        entries = self.async_entries(integration.domain)
+        if not entries:
+            return
+
+        if self.hass.state == CoreState.running:
+            await asyncio.gather(
+                *(
+                    entry.async_setup(
+                        self.hass, integration=integration, limit_concurrency=True
+                    )
+                    for entry in entries
+                )
+            )
+            return
+
+        tasks = {
+            self.hass.loop.create_task(
+                entry.async_setup(
+                    self.hass, integration=integration, limit_concurrency=True
+                )
+            ): entry
+            for entry in entries
+        }
+        # Keep a reference until done, the tasks may outlive this call
+        self._background_setups.update(tasks)
+        for task in tasks:
+            task.add_done_callback(self._background_setups.pop)
+        _, pending = await asyncio.wait(tasks, timeout=ENTRY_SETUP_STARTUP_WAIT)
+        for task in pending:
+            entry = tasks[task]
+            _LOGGER.warning(
+                (
+                    "Setup of config entry '%s' for %s integration is taking over %s"
+                    " seconds; Continuing in background"
+                ),
+                entry.title,
+                entry.domain,
+                ENTRY_SETUP_STARTUP_WAIT,
+            )
+
     async def _async_shutdown(self, event: Event) -> None:
         """Call when Home Assistant is stopping."""
+        if background_setups := dict(self._background_setups):
+            for task in background_setups:
+                task.cancel()
+            await asyncio.wait(background_setups)
+            # Don't leave entries whose setup was cancelled in progress
+            for entry in background_setups.values():
+                if entry.state is ConfigEntryState.SETUP_IN_PROGRESS:
+                    await entry._async_process_on_unload()
+                    entry.async_set_state(self.hass, ConfigEntryState.NOT_LOADED, None)
         await asyncio.gather(
             *(entry.async_shutdown() for entry in self._entries.values())
         )
@@ -166,6 +166,7 @@ def split_entity_id(entity_id: str) -> tuple[str, str]:
 VALID_ENTITY_ID = re.compile(r"^(?!.+__)(?!_)[\da-z_]+(?<!_)\.(?!_)[\da-z_]+(?<!_)$")
 
 
+@functools.lru_cache(MAX_EXPECTED_ENTITY_IDS)
 def valid_entity_id(entity_id: str) -> bool:
     """Test if an entity ID is a valid format.
 
@@ -1302,6 +1303,7 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        self._sorted_entity_ids: dict[str | None, list[str]] = {}
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1375,6 +1377,32 @@ class StateMachine:
             state for state in self._states.values() if state.domain in domain_filter
         ]
 
+    @callback
+    def async_all_sorted(self, domain_filter: str | None = None) -> list[State]:
+        """Create a list of all states matching the domain sorted by entity_id.
+
+        The sorted entity ids are kept per domain and only rebuilt when an
+        entity of that domain is added or removed.
+
+        This method must be run in the event loop.
+        """
+        if domain_filter is not None:
+            domain_filter = domain_filter.lower()
+
+        if (entity_ids := self._sorted_entity_ids.get(domain_filter)) is None:
+            entity_ids = self._sorted_entity_ids[domain_filter] = sorted(
+                self.async_entity_ids(domain_filter)
+            )
+
+        states = self._states
+        return [states[entity_id] for entity_id in entity_ids]
+
+    @callback
+    def _async_invalidate_sorted(self, domain: str) -> None:
+        """Invalidate the sorted views after an entity was added or removed."""
+        self._sorted_entity_ids.pop(None, None)
+        self._sorted_entity_ids.pop(domain, None)
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -1416,6 +1444,7 @@ class StateMachine:
         if old_state is None:
             return False
 
+        self._async_invalidate_sorted(old_state.domain)
         old_state.expire()
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
@@ -1520,7 +1549,9 @@ class StateMachine:
             context,
             old_state is None,
         )
-        if old_state is not None:
+        if old_state is None:
+            self._async_invalidate_sorted(state.domain)
+        else:
             old_state.expire()
         self._states[entity_id] = state
         self._bus.async_fire(
@@ -15,10 +15,14 @@ from homeassistant.config import (  # type: ignore[attr-defined]
     CONF_PACKAGES,
     CORE_CONFIG_SCHEMA,
     YAML_CONFIG_FILE,
+    YAML_NODE_CACHE_FILE,
     _format_config_error,
+    async_validate_cached,
+    async_validate_component_cached,
+    config_key,
     config_per_platform,
     extract_domain_configs,
-    load_yaml_config_file,
+    load_yaml_config_file_cached,
     merge_packages_config,
 )
 from homeassistant.core import HomeAssistant
@@ -30,6 +34,7 @@ from homeassistant.requirements import (
 )
 import homeassistant.util.yaml.loader as yaml_loader
 
+from .storage import STORAGE_DIR
 from .typing import ConfigType
 
 
@@ -97,9 +102,10 @@ async def async_check_ha_config_file(  # noqa: C901
         assert hass.config.config_dir is not None
 
         config = await hass.async_add_executor_job(
-            load_yaml_config_file,
+            load_yaml_config_file_cached,
             config_path,
             yaml_loader.Secrets(Path(hass.config.config_dir)),
+            hass.config.path(STORAGE_DIR, YAML_NODE_CACHE_FILE),
         )
     except FileNotFoundError:
         return result.add_error(f"File not found: {config_path}")
@@ -179,7 +185,9 @@ async def async_check_ha_config_file(  # noqa: C901
         config_schema = getattr(component, "CONFIG_SCHEMA", None)
         if config_schema is not None:
             try:
-                config = config_schema(config)
+                config = async_validate_component_cached(
+                    hass, domain, config_schema, config
+                )
                 result[domain] = config[domain]
             except vol.Invalid as ex:
                 _comp_error(ex, domain, config)
@@ -196,9 +204,12 @@ async def async_check_ha_config_file(  # noqa: C901
 
         platforms = []
         for p_name, p_config in config_per_platform(config, domain):
+            p_key = config_key(p_config)
             # Validate component specific platform schema
             try:
-                p_validated = component_platform_schema(p_config)
+                p_validated = async_validate_cached(
+                    hass, component_platform_schema, p_config, p_key
+                )
             except vol.Invalid as ex:
                 _comp_error(ex, domain, config)
                 continue
@@ -230,7 +241,9 @@ async def async_check_ha_config_file(  # noqa: C901
             platform_schema = getattr(platform, "PLATFORM_SCHEMA", None)
             if platform_schema is not None:
                 try:
-                    p_validated = platform_schema(p_validated)
+                    p_validated = async_validate_cached(
+                        hass, platform_schema, p_validated, p_key
+                    )
                 except vol.Invalid as ex:
                     _comp_error(ex, f"{domain}.{p_name}", p_validated)
                     continue
@@ -10,6 +10,7 @@ import functools as ft
 import logging
 import re
 import sys
+from time import perf_counter
 from typing import Any, cast
 
 from homeassistant.components import zone as zone_cmp
@@ -82,6 +83,21 @@ INPUT_ENTITY_ID = re.compile(
 
 ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool]
 
+# Relative cost of evaluating a condition, used to evaluate cheap conditions
+# first when the result of a condition group does not depend on the order.
+_CONDITION_COST_DEFAULT = 5
+_CONDITION_COST_TEMPLATE = 10
+_CONDITION_COSTS = {
+    "trigger": 1,
+    "state": 1,
+    "numeric_state": 2,
+    "time": 2,
+    "zone": 3,
+    "sun": 5,
+    "device": 5,
+    "template": _CONDITION_COST_TEMPLATE,
+}
+
 
 def condition_trace_append(variables: TemplateVarsType, path: str) -> TraceElement:
     """Append a TraceElement to trace[path]."""
@@ -125,6 +141,7 @@ def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement, None
     else:
         trace_element = condition_trace_append(variables, trace_path_get())
         trace_stack_push(trace_stack_cv, trace_element)
+    start = perf_counter()
     try:
         yield trace_element
     except Exception as ex:
@@ -132,6 +149,7 @@ def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement, None
         raise ex
     finally:
         if should_pop:
+            trace_element.set_duration(perf_counter() - start)
             trace_stack_pop(trace_stack_cv)
 
 
@@ -189,11 +207,51 @@ async def async_from_config(
     return cast(ConditionCheckerType, factory(config))
 
 
+def condition_cost(config: ConfigType) -> int:
+    """Return the relative cost of evaluating a condition config."""
+    if not isinstance(config, dict):
+        return _CONDITION_COST_DEFAULT
+
+    if not config.get(CONF_ENABLED, True):
+        return 0
+
+    condition = config.get(CONF_CONDITION)
+    if condition in ("and", "or", "not"):
+        return sum(condition_cost(entry) for entry in config["conditions"])
+
+    cost = _CONDITION_COSTS.get(condition, _CONDITION_COST_DEFAULT)
+    if condition == "numeric_state" and CONF_VALUE_TEMPLATE in config:
+        cost = _CONDITION_COST_TEMPLATE
+    if condition in ("state", "numeric_state", "zone"):
+        entity_ids = config.get(CONF_ENTITY_ID)
+        if isinstance(entity_ids, list) and entity_ids:
+            cost *= len(entity_ids)
+    return cost
+
+
+def conditions_by_cost(configs: list[ConfigType]) -> list[tuple[int, ConfigType]]:
+    """Return condition configs with their index, cheapest first.
+
+    Conditions of equal cost keep their configured order.
+    """
+    return sorted(enumerate(configs), key=lambda item: condition_cost(item[1]))
+
+
+async def _async_checks_by_cost(
+    hass: HomeAssistant, configs: list[ConfigType]
+) -> list[tuple[int, ConditionCheckerType]]:
+    """Create condition checkers with their config index, cheapest first."""
+    return [
+        (index, await async_from_config(hass, entry))
+        for index, entry in conditions_by_cost(configs)
+    ]
+
+
 async def async_and_from_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'AND'."""
-    checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    checks = await _async_checks_by_cost(hass, config["conditions"])
 
     @trace_condition_function
     def if_and_condition(
@@ -201,7 +259,7 @@ async def async_and_from_config(
     ) -> bool:
         """Test and condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index, check in checks:
             try:
                 with trace_path(["conditions", str(index)]):
                     if not check(hass, variables):
@@ -224,7 +282,7 @@ async def async_or_from_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'OR'."""
-    checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    checks = await _async_checks_by_cost(hass, config["conditions"])
 
     @trace_condition_function
     def if_or_condition(
@@ -232,7 +290,7 @@ async def async_or_from_config(
     ) -> bool:
         """Test or condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index, check in checks:
             try:
                 with trace_path(["conditions", str(index)]):
                     if check(hass, variables):
@@ -255,7 +313,7 @@ async def async_not_from_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'NOT'."""
-    checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    checks = await _async_checks_by_cost(hass, config["conditions"])
 
     @trace_condition_function
     def if_not_condition(
@@ -263,7 +321,7 @@ async def async_not_from_config(
     ) -> bool:
         """Test not condition."""
         errors = []
-        for index, check in enumerate(checks):
+        for index, check in checks:
             try:
                 with trace_path(["conditions", str(index)]):
                     if check(hass, variables):
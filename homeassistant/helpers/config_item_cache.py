@@ -0,0 +1,140 @@
+"""Helper to reuse validated configuration items between reloads."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+    ConfigEntryState,
+)
+from homeassistant.const import EVENT_COMPONENT_LOADED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.setup import ATTR_COMPONENT
+
+from .device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from .dispatcher import async_dispatcher_connect
+from .entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+from .json import json_dumps_sorted
+
+DATA_CONFIG_ITEM_CACHE = "config_item_cache"
+
+
+@callback
+def _device_registry_changed(event: Event) -> bool:
+    """Filter device registry events which can invalidate validated config."""
+    return event.data["action"] != "create"
+
+
+@callback
+def _entity_registry_changed(event: Event) -> bool:
+    """Filter entity registry events which can invalidate validated config."""
+    action = event.data["action"]
+    return action == "remove" or (
+        action == "update" and "entity_id" in event.data["changes"]
+    )
+
+
+class ConfigItemCache:
+    """Remember validated config items keyed by their raw config.
+
+    Only successful validations are stored, so invalid items are validated
+    and reported again on every reload. Validation of device automations and
+    of entity registry ids depends on the registries, so the cache is cleared
+    when a device is changed or removed or an entity is renamed or removed.
+    Validation also depends on the loaded integrations, so the cache is
+    cleared when a config entry is unloaded and the items of other domains
+    are dropped when a component is loaded.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._items: dict[str, dict[str, Any]] = {}
+        hass.bus.async_listen(
+            EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_clear,
+            event_filter=_device_registry_changed,
+        )
+        hass.bus.async_listen(
+            EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_clear,
+            event_filter=_entity_registry_changed,
+        )
+        hass.bus.async_listen(EVENT_COMPONENT_LOADED, self._async_component_loaded)
+        async_dispatcher_connect(
+            hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._async_config_entry_changed
+        )
+
+    @callback
+    def _async_clear(self, event: Event) -> None:
+        """Forget all validated items."""
+        self._items.clear()
+
+    @callback
+    def _async_component_loaded(self, event: Event) -> None:
+        """Forget the validated items of domains other than the loaded one.
+
+        The items of a domain are validated while it is set up, so they were
+        already validated with the integrations loaded before it.
+        """
+        domain = event.data[ATTR_COMPONENT]
+        self._items = {
+            item_domain: items
+            for item_domain, items in self._items.items()
+            if item_domain == domain
+        }
+
+    @callback
+    def _async_config_entry_changed(
+        self, change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        """Forget all validated items when a config entry is unloaded."""
+        if (
+            change == ConfigEntryChange.REMOVED
+            or entry.state is ConfigEntryState.NOT_LOADED
+        ):
+            self._items.clear()
+
+    @staticmethod
+    def _key(item_id: str | None, raw_config: Any) -> str | None:
+        """Return the cache key for a raw config item."""
+        try:
+            return json_dumps_sorted([item_id, raw_config])
+        except TypeError:
+            return None
+
+    @callback
+    def async_get(self, domain: str, item_id: str | None, raw_config: Any) -> Any:
+        """Return the validated item or None if it must be validated."""
+        if (key := self._key(item_id, raw_config)) is None:
+            return None
+        return self._items.get(domain, {}).get(key)
+
+    @callback
+    def async_set(
+        self, domain: str, item_id: str | None, raw_config: Any, validated: Any
+    ) -> None:
+        """Store a validated item."""
+        if (key := self._key(item_id, raw_config)) is None:
+            return
+        self._items.setdefault(domain, {})[key] = validated
+
+    @callback
+    def async_retain(self, domain: str, validated_items: list[Any]) -> None:
+        """Drop cached items of a domain that are no longer configured."""
+        if not (items := self._items.get(domain)):
+            return
+        retained = {id(item) for item in validated_items}
+        self._items[domain] = {
+            key: item for key, item in items.items() if id(item) in retained
+        }
+
+
+@callback
+def async_get(hass: HomeAssistant) -> ConfigItemCache:
+    """Return the config item cache."""
+    cache: ConfigItemCache | None = hass.data.get(DATA_CONFIG_ITEM_CACHE)
+    if cache is None:
+        cache = hass.data[DATA_CONFIG_ITEM_CACHE] = ConfigItemCache(hass)
+    return cache
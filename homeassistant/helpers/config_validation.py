@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Hashable
 import contextlib
+from contextvars import ContextVar, copy_context
 from datetime import (
     date as date_sys,
     datetime as datetime_sys,
@@ -117,6 +118,32 @@ port = vol.All(vol.Coerce(int), vol.Range(min=1, max=65535))
 # typing typevar
 _T = TypeVar("_T")
 
+# Cleared by validators whose result depends on more than the validated value,
+# such as the file system, or which have side effects, such as a logged
+# deprecation warning
+_validation_reusable: ContextVar[bool] = ContextVar("validation_reusable", default=True)
+
+
+def mark_validation_not_reusable() -> None:
+    """Mark the result of the running validation as not reusable."""
+    _validation_reusable.set(False)
+
+
+def _validate_tracked(schema: Callable[[Any], _T], value: Any) -> tuple[_T, bool]:
+    """Validate a value and return if the result is reusable."""
+    _validation_reusable.set(True)
+    validated = schema(value)
+    return validated, _validation_reusable.get()
+
+
+def validate_reusable(schema: Callable[[Any], _T], value: Any) -> tuple[_T, bool]:
+    """Validate a value and return if the result only depends on the value.
+
+    A reusable result can be returned again for an equal value without
+    running the schema.
+    """
+    return copy_context().run(_validate_tracked, schema, value)
+
 
 def path(value: Any) -> str:
     """Validate it's a safe path."""
@@ -195,6 +222,7 @@ def whitespace(value: Any) -> str:
 
 def isdevice(value: Any) -> str:
     """Validate that value is a real device."""
+    mark_validation_not_reusable()
     try:
         os.stat(value)
         return str(value)
@@ -236,6 +264,7 @@ def is_regex(value: Any) -> re.Pattern[Any]:
 
 def isfile(value: Any) -> str:
     """Validate that the value is an existing file."""
+    mark_validation_not_reusable()
     if value is None:
         raise vol.Invalid("None is not file")
     file_in = os.path.expanduser(str(value))
@@ -249,6 +278,7 @@ def isfile(value: Any) -> str:
 
 def isdir(value: Any) -> str:
     """Validate that the value is an existing dir."""
+    mark_validation_not_reusable()
     if value is None:
         raise vol.Invalid("not a directory")
     dir_in = os.path.expanduser(str(value))
@@ -284,6 +314,9 @@ def ensure_list(value: _T | None) -> list[_T] | list[Any]:
 
 def entity_id(value: Any) -> str:
     """Validate Entity ID."""
+    # Valid entity ids are lowercase already
+    if isinstance(value, str) and valid_entity_id(value):
+        return str(value)
     str_value = string(value).lower()
     if valid_entity_id(str_value):
         return str_value
@@ -828,6 +861,7 @@ def _deprecated_or_removed(
             if raise_if_present:
                 raise vol.Invalid(warning % arguments)
 
+            mark_validation_not_reusable()
             logger_func(warning, *arguments)
             value = config[key]
             if replacement_key:
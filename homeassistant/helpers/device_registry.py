@@ -20,10 +20,10 @@ from homeassistant.util.json import (
 )
 import homeassistant.util.uuid as uuid_util
 
-from . import storage
+from . import registry_snapshot, storage
 from .debounce import Debouncer
 from .frame import report
-from .json import JSON_DUMP
+from .json import JSON_DUMP, json_bytes, json_loads
 from .typing import UNDEFINED, UndefinedType
 
 if TYPE_CHECKING:
@@ -591,11 +591,34 @@ class DeviceRegistry:
         """Load the device registry."""
         async_setup_cleanup(self.hass, self)
 
-        data = await self._store.async_load()
-
         devices: DeviceRegistryItems[DeviceEntry] = DeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
+        if snapshot := registry_snapshot.async_register(
+            self.hass, self._store, self._snapshot_rows
+        ):
+            try:
+                snapshot_devices = registry_snapshot.from_rows(
+                    DeviceEntry,
+                    snapshot["devices"],
+                    {"disabled_by": DeviceEntryDisabler, "entry_type": DeviceEntryType},
+                )
+                snapshot_deleted_devices = registry_snapshot.from_rows(
+                    DeletedDeviceEntry, snapshot["deleted_devices"], {}
+                )
+            except (KeyError, TypeError, ValueError) as err:
+                _LOGGER.debug("Ignoring snapshot of the device registry: %s", err)
+            else:
+                for device in snapshot_devices:
+                    devices[device.id] = device
+                for deleted_device in snapshot_deleted_devices:
+                    deleted_devices[deleted_device.id] = deleted_device
+                self.devices = devices
+                self.deleted_devices = deleted_devices
+                return
+
+        data = await self._store.async_load()
+
         if data is not None:
             for device in data["devices"]:
                 devices[device["id"]] = DeviceEntry(
@@ -689,6 +712,24 @@ class DeviceRegistry:
 
         return data
 
+    @callback
+    def _snapshot_rows(self) -> dict[str, Any]:
+        """Return the devices as stored, as rows of the registry snapshot."""
+        data = json_loads(json_bytes(self._data_to_save()))
+        converters = {
+            "config_entries": set,
+            "connections": _set_of_tuples,
+            "identifiers": _set_of_tuples,
+        }
+        return {
+            "devices": registry_snapshot.to_rows(
+                DeviceEntry, data["devices"], converters
+            ),
+            "deleted_devices": registry_snapshot.to_rows(
+                DeletedDeviceEntry, data["deleted_devices"], converters
+            ),
+        }
+
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
@@ -917,3 +958,8 @@ def _normalize_connections(connections: set[tuple[str, str]]) -> set[tuple[str,
         (key, format_mac(value)) if key == CONNECTION_NETWORK_MAC else (key, value)
         for key, value in connections
     }
+
+
+def _set_of_tuples(items: list[list[str]]) -> set[tuple[str, ...]]:
+    """Convert a stored list of pairs back to a set of tuples."""
+    return {tuple(item) for item in items}
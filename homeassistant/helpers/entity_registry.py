@@ -47,10 +47,10 @@ from homeassistant.util.json import (
     format_unserializable_data,
 )
 
-from . import device_registry as dr, storage
+from . import device_registry as dr, registry_snapshot, storage
 from .device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from .frame import report
-from .json import JSON_DUMP
+from .json import JSON_DUMP, json_bytes, json_loads
 from .typing import UNDEFINED, UndefinedType
 
 if TYPE_CHECKING:
@@ -299,9 +299,10 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains three additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+    - config_entry_id -> entity_ids
     """
 
     def __init__(self) -> None:
@@ -309,6 +310,7 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._config_entry_id_index: dict[str, dict[str, None]] = {}
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -320,17 +322,33 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
             old_entry = self[key]
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
+            if old_entry.config_entry_id != entry.config_entry_id:
+                self._unindex_config_entry_id(old_entry)
         super().__setitem__(key, entry)
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        if entry.config_entry_id is not None:
+            self._config_entry_id_index.setdefault(entry.config_entry_id, {})[
+                key
+            ] = None
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        self._unindex_config_entry_id(entry)
         super().__delitem__(key)
 
+    def _unindex_config_entry_id(self, entry: RegistryEntry) -> None:
+        """Remove an entry from the config entry index."""
+        if entry.config_entry_id is None:
+            return
+        entity_ids = self._config_entry_id_index[entry.config_entry_id]
+        del entity_ids[entry.entity_id]
+        if not entity_ids:
+            del self._config_entry_id_index[entry.config_entry_id]
+
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
         return self._index.get(key)
@@ -339,6 +357,15 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for a config entry."""
+        return [
+            self.data[entity_id]
+            for entity_id in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -865,10 +892,32 @@ class EntityRegistry:
         """Load the entity registry."""
         async_setup_entity_restore(self.hass, self)
 
-        data = await self._store.async_load()
+        from .entity import EntityCategory  # pylint: disable=import-outside-toplevel
+
         entities = EntityRegistryItems()
 
-        from .entity import EntityCategory  # pylint: disable=import-outside-toplevel
+        if snapshot := registry_snapshot.async_register(
+            self.hass, self._store, self._snapshot_rows
+        ):
+            try:
+                snapshot_entries = registry_snapshot.from_rows(
+                    RegistryEntry,
+                    snapshot,
+                    {
+                        "disabled_by": RegistryEntryDisabler,
+                        "entity_category": EntityCategory,
+                        "hidden_by": RegistryEntryHider,
+                    },
+                )
+            except (TypeError, ValueError) as err:
+                _LOGGER.debug("Ignoring snapshot of the entity registry: %s", err)
+            else:
+                for entry in snapshot_entries:
+                    entities[entry.entity_id] = entry
+                self.entities = entities
+                return
+
+        data = await self._store.async_load()
 
         if data is not None:
             for entity in data["entities"]:
@@ -951,6 +1000,14 @@ class EntityRegistry:
 
         return data
 
+    @callback
+    def _snapshot_rows(self) -> Any:
+        """Return the entities as stored, as rows of the registry snapshot."""
+        data = json_loads(json_bytes(self._data_to_save()))
+        return registry_snapshot.to_rows(
+            RegistryEntry, data["entities"], {"aliases": set}
+        )
+
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
@@ -1021,11 +1078,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -40,7 +40,7 @@ from homeassistant.util.async_ import run_callback_threadsafe
 from .entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
-from .template import RenderInfo, Template, result_as_boolean
+from .template import RenderInfo, Template, async_get_render_cache, result_as_boolean
 from .typing import TemplateVarsType
 
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
@@ -819,10 +819,12 @@ class TrackTemplateResultInfo:
         track_templates: Sequence[TrackTemplate],
         action: Callable[[Event | None, list[TrackTemplateResult]], None],
         has_super_template: bool = False,
+        use_render_cache: bool = False,
     ) -> None:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
         self._job = HassJob(action)
+        self._render_cache = async_get_render_cache(hass) if use_render_cache else None
 
         for track_template_ in track_templates:
             track_template_.template.hass = hass
@@ -845,8 +847,8 @@ class TrackTemplateResultInfo:
         if super_template is not None:
             template = super_template.template
             variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict
+            self._info[template] = info = self._async_render_to_info(
+                template, variables, strict=strict
             )
 
             # If the super template did not render to True, don't update other templates
@@ -866,8 +868,8 @@ class TrackTemplateResultInfo:
                 continue
             template = track_template_.template
             variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict
+            self._info[template] = info = self._async_render_to_info(
+                template, variables, strict=strict
             )
 
             if info.exception:
@@ -893,6 +895,18 @@ class TrackTemplateResultInfo:
             block_render,
         )
 
+    @callback
+    def _async_render_to_info(
+        self,
+        template: Template,
+        variables: TemplateVarsType,
+        strict: bool = False,
+    ) -> RenderInfo:
+        """Render a template, sharing the result through the cache if enabled."""
+        if self._render_cache is None:
+            return template.async_render_to_info(variables, strict=strict)
+        return self._render_cache.async_render_to_info(template, variables, strict)
+
     @property
     def listeners(self) -> dict[str, bool | set[str]]:
         """State changes that will cause a re-render."""
@@ -990,8 +1004,8 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        self._info[template] = info = self._async_render_to_info(
+            template, track_template_.variables
         )
 
         try:
@@ -1155,6 +1169,7 @@ def async_track_template_result(
     raise_on_template_error: bool = False,
     strict: bool = False,
     has_super_template: bool = False,
+    use_render_cache: bool = False,
 ) -> TrackTemplateResultInfo:
     """Add a listener that fires when the result of a template changes.
 
@@ -1188,13 +1203,19 @@ def async_track_template_result(
     has_super_template
         When set to True, the first template will block rendering of other
         templates if it doesn't render as True.
+    use_render_cache
+        When set to True, renders are shared with other trackers rendering
+        the same template with the same variables until one of the entities
+        or domains the template depends on changes.
 
     Returns
     -------
     Info object used to unregister the listener, and refresh the template.
 
     """
-    tracker = TrackTemplateResultInfo(hass, track_templates, action, has_super_template)
+    tracker = TrackTemplateResultInfo(
+        hass, track_templates, action, has_super_template, use_render_cache
+    )
     tracker.async_setup(raise_on_template_error, strict=strict)
     return tracker
 
@@ -0,0 +1,206 @@
+"""Binary snapshot of the registries for a faster restart.
+
+The JSON stores remain the source of truth. The snapshot is written when Home
+Assistant closes, after the stores have been written, and a section of it is
+only used if the JSON file it was taken from did not change since.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Generator, Iterable, Mapping
+from contextlib import contextmanager
+from enum import Enum
+import gc
+import logging
+import marshal
+import os
+from typing import Any, TypeVar
+
+from atomicwrites import AtomicWriter
+import attr
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, __version__
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .storage import STORAGE_DIR, Store
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+DATA_REGISTRY_SNAPSHOT = "registry_snapshot"
+
+SNAPSHOT_FILE = "core.registry_snapshot"
+SNAPSHOT_VERSION = 1
+
+
+@contextmanager
+def _gc_paused() -> Generator[None, None, None]:
+    """Pause the garbage collector while creating many long-lived objects.
+
+    Otherwise every few hundred allocations trigger a collection which has to
+    traverse all objects created so far.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class RegistrySnapshot:
+    """Keep the rows of the registries in a single marshal file."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot."""
+        self.hass = hass
+        self.path = hass.config.path(STORAGE_DIR, SNAPSHOT_FILE)
+        self._sections: dict[str, Any] = {}
+        self._dumpers: dict[str, tuple[Store, Callable[[], Any]]] = {}
+
+    async def async_load(self) -> None:
+        """Load the sections of the snapshot which are still valid."""
+        self._sections = await self.hass.async_add_executor_job(self._load)
+        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_write)
+
+    def _load(self) -> dict[str, Any]:
+        """Read the snapshot and drop sections of changed stores."""
+        try:
+            with open(self.path, "rb") as snapshot_file:
+                content = snapshot_file.read()
+            with _gc_paused():
+                data: Any = marshal.loads(content)
+        except FileNotFoundError:
+            return {}
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.debug("Ignoring invalid registry snapshot %s: %s", self.path, err)
+            return {}
+
+        if not (
+            isinstance(data, tuple)
+            and len(data) == 3
+            and data[:2] == (SNAPSHOT_VERSION, __version__)
+        ):
+            return {}
+
+        sections: dict[str, Any] = {}
+        for key, (path, mtime, size, payload) in data[2].items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if (stat.st_mtime_ns, stat.st_size) == (mtime, size):
+                sections[key] = payload
+        return sections
+
+    @callback
+    def async_register(self, store: Store, dump: Callable[[], Any]) -> Any | None:
+        """Register the dump function of a store and pop its loaded section.
+
+        Returns None if the snapshot has no valid section for the store.
+        """
+        self._dumpers[store.key] = (store, dump)
+        return self._sections.pop(store.key, None)
+
+    async def _async_write(self, event: Event) -> None:
+        """Write the snapshot, the stores have been written at this point."""
+        sections = {
+            key: (store.path, dump()) for key, (store, dump) in self._dumpers.items()
+        }
+        await self.hass.async_add_executor_job(self._write, sections)
+
+    def _write(self, sections: dict[str, tuple[str, Any]]) -> None:
+        """Write the sections along with the state of their JSON files."""
+        data: dict[str, tuple[str, int, int, Any]] = {}
+        for key, (path, payload) in sections.items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            data[key] = (path, stat.st_mtime_ns, stat.st_size, payload)
+        if not data:
+            return
+
+        try:
+            with AtomicWriter(self.path, mode="wb", overwrite=True).open() as fdesc:
+                marshal.dump((SNAPSHOT_VERSION, __version__, data), fdesc)
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Unable to write registry snapshot %s: %s", self.path, err)
+
+
+async def async_load(hass: HomeAssistant) -> None:
+    """Load the registry snapshot, registries loaded afterwards will use it."""
+    assert DATA_REGISTRY_SNAPSHOT not in hass.data
+    snapshot = hass.data[DATA_REGISTRY_SNAPSHOT] = RegistrySnapshot(hass)
+    await snapshot.async_load()
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, store: Store, dump: Callable[[], Any]
+) -> Any | None:
+    """Register a store with the snapshot and return its loaded section.
+
+    Returns None if the snapshot is not used or has no valid section.
+    """
+    snapshot: RegistrySnapshot | None = hass.data.get(DATA_REGISTRY_SNAPSHOT)
+    if snapshot is None:
+        return None
+    return snapshot.async_register(store, dump)
+
+
+def _init_fields(cls: type) -> tuple[str, ...]:
+    """Return the names of the init arguments of an attrs class."""
+    return tuple(field.name for field in attr.fields(cls) if field.init)
+
+
+def to_rows(
+    cls: type,
+    items: Iterable[Mapping[str, Any]],
+    converters: Mapping[str, Callable[[Any], Any]],
+) -> tuple[tuple[str, ...], list[tuple[Any, ...]]]:
+    """Turn the stored data of attrs objects into rows of init arguments.
+
+    Arguments missing in the stored data get their default.
+    """
+    fields = attr.fields_dict(cls)
+    names = _init_fields(cls)
+    defaults = {
+        name: fields[name].default
+        for name in names
+        if not isinstance(fields[name].default, attr.Factory)
+    }
+    rows = []
+    for item in items:
+        row = []
+        for name in names:
+            value = item[name] if name in item else defaults[name]
+            if name in converters:
+                value = converters[name](value)
+            row.append(value)
+        rows.append(tuple(row))
+    return names, rows
+
+
+def from_rows(
+    cls: type[_T],
+    table: tuple[tuple[str, ...], list[tuple[Any, ...]]],
+    enums: Mapping[str, type[Enum]],
+) -> list[_T]:
+    """Construct attrs objects from rows of init arguments.
+
+    Raises ValueError if the rows were made for different init arguments.
+    """
+    names, rows = table
+    if tuple(names) != _init_fields(cls):
+        raise ValueError(f"Snapshot of {cls.__name__} has different fields")
+    enum_indexes = [(names.index(name), enum) for name, enum in enums.items()]
+    objects = []
+    with _gc_paused():
+        for row in rows:
+            for index, enum in enum_indexes:
+                if row[index] is not None:
+                    row = (*row[:index], enum(row[index]), *row[index + 1 :])
+            objects.append(cls(*row))
+    return objects
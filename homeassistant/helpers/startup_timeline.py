@@ -0,0 +1,113 @@
+"""Record a timeline of the startup phases."""
+from __future__ import annotations
+
+from collections.abc import Generator
+from contextlib import contextmanager, nullcontext
+import time
+from typing import Any, ContextManager
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.file import write_utf8_file
+
+from .json import json_dumps
+
+DATA_STARTUP_TIMELINE = "startup_timeline"
+
+# The lane of the spans of the bootstrap sequence itself
+LANE_BOOTSTRAP = "bootstrap"
+
+# Integrations can keep setting up config entries long after startup
+MAX_SPANS = 20000
+
+
+class StartupTimeline:
+    """Record spans of the startup phases.
+
+    Spans are grouped in lanes, which are shown as threads when the timeline
+    is exported as Chrome trace events. Spans can be recorded from the event
+    loop and from executor threads.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self._origin = time.monotonic()
+        self._spans: list[tuple[str, str, str, float, float, dict[str, Any]]] = []
+        self.recording = True
+
+    @contextmanager
+    def span(
+        self, name: str, category: str, lane: str, args: dict[str, Any]
+    ) -> Generator[None, None, None]:
+        """Record the time spent in the context as a span."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            if self.recording and len(self._spans) < MAX_SPANS:
+                self._spans.append(
+                    (name, category, lane, start, time.monotonic(), args)
+                )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop recording spans."""
+        self.recording = False
+
+    def as_trace_events(self) -> dict[str, Any]:
+        """Return the timeline in the Chrome trace event format."""
+        lanes: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        for name, category, lane, start, end, args in self._spans:
+            if (tid := lanes.get(lane)) is None:
+                tid = lanes[lane] = len(lanes) + 1
+            event: dict[str, Any] = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((start - self._origin) * 1_000_000),
+                "dur": round((end - start) * 1_000_000),
+                "pid": 1,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        for lane, tid in lanes.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": lane},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> None:
+        """Write the timeline as a Chrome trace event file."""
+        write_utf8_file(path, json_dumps(self.as_trace_events()))
+
+
+@callback
+def async_start_timeline(hass: HomeAssistant) -> StartupTimeline:
+    """Start recording the startup timeline."""
+    timeline = hass.data[DATA_STARTUP_TIMELINE] = StartupTimeline()
+    return timeline
+
+
+def startup_span(
+    hass: HomeAssistant,
+    name: str,
+    category: str,
+    lane: str = LANE_BOOTSTRAP,
+    **args: Any,
+) -> ContextManager[None]:
+    """Return a context manager recording a span of the startup timeline.
+
+    Does nothing unless the timeline is recording.
+    """
+    timeline: StartupTimeline | None = hass.data.get(DATA_STARTUP_TIMELINE)
+    if timeline is None or not timeline.recording:
+        return nullcontext()
+    return timeline.span(name, category, lane, args)
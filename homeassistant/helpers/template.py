@@ -13,7 +13,6 @@ from functools import cache, lru_cache, partial, wraps
 import json
 import logging
 import math
-from operator import attrgetter
 import random
 import re
 import statistics
@@ -26,9 +25,11 @@ import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import nodes, pass_context, pass_environment, pass_eval_context
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
+from lru import LRU  # pylint: disable=no-name-in-module
+import orjson
 from typing_extensions import Concatenate, ParamSpec
 import voluptuous as vol
 
@@ -38,11 +39,13 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     STATE_UNKNOWN,
     UnitOfLength,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -72,6 +75,9 @@ _SENTINEL = object()
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 _RENDER_INFO = "template.render_info"
+_RENDER_CACHE = "template.render_cache"
+_TEMPLATE_STATES = "template.template_states"
+_TEMPLATE_STATES_NO_COLLECT = "template.template_states_no_collect"
 _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
@@ -107,8 +113,8 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "template_cv", default=None
 )
 
-CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+RENDER_CACHE_SIZE = 256
 
 
 @bind_hass
@@ -296,6 +302,18 @@ class RenderInfo:
             raise self.exception
         return cast(str, self._result)
 
+    def _copy(self, template: Template) -> RenderInfo:
+        """Return a copy of the frozen info for another template object."""
+        info = RenderInfo(template)
+        for name, value in self.__dict__.items():
+            if name == "template":
+                continue
+            # Rebind the filters which are methods of this info
+            if getattr(value, "__self__", None) is self:
+                value = getattr(info, value.__name__)
+            setattr(info, name, value)
+        return info
+
     def _freeze_static(self) -> None:
         self.is_static = True
         self._freeze_sets()
@@ -335,6 +353,233 @@ class RenderInfo:
             self.filter = _false
 
 
+# Globals, filters and tests whose results only depend on their arguments or
+# on states recorded in the RenderInfo. Renders of templates using anything
+# else, like registry lookups or random, are not shared.
+_TRACKED_GLOBALS = frozenset(
+    {
+        "acos",
+        "as_datetime",
+        "as_local",
+        "as_timedelta",
+        "as_timestamp",
+        "asin",
+        "atan",
+        "atan2",
+        "average",
+        "bool",
+        "cos",
+        "cycler",
+        "dict",
+        "e",
+        "expand",
+        "float",
+        "iif",
+        "int",
+        "is_number",
+        "is_state",
+        "is_state_attr",
+        "joiner",
+        "log",
+        "max",
+        "min",
+        "namespace",
+        "pack",
+        "pi",
+        "range",
+        "sin",
+        "slugify",
+        "sqrt",
+        "state_attr",
+        "states",
+        "strptime",
+        "tan",
+        "tau",
+        "timedelta",
+        "unpack",
+        "urlencode",
+        "version",
+    }
+)
+_TRACKED_FILTERS = (frozenset(jinja2.filters.FILTERS) - {"random"}) | {
+    "acos",
+    "as_datetime",
+    "as_local",
+    "as_timedelta",
+    "as_timestamp",
+    "asin",
+    "atan",
+    "atan2",
+    "average",
+    "base64_decode",
+    "base64_encode",
+    "bitwise_and",
+    "bitwise_or",
+    "bool",
+    "cos",
+    "expand",
+    "float",
+    "from_json",
+    "iif",
+    "int",
+    "is_defined",
+    "is_number",
+    "log",
+    "multiply",
+    "ord",
+    "ordinal",
+    "pack",
+    "regex_findall",
+    "regex_findall_index",
+    "regex_match",
+    "regex_replace",
+    "regex_search",
+    "round",
+    "sin",
+    "slugify",
+    "sqrt",
+    "state_attr",
+    "states",
+    "tan",
+    "timestamp_custom",
+    "timestamp_local",
+    "timestamp_utc",
+    "to_json",
+    "unpack",
+    "version",
+}
+_TRACKED_TESTS = frozenset(jinja2.tests.TESTS) | {
+    "is_number",
+    "is_state",
+    "is_state_attr",
+    "match",
+    "search",
+}
+
+
+def _is_render_tracked(template: Template) -> bool:
+    """Return if everything a render depends on is recorded in its RenderInfo."""
+    env = template._env  # pylint: disable=protected-access
+    try:
+        ast = env.parse(template.template)
+    except jinja2.TemplateSyntaxError:
+        return False
+    for node in ast.find_all((nodes.Name, nodes.Filter, nodes.Test)):
+        if isinstance(node, nodes.Name):
+            # Names which are not globals are variables, part of the cache key
+            if node.name in env.globals and node.name not in _TRACKED_GLOBALS:
+                return False
+        elif isinstance(node, nodes.Filter):
+            if node.name not in _TRACKED_FILTERS:
+                return False
+        elif node.name not in _TRACKED_TESTS:
+            return False
+    return True
+
+
+class TemplateRenderCache:
+    """Share render results of identical templates.
+
+    Entries are keyed by the template string, the variables and the strict
+    flag. Each entry remembers the version of every entity and domain
+    recorded in its RenderInfo, and is only reused while none of them
+    have changed. Only renders of templates which depend on nothing but
+    their variables and the recorded states are cached.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the render cache."""
+        self.hass = hass
+        self.hits = 0
+        self.misses = 0
+        self._entries: LRU = LRU(RENDER_CACHE_SIZE)
+        self._tracked: LRU = LRU(RENDER_CACHE_SIZE)
+        self._entity_versions: dict[str, int] = {}
+        self._domain_versions: dict[str, int] = {}
+        self._all_states_version = 0
+        # Must run immediately so versions are bumped before any
+        # scheduled state change listener re-renders a template.
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Bump the versions of the changed entity and its domain."""
+        entity_id: str = event.data["entity_id"]
+        domain = split_entity_id(entity_id)[0]
+        entity_versions = self._entity_versions
+        domain_versions = self._domain_versions
+        entity_versions[entity_id] = entity_versions.get(entity_id, 0) + 1
+        domain_versions[domain] = domain_versions.get(domain, 0) + 1
+        self._all_states_version += 1
+
+    def _dependency_versions(self, info: RenderInfo) -> tuple[Any, ...]:
+        """Return the current versions of everything info depends on."""
+        entity_versions = self._entity_versions
+        domain_versions = self._domain_versions
+        return (
+            self._all_states_version if info.all_states else None,
+            tuple(entity_versions.get(entity_id, 0) for entity_id in info.entities),
+            tuple(domain_versions.get(domain, 0) for domain in info.domains),
+            tuple(domain_versions.get(domain, 0) for domain in info.domains_lifecycle),
+        )
+
+    @callback
+    def async_render_to_info(
+        self,
+        template: Template,
+        variables: TemplateVarsType = None,
+        strict: bool = False,
+    ) -> RenderInfo:
+        """Render the template to info, reusing a previous render if possible."""
+        if template.is_static or not self._is_tracked(template):
+            return template.async_render_to_info(variables, strict=strict)
+
+        try:
+            frozen_variables = (
+                None
+                if variables is None
+                else orjson.dumps(variables, option=orjson.OPT_SORT_KEYS)
+            )
+        except TypeError:
+            # Variables that can't be serialized can't be compared either
+            return template.async_render_to_info(variables, strict=strict)
+
+        key = (template.template, strict, frozen_variables)
+        if (entry := self._entries.get(key)) is not None:
+            info, versions = entry
+            if versions == self._dependency_versions(info):
+                self.hits += 1
+                return info._copy(template)  # pylint: disable=protected-access
+
+        self.misses += 1
+        info = template.async_render_to_info(variables, strict=strict)
+        if info.exception is None and not info.has_time:
+            self._entries[key] = (
+                info._copy(template),  # pylint: disable=protected-access
+                self._dependency_versions(info),
+            )
+        else:
+            self._entries.pop(key, None)
+        return info
+
+    def _is_tracked(self, template: Template) -> bool:
+        """Return if renders of a template can be cached, by template string."""
+        if (tracked := self._tracked.get(template.template)) is None:
+            tracked = self._tracked[template.template] = _is_render_tracked(template)
+        return cast(bool, tracked)
+
+
+@callback
+def async_get_render_cache(hass: HomeAssistant) -> TemplateRenderCache:
+    """Return the shared template render cache."""
+    cache: TemplateRenderCache | None = hass.data.get(_RENDER_CACHE)
+    if cache is None:
+        cache = hass.data[_RENDER_CACHE] = TemplateRenderCache(hass)
+    return cache
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -928,17 +1173,53 @@ def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
         entity_collect.entities.add(entity_id)
 
 
-@lru_cache(maxsize=CACHED_TEMPLATE_STATES)
-def _template_state_no_collect(hass: HomeAssistant, state: State) -> TemplateState:
-    return TemplateState(hass, state, collect=False)
+@callback
+def _async_template_states(
+    hass: HomeAssistant, collect: bool
+) -> dict[str, TemplateState]:
+    """Return the per entity template state wrappers.
+
+    A wrapper is reused as long as the state it wraps is the current state
+    of the entity, so iterating large domains does not allocate a new
+    wrapper for every state on every render.
+    """
+    key = _TEMPLATE_STATES if collect else _TEMPLATE_STATES_NO_COLLECT
+    if (wrappers := hass.data.get(key)) is not None:
+        return wrappers
+
+    wrappers = hass.data[key] = {}
+
+    @callback
+    def _async_remove_wrapper(event: Event) -> None:
+        wrappers.pop(event.data["entity_id"], None)
+
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        _async_remove_wrapper,
+        event_filter=_event_is_state_removed,
+        run_immediately=True,
+    )
+    return wrappers
+
+
+@callback
+def _event_is_state_removed(event: Event) -> bool:
+    """Filter state changed events to removals."""
+    return event.data["new_state"] is None
 
 
 def _state_generator(
     hass: HomeAssistant, domain: str | None
 ) -> Generator[TemplateState, None, None]:
     """State generator for a domain or all states."""
-    for state in sorted(hass.states.async_all(domain), key=attrgetter("entity_id")):
-        yield _template_state_no_collect(hass, state)
+    wrappers = _async_template_states(hass, False)
+    for state in hass.states.async_all_sorted(domain):
+        wrapper = wrappers.get(state.entity_id)
+        if wrapper is None or wrapper._state is not state:
+            wrapper = wrappers[state.entity_id] = TemplateState(
+                hass, state, collect=False
+            )
+        yield wrapper
 
 
 def _get_state_if_valid(hass: HomeAssistant, entity_id: str) -> TemplateState | None:
@@ -952,9 +1233,12 @@ def _get_state(hass: HomeAssistant, entity_id: str) -> TemplateState | None:
     return _get_template_state_from_state(hass, entity_id, hass.states.get(entity_id))
 
 
-@lru_cache(maxsize=CACHED_TEMPLATE_STATES)
 def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
-    return TemplateState(hass, state)
+    wrappers = _async_template_states(hass, True)
+    wrapper = wrappers.get(state.entity_id)
+    if wrapper is None or wrapper._state is not state:
+        wrapper = wrappers[state.entity_id] = TemplateState(hass, state)
+    return wrapper
 
 
 def _get_template_state_from_state(
@@ -20,6 +20,7 @@ class TraceElement:
         """Container for trace data."""
         self._child_key: str | None = None
         self._child_run_id: str | None = None
+        self._duration: float | None = None
         self._error: Exception | None = None
         self.path: str = path
         self._result: dict[str, Any] | None = None
@@ -46,6 +47,10 @@ class TraceElement:
         self._child_key = child_key
         self._child_run_id = child_run_id
 
+    def set_duration(self, duration: float) -> None:
+        """Set how long the traced step took in seconds."""
+        self._duration = duration
+
     def set_error(self, ex: Exception) -> None:
         """Set error."""
         self._error = ex
@@ -69,6 +74,8 @@ class TraceElement:
                 "item_id": item_id,
                 "run_id": str(self._child_run_id),
             }
+        if self._duration is not None:
+            result["duration"] = self._duration
         if self._variables:
             result["changed_variables"] = self._variables
         if self._error is not None:
@@ -13,6 +13,7 @@ import functools as ft
 import importlib
 import logging
 import pathlib
+import stat
 import sys
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, TypeVar, cast
@@ -24,6 +25,7 @@ from awesomeversion import (
 )
 
 from . import generated
+from .const import __version__ as HA_VERSION
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -44,6 +46,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_CACHE = "manifest_cache"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -59,6 +62,13 @@ MAX_LOAD_CONCURRENTLY = 4
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+MANIFEST_CACHE_STORAGE_KEY = "core.manifest_cache"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 60
+
+# Manifest path -> (mtime in ns, size, parsed manifest)
+_ManifestCacheEntry = tuple[int, int, "Manifest"]
+
 
 class DHCPMatcherRequired(TypedDict, total=True):
     """Matcher for the dhcp integration for required fields."""
@@ -190,11 +200,9 @@ async def _async_get_custom_components(
         get_sub_directories, custom_components.__path__
     )
 
-    integrations = await hass.async_add_executor_job(
-        _resolve_integrations_from_root,
-        hass,
-        custom_components,
-        [comp.name for comp in dirs],
+    manifest_cache = await _async_get_manifest_cache(hass)
+    integrations = await manifest_cache.async_resolve_from_root(
+        custom_components, [comp.name for comp in dirs]
     )
     return {
         integration.domain: integration
@@ -463,23 +471,53 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        manifest_cache: dict[str, _ManifestCacheEntry] | None = None,
+        parsed_manifests: dict[str, _ManifestCacheEntry] | None = None,
     ) -> Integration | None:
-        """Resolve an integration from a root module."""
+        """Resolve an integration from a root module.
+
+        Manifests found in manifest_cache with the same modification time and
+        size are not read again, manifests which had to be parsed are added to
+        parsed_manifests.
+        """
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = json_loads(manifest_path.read_text())
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
+                manifest_stat = manifest_path.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(manifest_stat.st_mode):
                 continue
 
+            path_key = str(manifest_path)
+            cached = manifest_cache.get(path_key) if manifest_cache else None
+            if (
+                cached is not None
+                and cached[0] == manifest_stat.st_mtime_ns
+                and cached[1] == manifest_stat.st_size
+            ):
+                # Integration adds keys to the manifest
+                manifest = cast(Manifest, dict(cached[2]))
+            else:
+                try:
+                    manifest = json_loads(manifest_path.read_text())
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+                if parsed_manifests is not None:
+                    parsed_manifests[path_key] = (
+                        manifest_stat.st_mtime_ns,
+                        manifest_stat.st_size,
+                        cast(Manifest, dict(manifest)),
+                    )
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
@@ -740,8 +778,32 @@ class Integration:
         if full_name in cache:
             return cache[full_name]
 
+        cache[full_name] = self._load_platform(platform_name)
+        return cache[full_name]
+
+    async def async_get_platform(self, platform_name: str) -> ModuleType:
+        """Return a platform for an integration, importing it in the executor.
+
+        Platforms which are not imported yet are imported in the executor, so
+        importing a platform and its libraries does not block the event loop.
+        """
+        cache: dict[str, ModuleType] = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        full_name = f"{self.domain}.{platform_name}"
+        if full_name in cache:
+            return cache[full_name]
+        if f"{self.pkg_path}.{platform_name}" in sys.modules:
+            return self.get_platform(platform_name)
+
+        # Only import in the executor, the cache is populated in the event loop
+        platform = await self.hass.async_add_executor_job(
+            self._load_platform, platform_name
+        )
+        return cache.setdefault(full_name, platform)
+
+    def _load_platform(self, platform_name: str) -> ModuleType:
+        """Import a platform, raising ImportError for any exception."""
         try:
-            cache[full_name] = self._import_platform(platform_name)
+            return self._import_platform(platform_name)
         except ImportError:
             raise
         except Exception as err:
@@ -754,7 +816,17 @@ class Integration:
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
 
-        return cache[full_name]
+    def preload(self, platform_names: Iterable[str]) -> None:
+        """Import the component and the given platforms it provides.
+
+        Runs in the executor before the integration is set up, so the imports
+        in get_component and get_platform find the modules in sys.modules.
+        """
+        importlib.import_module(self.pkg_path)
+        available = {path.stem for path in self.file_path.iterdir()}
+        for platform_name in platform_names:
+            if platform_name in available:
+                self._import_platform(platform_name)
 
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
@@ -766,13 +838,19 @@ class Integration:
 
 
 def _resolve_integrations_from_root(
-    hass: HomeAssistant, root_module: ModuleType, domains: list[str]
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    domains: list[str],
+    manifest_cache: dict[str, _ManifestCacheEntry] | None = None,
+    parsed_manifests: dict[str, _ManifestCacheEntry] | None = None,
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
     for domain in domains:
         try:
-            integration = Integration.resolve_from_root(hass, root_module, domain)
+            integration = Integration.resolve_from_root(
+                hass, root_module, domain, manifest_cache, parsed_manifests
+            )
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Error loading integration: %s", domain)
         else:
@@ -842,8 +920,9 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
-        integrations = await hass.async_add_executor_job(
-            _resolve_integrations_from_root, hass, components, list(needed)
+        manifest_cache = await _async_get_manifest_cache(hass)
+        integrations = await manifest_cache.async_resolve_from_root(
+            components, list(needed)
         )
         for domain, event in needed.items():
             int_or_exc = integrations.get(domain)
@@ -862,6 +941,75 @@ async def async_get_integrations(
     return results
 
 
+class _ManifestCache:
+    """Parsed manifests kept in storage between runs.
+
+    Warm starts only stat the manifest files, the manifests are parsed again
+    when their modification time or size changed or Home Assistant was
+    updated. Dependencies and discovery matchers are derived from the
+    manifests in memory, so they do not need to be stored.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest cache."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self._hass = hass
+        self._store = Store[dict[str, Any]](
+            hass, MANIFEST_CACHE_STORAGE_VERSION, MANIFEST_CACHE_STORAGE_KEY
+        )
+        self._manifests: dict[str, _ManifestCacheEntry] | None = None
+
+    async def async_load(self) -> None:
+        """Load the stored manifests."""
+        if self._manifests is not None:
+            return
+        data = await self._store.async_load()
+        if self._manifests is not None:
+            return
+        self._manifests = {}
+        if not data or data.get("ha_version") != HA_VERSION:
+            return
+        for path, entry in data["manifests"].items():
+            try:
+                mtime_ns, size, manifest = entry
+            except (TypeError, ValueError):
+                continue
+            self._manifests[path] = (mtime_ns, size, manifest)
+
+    async def async_resolve_from_root(
+        self, root_module: ModuleType, domains: list[str]
+    ) -> dict[str, Integration]:
+        """Resolve integrations from root using the stored manifests."""
+        manifests = self._manifests
+        parsed: dict[str, _ManifestCacheEntry] = {}
+        integrations = await self._hass.async_add_executor_job(
+            _resolve_integrations_from_root,
+            self._hass,
+            root_module,
+            domains,
+            manifests,
+            parsed,
+        )
+        if parsed and manifests is not None:
+            manifests.update(parsed)
+            self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+        return integrations
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"ha_version": HA_VERSION, "manifests": self._manifests}
+
+
+async def _async_get_manifest_cache(hass: HomeAssistant) -> _ManifestCache:
+    """Return the loaded manifest cache."""
+    if (manifest_cache := hass.data.get(DATA_MANIFEST_CACHE)) is None:
+        manifest_cache = hass.data[DATA_MANIFEST_CACHE] = _ManifestCache(hass)
+    await manifest_cache.async_load()
+    return cast(_ManifestCache, manifest_cache)
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
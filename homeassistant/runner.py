@@ -48,6 +48,8 @@ class RuntimeConfig:
     debug: bool = False
     open_ui: bool = False
 
+    startup_trace: str | None = None
+
 
 class HassEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
     """Event loop policy for Home Assistant."""
@@ -8,8 +8,12 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+import os
+import sys
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import TypeVar
+from unittest.mock import patch
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -298,6 +302,34 @@ async def valid_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def slugify_names(hass):
+    """Slugify a million ASCII names."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.util import slugify
+
+    names = [f"Living Room Lamp {index}" for index in range(1000)]
+    start = timer()
+    for _ in range(1000):
+        for name in names:
+            slugify(name)
+    return timer() - start
+
+
+@benchmark
+async def validate_entity_ids(hass):
+    """Validate a million entity IDs of 1000 entities with config validation."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv
+
+    entity_ids = [f"light.living_room_lamp_{index}" for index in range(1000)]
+    start = timer()
+    for _ in range(1000):
+        for entity_id in entity_ids:
+            cv.entity_id(entity_id)
+    return timer() - start
+
+
 @benchmark
 async def json_serialize_states(hass):
     """Serialize million states with websocket default encoder."""
@@ -311,6 +343,212 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def authenticated_requests(hass):
+    """Authenticate 100,000 requests with the same access token."""
+    # pylint: disable=import-outside-toplevel
+    from aiohttp import web
+    from aiohttp.test_utils import make_mocked_request
+
+    from homeassistant.auth import auth_manager_from_config
+    from homeassistant.components.http.auth import async_setup_auth
+    from homeassistant.components.http.const import KEY_AUTHENTICATED
+    from homeassistant.helpers import device_registry, entity_registry
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await device_registry.async_load(hass)
+        await entity_registry.async_load(hass)
+        hass.auth = await auth_manager_from_config(hass, [], [])
+        app = web.Application()
+        await async_setup_auth(hass, app)
+        auth_middleware = app.middlewares[-1]
+
+        user = await hass.auth.async_create_user("Benchmark")
+        refresh_token = await hass.auth.async_create_refresh_token(
+            user, client_id="https://benchmark.example"
+        )
+        headers = {
+            "Authorization": f"Bearer {hass.auth.async_create_access_token(refresh_token)}"
+        }
+
+        async def handler(request):
+            """Return if the request is authenticated."""
+            return request[KEY_AUTHENTICATED]
+
+        request = make_mocked_request("POST", "/api/services", headers=headers)
+
+        start = timer()
+        for _ in range(10**5):
+            assert await auth_middleware(request, handler)
+        runtime = timer() - start
+
+        await hass.async_stop()
+    return runtime
+
+
+@benchmark
+async def import_platforms(hass):
+    """Import the demo platforms while measuring the event loop lag."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.const import Platform
+    from homeassistant.loader import async_get_integration
+
+    platforms = [platform.value for platform in Platform]
+    # Each run imports the platforms again
+    for platform in platforms:
+        sys.modules.pop(f"homeassistant.components.demo.{platform}", None)
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        integration = await async_get_integration(hass, "demo")
+        integration.get_component()
+
+        max_lag = 0.0
+        importing = True
+
+        async def measure_lag():
+            """Measure the longest time the event loop was blocked."""
+            nonlocal max_lag
+            while importing:
+                tick = timer()
+                await asyncio.sleep(0)
+                max_lag = max(max_lag, timer() - tick)
+
+        lag_task = asyncio.create_task(measure_lag())
+        start = timer()
+        for platform in platforms:
+            with suppress(ImportError):
+                await integration.async_get_platform(platform)
+        runtime = timer() - start
+        importing = False
+        await lag_task
+
+        print(f"Event loop blocked for at most {max_lag}s")
+        await hass.async_stop()
+    return runtime
+
+
+@benchmark
+async def load_registries_snapshot(hass):
+    """Load a registry of 10,000 entities from the registry snapshot."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import (
+        device_registry,
+        entity_registry,
+        registry_snapshot,
+    )
+
+    async def async_load(hass, config_dir, snapshot):
+        """Load the device and entity registries."""
+        hass.config.config_dir = config_dir
+        start = timer()
+        if snapshot:
+            await registry_snapshot.async_load(hass)
+        await device_registry.async_load(hass)
+        await entity_registry.async_load(hass)
+        return timer() - start
+
+    with TemporaryDirectory() as config_dir:
+        await async_load(hass, config_dir, True)
+        dev_reg = device_registry.async_get(hass)
+        ent_reg = entity_registry.async_get(hass)
+        for index in range(2000):
+            device = dev_reg.async_get_or_create(
+                config_entry_id="benchmark",
+                identifiers={("benchmark", str(index))},
+                manufacturer="Benchmark",
+                model="Sensor",
+            )
+            for sensor in range(5):
+                ent_reg.async_get_or_create(
+                    "sensor",
+                    "benchmark",
+                    f"{index}-{sensor}",
+                    capabilities={"state_class": "measurement"},
+                    device_id=device.id,
+                    original_name=f"Sensor {index} {sensor}",
+                    unit_of_measurement="°C",
+                )
+        # Writes the JSON stores and the snapshot
+        await hass.async_stop(force=True)
+
+        json_hass = core.HomeAssistant()
+        json_runtime = await async_load(json_hass, config_dir, False)
+        await json_hass.async_stop(force=True)
+        print(f"Loaded from JSON in {json_runtime}s")
+
+        snapshot_hass = core.HomeAssistant()
+        runtime = await async_load(snapshot_hass, config_dir, True)
+        assert len(entity_registry.async_get(snapshot_hass).entities) == 10000
+        await snapshot_hass.async_stop(force=True)
+    return runtime
+
+
+@benchmark
+async def load_yaml_node_cache(hass):
+    """Load a configuration of 3000 automations from a warm YAML node cache.
+
+    The cache is only used with the pure Python loader, the C loader is
+    disabled for the whole benchmark.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config as conf_util
+    from homeassistant.util.yaml import loader as yaml_loader
+    from homeassistant.util.yaml.cache import NodeCache
+
+    automation = (
+        "- id: '{index}'\n"
+        "  alias: Automation {index}\n"
+        "  trigger:\n"
+        "    - platform: state\n"
+        "      entity_id: binary_sensor.motion_{index}\n"
+        "      to: 'on'\n"
+        "      for: '00:01:00'\n"
+        "  condition:\n"
+        "    - condition: time\n"
+        "      after: '08:00:00'\n"
+        "  action:\n"
+        "    - service: light.turn_on\n"
+        "      target:\n"
+        "        entity_id: light.room_{index}\n"
+        "      data:\n"
+        "        brightness_pct: 80\n"
+    )
+
+    def load(config_path, cache_path):
+        """Load the configuration and return the time it took."""
+        start = timer()
+        if cache_path is None:
+            conf_util.load_yaml_config_file(config_path)
+        else:
+            node_cache = NodeCache()
+            with patch.object(conf_util, "NODE_CACHE", node_cache), patch.object(
+                yaml_loader, "NODE_CACHE", node_cache
+            ):
+                conf_util.load_yaml_config_file_cached(config_path, None, cache_path)
+        return timer() - start
+
+    with TemporaryDirectory() as config_dir, patch.object(
+        yaml_loader, "HAS_C_LOADER", False
+    ):
+        config_path = os.path.join(config_dir, conf_util.YAML_CONFIG_FILE)
+        cache_path = os.path.join(config_dir, conf_util.YAML_NODE_CACHE_FILE)
+        with open(config_path, "w", encoding="utf-8") as config_file:
+            config_file.write("automation: !include automations.yaml\n")
+        with open(
+            os.path.join(config_dir, "automations.yaml"), "w", encoding="utf-8"
+        ) as automations_file:
+            for index in range(3000):
+                automations_file.write(automation.format(index=index))
+
+        parse_runtime = await hass.async_add_executor_job(load, config_path, None)
+        print(f"Parsed without the cache in {parse_runtime}s")
+        cold_runtime = await hass.async_add_executor_job(load, config_path, cache_path)
+        print(f"Parsed with a cold cache in {cold_runtime}s")
+        return await hass.async_add_executor_job(load, config_path, cache_path)
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -20,6 +20,7 @@ from .const import (
 )
 from .core import CALLBACK_TYPE
 from .exceptions import DependencyError, HomeAssistantError
+from .helpers.startup_timeline import startup_span
 from .helpers.typing import ConfigType
 from .util import dt as dt_util, ensure_unique_string
 
@@ -50,6 +51,10 @@ DATA_SETUP_STARTED = "setup_started"
 # DATA_SETUP_TIME is a dict [str, timedelta], indicating how time was spent setting up a component
 DATA_SETUP_TIME = "setup_time"
 
+# DATA_IMPORT_TIME is a dict [str, timedelta], indicating how much time was spent
+# importing an integration and its platforms before it was set up
+DATA_IMPORT_TIME = "import_time"
+
 DATA_DEPS_REQS = "deps_reqs_processed"
 
 SLOW_SETUP_WARNING = 10
@@ -86,15 +91,19 @@ async def async_setup_component(
 
     setup_tasks: dict[str, asyncio.Task[bool]] = hass.data.setdefault(DATA_SETUP, {})
 
+    # A config entry waiting for another integration gives up its setup slot,
+    # the config entries of that integration may need it
     if domain in setup_tasks:
-        return await setup_tasks[domain]
+        async with hass.config_entries.async_release_setup_slot():
+            return await setup_tasks[domain]
 
     task = setup_tasks[domain] = hass.async_create_task(
         _async_setup_component(hass, domain, config)
     )
 
     try:
-        return await task
+        async with hass.config_entries.async_release_setup_slot():
+            return await task
     finally:
         if domain in hass.data.get(DATA_SETUP_DONE, {}):
             hass.data[DATA_SETUP_DONE].pop(domain).set()
@@ -205,14 +214,16 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with startup_span(hass, "import", "import", domain):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}")
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with startup_span(hass, "validate config", "config", domain):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.")
@@ -289,12 +300,7 @@ async def _async_setup_component(
         # call to avoid a deadlock when forwarding platforms
         hass.config.components.add(domain)
 
-        await asyncio.gather(
-            *(
-                entry.async_setup(hass, integration=integration)
-                for entry in hass.config_entries.async_entries(domain)
-            )
-        )
+        await hass.config_entries.async_setup_integration_entries(integration)
 
     # Cleanup
     if domain in hass.data[DATA_SETUP]:
@@ -335,7 +341,7 @@ async def async_prepare_setup_platform(
         return None
 
     try:
-        platform = integration.get_platform(domain)
+        platform = await integration.async_get_platform(domain)
     except ImportError as exc:
         log_error(f"Platform not found ({exc}).")
         return None
@@ -374,13 +380,15 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if failed_deps := await _async_process_dependencies(hass, config, integration):
+    domain = integration.domain
+    with startup_span(hass, "wait for dependencies", "dependencies", domain):
+        failed_deps = await _async_process_dependencies(hass, config, integration)
+    if failed_deps:
         raise DependencyError(failed_deps)
 
-    async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+    with startup_span(hass, "requirements", "requirements", domain):
+        async with hass.timeout.async_freeze(domain):
+            await requirements.async_get_integration_with_requirements(hass, domain)
 
     processed.add(integration.domain)
 
@@ -472,7 +480,10 @@ def async_start_setup(
         unique_components[unique] = domain
         setup_started[unique] = started
 
-    yield
+    with contextlib.ExitStack() as stack:
+        for domain in unique_components.values():
+            stack.enter_context(startup_span(hass, "setup", "setup", domain))
+        yield
 
     setup_time: dict[str, timedelta] = hass.data.setdefault(DATA_SETUP_TIME, {})
     time_taken = dt_util.utcnow() - started
@@ -21,6 +21,17 @@ _U = TypeVar("_U")
 RE_SANITIZE_FILENAME = re.compile(r"(~|\.\.|/|\\)")
 RE_SANITIZE_PATH = re.compile(r"(~|\.(\.)+)")
 
+# Commas between digits are dropped, "1,000" becomes "1000"
+RE_SLUG_DIGITS_COMMA = re.compile(r"(?<=\d),(?=\d)")
+
+# Lowercases ASCII letters, keeps digits and turns everything else into spaces
+SLUG_ASCII_TABLE = str.maketrans(
+    {
+        chr(code): chr(code).lower() if chr(code).isalnum() else " "
+        for code in range(128)
+    }
+)
+
 
 def raise_if_invalid_filename(filename: str) -> None:
     """Check if a filename is valid.
@@ -44,7 +55,13 @@ def slugify(text: str | None, *, separator: str = "_") -> str:
     """Slugify a given text."""
     if text == "" or text is None:
         return ""
-    slug = unicode_slug.slugify(text, separator=separator)
+    # ASCII text needs no transliteration, HTML entities are left to the library
+    if text.isascii() and "&" not in text:
+        if "," in text:
+            text = RE_SLUG_DIGITS_COMMA.sub("", text)
+        slug = separator.join(text.translate(SLUG_ASCII_TABLE).split())
+    else:
+        slug = unicode_slug.slugify(text, separator=separator)
     return "unknown" if slug == "" else slug
 
 
@@ -3,18 +3,26 @@ from __future__ import annotations
 
 import asyncio
 from functools import cache
-from importlib.metadata import PackageNotFoundError, version
+from importlib.metadata import distributions
 import logging
 import os
 from pathlib import Path
+import re
 from subprocess import PIPE, Popen
 import sys
+import threading
 from urllib.parse import urlparse
 
 import pkg_resources
 
 _LOGGER = logging.getLogger(__name__)
 
+_NAME_SEPARATORS = re.compile(r"[-_.]+")
+
+_INDEX_LOCK = threading.Lock()
+_index_signature: tuple[tuple[str, int], ...] | None = None
+_index: dict[str, str | None] = {}
+
 
 def is_virtual_env() -> bool:
     """Return if we run in a virtual environment."""
@@ -30,6 +38,66 @@ def is_docker_env() -> bool:
     return Path("/.dockerenv").exists()
 
 
+def canonicalize_name(name: str) -> str:
+    """Return the normalized name of a package as defined in PEP 503."""
+    return _NAME_SEPARATORS.sub("-", name).lower()
+
+
+def _sys_path_signature() -> tuple[tuple[str, int], ...]:
+    """Return the entries of sys.path with their modification time.
+
+    Installing, upgrading or removing a package adds or removes metadata
+    directories, which changes the modification time of its path entry.
+    """
+    signature = []
+    for path in sys.path:
+        try:
+            mtime = os.stat(path or ".").st_mtime_ns
+        except OSError:
+            mtime = 0
+        signature.append((path, mtime))
+    return tuple(signature)
+
+
+def _build_index() -> dict[str, str | None]:
+    """Map the installed distributions to their version in a single pass."""
+    index: dict[str, str | None] = {}
+    for dist in distributions():
+        metadata = dist.metadata
+        # The metadata is missing when an install failed or was aborted while
+        # in progress, fall back to the name of the metadata directory
+        name = metadata["Name"] or getattr(dist, "_normalized_name", None)
+        if not name:
+            continue
+        # Like the import system, the first match on sys.path wins
+        index.setdefault(canonicalize_name(name), metadata["Version"])
+    return index
+
+
+def get_installed_versions() -> dict[str, str | None]:
+    """Return the versions of the installed packages by normalized name.
+
+    The index is built once and rebuilt when sys.path or the content of one
+    of its directories changes.
+    """
+    global _index, _index_signature  # pylint: disable=global-statement
+
+    signature = _sys_path_signature()
+    with _INDEX_LOCK:
+        if signature != _index_signature:
+            _index = _build_index()
+            _index_signature = signature
+        return _index
+
+
+def invalidate_installed_versions() -> None:
+    """Rebuild the index of installed packages on the next lookup."""
+    global _index_signature  # pylint: disable=global-statement
+
+    with _INDEX_LOCK:
+        _index_signature = None
+
+
 def is_installed(package: str) -> bool:
     """Check if a package is installed and will be loaded when we import it.
 
@@ -37,28 +105,23 @@ def is_installed(package: str) -> bool:
     Returns False when the package is not installed or doesn't meet req.
     """
     try:
-        pkg_resources.get_distribution(package)
-        return True
-    except (pkg_resources.ResolutionError, pkg_resources.ExtractionError):
         req = pkg_resources.Requirement.parse(package)
     except ValueError:
         # This is a zip file. We no longer use this in Home Assistant,
         # leaving it in for custom components.
         req = pkg_resources.Requirement.parse(urlparse(package).fragment)
 
-    try:
-        installed_version = version(req.project_name)
-        # This will happen when an install failed or
-        # was aborted while in progress see
-        # https://github.com/home-assistant/core/issues/47699
-        if installed_version is None:
-            _LOGGER.error(  # type: ignore[unreachable]
-                "Installed version for %s resolved to None", req.project_name
-            )
-            return False
-        return installed_version in req
-    except PackageNotFoundError:
+    installed_versions = get_installed_versions()
+    if (name := canonicalize_name(req.project_name)) not in installed_versions:
+        return False
+
+    # This will happen when an install failed or
+    # was aborted while in progress see
+    # https://github.com/home-assistant/core/issues/47699
+    if (installed_version := installed_versions[name]) is None:
+        _LOGGER.error("Installed version for %s resolved to None", req.project_name)
         return False
+    return installed_version in req
 
 
 def install_package(
@@ -104,6 +167,7 @@ def install_package(
             )
             return False
 
+    invalidate_installed_versions()
     return True
 
 
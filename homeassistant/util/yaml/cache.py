@@ -0,0 +1,194 @@
+"""Cache of composed YAML node trees."""
+from __future__ import annotations
+
+from collections.abc import Generator
+from contextlib import contextmanager
+import logging
+import marshal
+import os
+import threading
+from typing import Any
+
+from atomicwrites import AtomicWriter
+import yaml
+from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
+
+_LOGGER = logging.getLogger(__name__)
+
+NODE_CACHE_VERSION = 2
+
+_SCALAR = 0
+_SEQUENCE = 1
+_MAPPING = 2
+
+
+class _AliasError(Exception):
+    """Raised when a node tree contains an alias."""
+
+
+def _encode(node: Node, seen: set[int]) -> tuple:
+    """Encode a node tree as nested tuples.
+
+    Raises _AliasError if a node appears more than once. Aliases can make a
+    tree cyclic or, when nested, exponentially larger once encoded.
+    """
+    if id(node) in seen:
+        raise _AliasError
+    seen.add(id(node))
+    marks = (
+        node.start_mark.line,
+        node.start_mark.column,
+        node.end_mark.line,
+        node.end_mark.column,
+    )
+    if isinstance(node, ScalarNode):
+        return (_SCALAR, node.tag, node.value, marks, node.style)
+    if isinstance(node, SequenceNode):
+        return (
+            _SEQUENCE,
+            node.tag,
+            tuple(_encode(child, seen) for child in node.value),
+            marks,
+            node.flow_style,
+        )
+    return (
+        _MAPPING,
+        node.tag,
+        tuple((_encode(key, seen), _encode(value, seen)) for key, value in node.value),
+        marks,
+        node.flow_style,
+    )
+
+
+def _mark(name: str, line: int, column: int) -> yaml.Mark:
+    """Return a mark without the source buffer."""
+    return yaml.Mark(name, 0, line, column, None, None)  # type: ignore[arg-type]
+
+
+def _decode(encoded: tuple, name: str) -> Node:
+    """Decode nested tuples to a node tree."""
+    kind, tag, value, (line, column, end_line, end_column), style = encoded
+    start_mark = _mark(name, line, column)
+    end_mark = _mark(name, end_line, end_column)
+    if kind == _SCALAR:
+        return ScalarNode(tag, value, start_mark, end_mark, style)
+    if kind == _SEQUENCE:
+        return SequenceNode(
+            tag,
+            [_decode(child, name) for child in value],
+            start_mark,
+            end_mark,
+            style,
+        )
+    return MappingNode(
+        tag,
+        [(_decode(key, name), _decode(val, name)) for key, val in value],
+        start_mark,
+        end_mark,
+        style,
+    )
+
+
+class NodeCache:
+    """Keep the composed node trees of YAML files by the hash of their content.
+
+    Only the output of the parser is cached. Constructors run on every load,
+    so tags like !secret, !env_var and !include are still resolved freshly.
+
+    The cache is only used by the thread loading the configuration inside
+    activate, other YAML files are parsed as before.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._nodes: dict[str, tuple[str, tuple | None]] = {}
+        self._used: set[str] = set()
+        self._changed = False
+        self._loaded_path: str | None = None
+
+    @property
+    def active(self) -> bool:
+        """Return if the files loaded by the current thread are cached."""
+        return getattr(self._local, "active", False)  # type: ignore[no-any-return]
+
+    @contextmanager
+    def activate(self, path: str) -> Generator[None, None, None]:
+        """Cache the files loaded by the current thread, stored at path."""
+        self.load(path)
+        self._local.active = True
+        try:
+            yield
+        finally:
+            self._local.active = False
+            self.save(path)
+
+    def get(self, fname: str, digest: str) -> Node | None:
+        """Return the node tree of a file, raise KeyError if not cached."""
+        cached_digest, encoded = self._nodes[fname]
+        if cached_digest != digest:
+            raise KeyError(fname)
+        self._used.add(fname)
+        return None if encoded is None else _decode(encoded, fname)
+
+    def set(self, fname: str, digest: str, node: Node | None) -> None:
+        """Cache the node tree of a file, unless it contains aliases."""
+        try:
+            encoded = None if node is None else _encode(node, set())
+        except (_AliasError, RecursionError):
+            return
+        with self._lock:
+            self._nodes[fname] = (digest, encoded)
+            self._used.add(fname)
+            self._changed = True
+
+    def load(self, path: str) -> None:
+        """Load the cache from disk and start tracking the used entries.
+
+        The file is only read the first time, afterwards the entries are
+        kept in memory.
+        """
+        with self._lock:
+            self._used = set()
+            if self._loaded_path == path:
+                return
+            self._loaded_path = path
+            try:
+                # marshal.load reads file objects in many small chunks
+                with open(path, "rb") as cache_file:
+                    data: Any = marshal.loads(cache_file.read())
+            except FileNotFoundError:
+                return
+            except (OSError, EOFError, ValueError, TypeError) as err:
+                _LOGGER.debug("Ignoring invalid YAML cache %s: %s", path, err)
+                return
+            if (
+                isinstance(data, tuple)
+                and len(data) == 3
+                and data[:2] == (NODE_CACHE_VERSION, yaml.__version__)
+            ):
+                self._nodes = data[2]
+                self._changed = False
+
+    def save(self, path: str) -> None:
+        """Write the entries used since the last load to disk, if changed."""
+        with self._lock:
+            if not self._changed and self._used == self._nodes.keys():
+                return
+            self._nodes = {
+                fname: entry
+                for fname, entry in self._nodes.items()
+                if fname in self._used
+            }
+            self._changed = False
+            data = (NODE_CACHE_VERSION, yaml.__version__, self._nodes)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with AtomicWriter(path, mode="wb", overwrite=True).open() as fdesc:
+                    marshal.dump(data, fdesc)
+            except OSError as err:
+                _LOGGER.warning("Unable to save YAML cache %s: %s", path, err)
+
+
+NODE_CACHE = NodeCache()
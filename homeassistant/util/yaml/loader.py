@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections import OrderedDict
 from collections.abc import Iterator
 import fnmatch
+import hashlib
 from io import StringIO, TextIOWrapper
 import logging
 import os
@@ -24,6 +25,7 @@ except ImportError:
 
 from homeassistant.exceptions import HomeAssistantError
 
+from .cache import NODE_CACHE
 from .const import SECRET_YAML
 from .objects import Input, NodeListClass, NodeStrClass
 
@@ -157,15 +159,57 @@ class SafeLineLoader(yaml.SafeLoader):
 LoaderType = Union[SafeLineLoader, SafeLoader]
 
 
+class _NamedStringIO(StringIO):
+    """String stream with the name of the file it was read from."""
+
+    def __init__(self, content: str, name: str) -> None:
+        """Initialize the stream."""
+        super().__init__(content)
+        self.name = name
+
+
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    While the node cache is active and the C loader is not available, the
+    parsed node tree is kept in it, so unchanged files are not parsed again.
+    Parsing with the C loader is faster than decoding the cached tree.
+    """
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            content = conf_file.read()
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
+    # Keep the secrets out of the cache
+    if HAS_C_LOADER or not NODE_CACHE.active or os.path.basename(fname) == SECRET_YAML:
+        return parse_yaml(_NamedStringIO(content, fname), secrets)
+
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    try:
+        node = NODE_CACHE.get(fname, digest)
+    except KeyError:
+        yaml_loader = SafeLineLoader(_NamedStringIO(content, fname))
+        try:
+            node = yaml_loader.get_single_node()
+        except yaml.YAMLError:
+            # Parse again with the line loader to report the error
+            return _parse_yaml_pure_python(_NamedStringIO(content, fname), secrets)
+        finally:
+            yaml_loader.dispose()
+        NODE_CACHE.set(fname, digest, node)
+
+    if node is None:
+        return OrderedDict()
+    yaml_loader = SafeLineLoader(_NamedStringIO("", fname), secrets)
+    try:
+        return yaml_loader.construct_document(node) or OrderedDict()
+    except yaml.YAMLError:
+        return _parse_yaml_pure_python(_NamedStringIO(content, fname), secrets)
+    finally:
+        yaml_loader.dispose()
+
 
 def parse_yaml(
     content: str | TextIO | StringIO, secrets: Secrets | None = None
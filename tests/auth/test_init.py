@@ -1,5 +1,6 @@
 """Tests for the Home Assistant auth module."""
 from datetime import timedelta
+import time
 from unittest.mock import Mock, patch
 
 import jwt
@@ -563,6 +564,60 @@ async def test_remove_refresh_token(mock_hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_validated_access_tokens_are_cached(mock_hass):
+    """Test validated access tokens skip decoding until they are revoked."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+        # A token with the same signature but different claims is decoded
+        header, _, signature = access_token.split(".")
+        forged = f"{header}.e30.{signature}"
+        mock_decode.side_effect = jwt.InvalidTokenError
+        assert await manager.async_validate_access_token(forged) is None
+    assert mock_decode.call_count == 1
+
+    user.is_active = False
+    assert await manager.async_validate_access_token(access_token) is None
+    user.is_active = True
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_cached_access_tokens_expire(mock_hass):
+    """Test cached access tokens are not valid after they expire."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    expired = time.time() + auth_const.ACCESS_TOKEN_EXPIRATION.total_seconds() + 11
+    with patch("homeassistant.auth.time.time", return_value=expired), patch(
+        "homeassistant.auth.jwt.decode", side_effect=jwt.ExpiredSignatureError
+    ) as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is None
+    assert mock_decode.called
+
+
+async def test_removing_user_forgets_access_tokens(mock_hass):
+    """Test access tokens of a removed user are no longer valid."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_remove_user(user)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
 async def test_register_revoke_token_callback(mock_hass):
     """Test that a registered revoke token callback is called."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
@@ -34,6 +34,21 @@ async def test_api_list_state_entities(hass, mock_api_client):
     assert remote_data == hass.states.async_all()
 
 
+async def test_api_list_state_entities_ndjson(hass, mock_api_client):
+    """Test states are streamed as NDJSON when requested."""
+    hass.states.async_set("test.entity", "hello")
+    hass.states.async_set("test.other", "world")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"Accept": "application/x-ndjson"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.content_type == "application/x-ndjson"
+    lines = (await resp.text()).splitlines()
+
+    remote_data = [ha.State.from_dict(json.loads(line)) for line in lines]
+    assert remote_data == hass.states.async_all()
+
+
 async def test_api_get_state(hass, mock_api_client):
     """Test if the debug interface allows us to get a state."""
     hass.states.async_set("hello.world", "nice", {"attr": 1})
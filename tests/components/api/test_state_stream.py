@@ -0,0 +1,122 @@
+"""Test the server-sent event stream of state changes."""
+from http import HTTPStatus
+import json
+
+from homeassistant.components.api import state_stream
+from homeassistant.components.api.state_stream import (
+    StateStreamClient,
+    async_get_state_stream,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+
+async def _next_event(stream) -> dict[str, str]:
+    """Read the next server-sent event, skipping comments."""
+    while True:
+        fields: dict[str, str] = {}
+        while (line := (await stream.readline()).decode("UTF-8")) != "\n":
+            if line.startswith(":"):
+                continue
+            name, _, value = line.rstrip("\n").partition(": ")
+            fields[name] = value
+        if fields:
+            return fields
+
+
+async def test_state_stream_filters(hass: HomeAssistant, hass_client) -> None:
+    """Test state changes are filtered by entity id and domain."""
+    assert await async_setup_component(hass, "api", {})
+    client = await hass_client()
+
+    async with client.get(
+        "/api/stream/states?entity_id=sensor.power&domain=light&attributes=brightness"
+    ) as resp:
+        assert resp.status == HTTPStatus.OK
+
+        hass.states.async_set("switch.kitchen", "on")
+        hass.states.async_set("light.kitchen", "on", {"brightness": 10, "color": "red"})
+        event = await _next_event(resp.content)
+        assert event["event"] == "state_changed"
+        data = json.loads(event["data"])
+        assert data["entity_id"] == "light.kitchen"
+        assert data["new_state"]["state"] == "on"
+        assert data["new_state"]["attributes"] == {"brightness": 10}
+
+        hass.states.async_set("sensor.energy", "1")
+        hass.states.async_set("sensor.power", "2")
+        event = await _next_event(resp.content)
+        assert json.loads(event["data"])["entity_id"] == "sensor.power"
+
+        clients = await client.get("/api/stream/states/clients")
+        assert await clients.json() == [
+            {
+                "entity_ids": ["sensor.power"],
+                "domains": ["light"],
+                "attributes": ["brightness"],
+                "backlog": 0,
+                "sent": 2,
+            }
+        ]
+
+
+async def test_state_stream_resume(hass: HomeAssistant, hass_client) -> None:
+    """Test a client can resume with the id of the last event."""
+    assert await async_setup_component(hass, "api", {})
+    client = await hass_client()
+
+    async with client.get("/api/stream/states") as resp:
+        hass.states.async_set("light.kitchen", "on")
+        last_event_id = (await _next_event(resp.content))["id"]
+
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+
+    async with client.get(
+        "/api/stream/states", headers={"Last-Event-ID": last_event_id}
+    ) as resp:
+        event = await _next_event(resp.content)
+        assert json.loads(event["data"])["new_state"]["state"] == "off"
+
+    async with client.get(
+        "/api/stream/states", headers={"Last-Event-ID": "unknown-1"}
+    ) as resp:
+        event = await _next_event(resp.content)
+        assert event["event"] == "reset"
+
+
+async def test_state_stream_requires_admin(
+    hass: HomeAssistant, hass_client, hass_admin_user
+) -> None:
+    """Test the state stream requires an admin."""
+    assert await async_setup_component(hass, "api", {})
+    hass_admin_user.groups = []
+    client = await hass_client()
+    resp = await client.get("/api/stream/states")
+    assert resp.status == HTTPStatus.UNAUTHORIZED
+    resp = await client.get("/api/stream/states/clients")
+    assert resp.status == HTTPStatus.UNAUTHORIZED
+
+
+async def test_state_stream_hub(hass: HomeAssistant, monkeypatch) -> None:
+    """Test the hub encodes once and disconnects lagging clients."""
+    monkeypatch.setattr(state_stream, "STATE_STREAM_BUFFER_SIZE", 2)
+    hub = async_get_state_stream(hass)
+    first = StateStreamClient(set(), set(), None)
+    second = StateStreamClient(set(), set(), None)
+    hub.async_subscribe(first)
+    hub.async_subscribe(second)
+
+    hass.states.async_set("light.kitchen", "on")
+    first_event = first.queue.get_nowait()
+    assert second.queue.get_nowait() is first_event
+    assert first_event.encode(None) is first_event.encode(None)
+
+    for state in ("off", "on", "off"):
+        hass.states.async_set("light.kitchen", state)
+    assert first.overflowed
+    assert second.overflowed
+
+    # Only the last two changes are still buffered
+    resumed = StateStreamClient(set(), set(), None)
+    assert not hub.async_subscribe(resumed, first_event.event_id)
@@ -1,6 +1,7 @@
 """The tests for the automation component."""
 import asyncio
 from collections.abc import Awaitable, Callable
+from copy import deepcopy
 from datetime import timedelta
 import logging
 from unittest.mock import Mock, patch
@@ -17,6 +18,7 @@ from homeassistant.components.automation import (
     SERVICE_TRIGGER,
     AutomationEntity,
 )
+from homeassistant.components.automation.config import _async_validate_config_item
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_NAME,
@@ -1041,6 +1043,46 @@ async def test_reload_unchanged_automation(hass, calls, automation_config):
         assert len(calls) == 2
 
 
+async def test_reload_unchanged_automation_not_revalidated(hass, calls):
+    """Test unchanged automations are not validated again on reload."""
+    config = {
+        automation.DOMAIN: [
+            {
+                "id": "sun",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": [{"service": "test.automation"}],
+            },
+            {
+                "id": "moon",
+                "trigger": {"platform": "event", "event_type": "test_event_2"},
+                "action": [{"service": "test.automation"}],
+            },
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+    await hass.async_block_till_done()
+
+    config = deepcopy(config)
+    config[automation.DOMAIN][1]["trigger"]["event_type"] = "test_event_3"
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=config,
+    ), patch(
+        "homeassistant.components.automation.config._async_validate_config_item",
+        wraps=_async_validate_config_item,
+    ) as mock_validate:
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert len(mock_validate.mock_calls) == 1
+    assert mock_validate.mock_calls[0][1][1]["id"] == "moon"
+
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("test_event_3")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
 @pytest.mark.parametrize("extra_config", ({}, {"id": "sun"}))
 async def test_reload_automation_when_blueprint_changes(hass, calls, extra_config):
     """Test an automation is updated at reload if the blueprint has changed."""
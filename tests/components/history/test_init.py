@@ -642,6 +642,44 @@ async def test_fetch_period_api_with_minimal_response(recorder_mock, hass, hass_
     ).replace('"', "")
 
 
+async def test_fetch_period_api_streams_entities(recorder_mock, hass, hass_client):
+    """Test the history of requested entities is fetched in batches and streamed."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+
+    hass.states.async_set("sensor.power", 0)
+    hass.states.async_set("sensor.energy", 10)
+    hass.states.async_set("sensor.voltage", 230)
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.power", 50)
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    with patch(
+        "homeassistant.components.history.history.get_significant_states_with_session",
+        wraps=history.history.get_significant_states_with_session,
+    ) as mock_get_states, patch(
+        "homeassistant.components.history.STREAM_ENTITY_BATCH_SIZE", 2
+    ):
+        response = await client.get(
+            f"/api/history/period/{now.isoformat()}"
+            "?filter_entity_id=sensor.power,sensor.energy,sensor.power,sensor.voltage",
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status == HTTPStatus.OK
+        assert response.content_type == "application/x-ndjson"
+        lines = (await response.text()).splitlines()
+
+    assert [call.args[4] for call in mock_get_states.mock_calls] == [
+        ["sensor.power", "sensor.energy"],
+        ["sensor.voltage"],
+    ]
+    power, energy, voltage = (json.loads(line) for line in lines)
+    assert [state["state"] for state in power] == ["0", "50"]
+    assert [state["state"] for state in energy] == ["10"]
+    assert [state["state"] for state in voltage] == ["230"]
+
+
 async def test_fetch_period_api_with_no_timestamp(recorder_mock, hass, hass_client):
     """Test the fetch period view for history with no timestamp."""
     await async_setup_component(hass, "history", {})
@@ -560,3 +560,32 @@ async def test_save_persistent_states(hass):
             blocking=True,
         )
         assert mock_save.called
+
+
+async def test_state_trigger_stats(hass, hass_ws_client):
+    """Test getting the match counts of state triggers."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    websocket_client = await hass_ws_client(hass)
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "subscribe_trigger",
+            "trigger": {"platform": "state", "entity_id": "light.kitchen"},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bedroom", "on")
+    await hass.async_block_till_done()
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "event"
+
+    await websocket_client.send_json({"id": 6, "type": "state_trigger/stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    assert msg["result"] == [
+        {"name": "websocket_api", "entity_ids": ["light.kitchen"], "matches": 1}
+    ]
@@ -1707,3 +1707,108 @@ async def test_variables_priority(hass, calls):
         await hass.async_block_till_done()
         assert len(calls) == 2
         assert calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_triggers_share_state_listener(hass, calls):
+    """Test state triggers with the same config share one state listener."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": f"automation {index}",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": "world",
+                    },
+                    "action": {"service": "test.automation"},
+                }
+                for index in range(3)
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    multiplexer = state_trigger.async_get_multiplexer(hass)
+    assert len(multiplexer._groups) == 1
+
+    with patch(
+        "homeassistant.components.homeassistant.triggers.state._StateMatcher.async_match",
+        autospec=True,
+        side_effect=state_trigger._StateMatcher.async_match,
+    ) as mock_match:
+        hass.states.async_set("test.entity", "world")
+        await hass.async_block_till_done()
+
+    assert len(mock_match.mock_calls) == 1
+    assert len(calls) == 3
+    assert sorted(
+        (stats["name"], stats["matches"]) for stats in multiplexer.async_stats()
+    ) == [("automation 0", 1), ("automation 1", 1), ("automation 2", 1)]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert multiplexer._groups == {}
+    assert multiplexer.async_stats() == []
+
+
+async def test_shared_listener_isolates_failing_trigger(hass, caplog):
+    """Test a failing trigger does not prevent other triggers from running."""
+    multiplexer = state_trigger.async_get_multiplexer(hass)
+    config = {"entity_id": ["test.entity"], "to": "world"}
+    results = []
+
+    def failing_action(event, old_value, new_value):
+        raise ValueError("boom")
+
+    def working_action(event, old_value, new_value):
+        results.append((old_value, new_value))
+
+    unsub_failing = multiplexer.async_subscribe(config, "failing", failing_action)
+    unsub_working = multiplexer.async_subscribe(config, "working", working_action)
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+
+    assert results == [("hello", "world")]
+    assert "Error while processing state trigger failing" in caplog.text
+
+    unsub_failing()
+    unsub_working()
+    assert multiplexer._groups == {}
+
+
+async def test_shared_listener_groups(hass):
+    """Test only triggers matching the same changes share a listener."""
+    multiplexer = state_trigger.async_get_multiplexer(hass)
+    configs = [
+        {"entity_id": ["test.entity"], "to": "world"},
+        {"entity_id": ["test.entity"], "to": ["world"]},
+        {"entity_id": ["test.entity"], "to": None},
+        {"entity_id": ["test.entity"]},
+        {"entity_id": ["test.entity"], "attribute": "level", "to": 1},
+        {"entity_id": ["test.entity"], "attribute": "level", "to": True},
+    ]
+    unsubs = [
+        multiplexer.async_subscribe(config, "trigger", lambda *_: None)
+        for config in configs * 2
+    ]
+    assert len(multiplexer._groups) == len(configs)
+
+    # Triggers with values which can't be compared are not shared
+    unusual_config = {"entity_id": ["test.entity"], "to": object()}
+    unsubs.extend(
+        multiplexer.async_subscribe(unusual_config, "trigger", lambda *_: None)
+        for _ in range(2)
+    )
+    assert len(multiplexer._groups) == len(configs) + 2
+
+    for unsub in unsubs:
+        unsub()
+    assert multiplexer._groups == {}
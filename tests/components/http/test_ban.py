@@ -4,6 +4,7 @@ from http import HTTPStatus
 # pylint: disable=protected-access
 from ipaddress import ip_address
 import os
+import time
 from unittest.mock import Mock, mock_open, patch
 
 from aiohttp import web
@@ -14,9 +15,11 @@ import pytest
 import homeassistant.components.http as http
 from homeassistant.components.http import KEY_AUTHENTICATED
 from homeassistant.components.http.ban import (
+    FAILED_LOGIN_ATTEMPTS_EXPIRE,
     IP_BANS_FILE,
     KEY_BAN_MANAGER,
     KEY_FAILED_LOGIN_ATTEMPTS,
+    FailedLoginAttempts,
     IpBanManager,
     setup_bans,
 )
@@ -352,3 +355,67 @@ async def test_failed_login_attempts_counter(hass, aiohttp_client):
     resp = await client.get("/auth_true")
     assert resp.status == HTTPStatus.OK
     assert app[KEY_FAILED_LOGIN_ATTEMPTS][remote_ip] == 2
+
+
+async def test_access_from_banned_network(hass, aiohttp_client, caplog):
+    """Test bans in CIDR notation ban all addresses of the network."""
+    app = web.Application()
+    app["hass"] = hass
+    setup_bans(hass, app, 5)
+    set_real_ip = mock_real_ip(app)
+
+    with patch(
+        "homeassistant.components.http.ban.load_yaml_config_file",
+        return_value={
+            "10.0.0.0/24": {"banned_at": "2016-11-16T19:20:03"},
+            "2001:db8::/64": {"banned_at": "2016-11-16T19:20:03"},
+            "10.0.1.1/24": {"banned_at": "2016-11-16T19:20:03"},
+        },
+    ):
+        client = await aiohttp_client(app)
+
+    assert "Failed to load IP ban" in caplog.text
+
+    for remote_addr in ("10.0.0.1", "10.0.0.255", "2001:db8::1"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == HTTPStatus.FORBIDDEN
+
+    for remote_addr in ("10.0.1.1", "2001:db9::1"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == HTTPStatus.NOT_FOUND
+
+
+async def test_failed_login_attempts_are_bounded(hass, caplog):
+    """Test failed login attempts expire and track a limited number of addresses."""
+    attempts = FailedLoginAttempts(2)
+    first = ip_address("200.201.202.204")
+
+    assert first not in attempts
+    assert attempts.async_add(first) == 1
+    assert attempts.async_add(first) == 2
+    assert attempts[first] == 2
+    assert first in attempts
+    assert list(attempts) == [first]
+
+    with patch(
+        "homeassistant.components.http.ban.monotonic",
+        return_value=time.monotonic() + FAILED_LOGIN_ATTEMPTS_EXPIRE + 1,
+    ):
+        assert attempts[first] == 0
+        assert first not in attempts
+        assert not list(attempts)
+        assert len(attempts) == 0
+        assert attempts.async_add(first) == 1
+
+    attempts.async_add(ip_address("200.201.202.205"))
+    assert "are forgotten" not in caplog.text
+    attempts.async_add(ip_address("200.201.202.206"))
+    assert "are forgotten" in caplog.text
+    assert len(attempts) == 2
+    assert attempts[first] == 0
+    assert first not in attempts
+
+    assert attempts.async_reset(ip_address("200.201.202.206"))
+    assert not attempts.async_reset(ip_address("200.201.202.206"))
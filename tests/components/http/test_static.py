@@ -0,0 +1,165 @@
+"""The tests for http static files."""
+import gzip
+from http import HTTPStatus
+import mimetypes
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+import pytest
+
+from homeassistant.components.http import static
+from homeassistant.setup import async_setup_component
+
+
+@pytest.fixture
+async def static_dir(hass, tmp_path):
+    """Register a static directory with a precompressed file."""
+    static.PATH_CACHE.clear()
+    static.FILE_CACHE.clear()
+    (tmp_path / "app.js").write_text("console.log('hello');" * 10)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(b"gzipped"))
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    (tmp_path / "plain.txt").write_text("plain")
+    assert await async_setup_component(hass, "http", {})
+    hass.http.register_static_path("/test_static", str(tmp_path))
+    return tmp_path
+
+
+async def test_precompressed_variants(hass, hass_client_no_auth, static_dir):
+    """Test the precompressed sibling is picked by Accept-Encoding."""
+    client = await hass_client_no_auth()
+
+    async with ClientSession(auto_decompress=False) as session:
+        resp = await session.get(
+            client.make_url("/test_static/app.js"),
+            headers={"Accept-Encoding": "gzip, deflate, br"},
+        )
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers["Content-Encoding"] == "br"
+        assert resp.headers["Vary"] == "Accept-Encoding"
+        assert resp.headers["Content-Type"] == mimetypes.guess_type("app.js")[0]
+        assert resp.headers["Cache-Control"] == f"public, max-age={static.CACHE_TIME}"
+        assert await resp.read() == b"brotli"
+
+        resp = await session.get(
+            client.make_url("/test_static/app.js"),
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(await resp.read()) == b"gzipped"
+
+    resp = await client.get(
+        "/test_static/app.js", headers={"Accept-Encoding": "identity"}
+    )
+    assert "Content-Encoding" not in resp.headers
+    assert await resp.text() == "console.log('hello');" * 10
+
+    resp = await client.get(
+        "/test_static/app.js", headers={"Accept-Encoding": "gzip;q=0.5, br;q=0"}
+    )
+    assert resp.headers["Content-Encoding"] == "gzip"
+
+    resp = await client.get(
+        "/test_static/app.js", headers={"Accept-Encoding": "*;q=0, identity"}
+    )
+    assert "Content-Encoding" not in resp.headers
+
+    resp = await client.get(
+        "/test_static/app.js", headers={"Accept-Encoding": "x-gzip-br"}
+    )
+    assert "Content-Encoding" not in resp.headers
+
+    resp = await client.get(
+        "/test_static/plain.txt", headers={"Accept-Encoding": "gzip, br"}
+    )
+    assert "Content-Encoding" not in resp.headers
+    assert "Vary" not in resp.headers
+    assert await resp.text() == "plain"
+
+
+async def test_cached_conditional_requests(hass, hass_client_no_auth, static_dir):
+    """Test cached files are revalidated without touching the filesystem."""
+    client = await hass_client_no_auth()
+
+    resp = await client.get("/test_static/plain.txt")
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+    last_modified = resp.headers["Last-Modified"]
+
+    with patch.object(static, "_load_file") as mock_load:
+        resp = await client.get(
+            "/test_static/plain.txt", headers={"If-None-Match": etag}
+        )
+        assert resp.status == HTTPStatus.NOT_MODIFIED
+        assert resp.headers["ETag"] == etag
+
+        resp = await client.get(
+            "/test_static/plain.txt", headers={"If-Modified-Since": last_modified}
+        )
+        assert resp.status == HTTPStatus.NOT_MODIFIED
+
+        resp = await client.get(
+            "/test_static/plain.txt", headers={"If-None-Match": '"other"'}
+        )
+        assert resp.status == HTTPStatus.OK
+        assert await resp.text() == "plain"
+
+    assert not mock_load.called
+
+
+async def test_cache_revalidates_changed_files(hass, hass_client_no_auth, static_dir):
+    """Test changed files are served once the cached metadata expires."""
+    client = await hass_client_no_auth()
+
+    resp = await client.get("/test_static/plain.txt")
+    assert await resp.text() == "plain"
+
+    (static_dir / "plain.txt").write_text("changed")
+    resp = await client.get("/test_static/plain.txt")
+    assert await resp.text() == "plain"
+
+    with patch.object(static, "FILE_CACHE_REVALIDATE", -1):
+        resp = await client.get("/test_static/plain.txt")
+    assert await resp.text() == "changed"
+
+    (static_dir / "plain.txt").unlink()
+    with patch.object(static, "FILE_CACHE_REVALIDATE", -1):
+        resp = await client.get("/test_static/plain.txt")
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+
+async def test_large_files_are_streamed(hass, hass_client_no_auth, static_dir):
+    """Test files above the size limit are not kept in memory."""
+    client = await hass_client_no_auth()
+
+    with patch.object(static, "FILE_CACHE_MAX_SIZE", 10):
+        resp = await client.get(
+            "/test_static/app.js", headers={"Accept-Encoding": "identity"}
+        )
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == "console.log('hello');" * 10
+    assert all(
+        variant.body is None or len(variant.body) <= 10
+        for variant in next(iter(static.FILE_CACHE.values())).variants
+    )
+
+    resp = await client.get("/test_static/plain.txt", headers={"Range": "bytes=1-3"})
+    assert resp.status == HTTPStatus.PARTIAL_CONTENT
+    assert await resp.text() == "lai"
+
+
+async def test_cache_bounded_by_size(hass, hass_client_no_auth, static_dir):
+    """Test the least recently used files are evicted above the size limit."""
+    client = await hass_client_no_auth()
+    (static_dir / "other.txt").write_text("other")
+    app_size = sum(len(path.read_bytes()) for path in static_dir.glob("app.js*"))
+
+    with patch.object(static.FILE_CACHE, "_max_bytes", app_size + 5):
+        for path in ("app.js", "plain.txt", "other.txt"):
+            resp = await client.get(f"/test_static/{path}")
+            assert resp.status == HTTPStatus.OK
+
+    assert static.FILE_CACHE.get(static_dir / "app.js") is None
+    assert static.FILE_CACHE.get(static_dir / "plain.txt") is not None
+    assert static.FILE_CACHE.get(static_dir / "other.txt") is not None
+    assert static.FILE_CACHE.size == 10
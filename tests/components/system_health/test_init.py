@@ -56,7 +56,7 @@ async def test_info_endpoint_return_info(hass, hass_ws_client):
 
     data = await gather_system_health_info(hass, hass_ws_client)
 
-    assert len(data) == 1
+    assert data.keys() == {"homeassistant", "websocket_api"}
     data = data["homeassistant"]
     assert data == {"info": {"hello": True}}
 
@@ -71,7 +71,7 @@ async def test_info_endpoint_register_callback(hass, hass_ws_client):
     assert await async_setup_component(hass, "system_health", {})
     data = await gather_system_health_info(hass, hass_ws_client)
 
-    assert len(data) == 1
+    assert data.keys() == {"lovelace", "websocket_api"}
     data = data["lovelace"]
     assert data == {"info": {"storage": "YAML"}}
 
@@ -89,7 +89,7 @@ async def test_info_endpoint_register_callback_timeout(hass, hass_ws_client):
     assert await async_setup_component(hass, "system_health", {})
     data = await gather_system_health_info(hass, hass_ws_client)
 
-    assert len(data) == 1
+    assert data.keys() == {"lovelace", "websocket_api"}
     data = data["lovelace"]
     assert data == {"info": {"error": {"type": "failed", "error": "timeout"}}}
 
@@ -104,7 +104,7 @@ async def test_info_endpoint_register_callback_exc(hass, hass_ws_client):
     assert await async_setup_component(hass, "system_health", {})
     data = await gather_system_health_info(hass, hass_ws_client)
 
-    assert len(data) == 1
+    assert data.keys() == {"lovelace", "websocket_api"}
     data = data["lovelace"]
     assert data == {"info": {"error": {"type": "failed", "error": "unknown"}}}
 
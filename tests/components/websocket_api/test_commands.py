@@ -21,9 +21,14 @@ from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.json import json_loads
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import DATA_IMPORT_TIME, DATA_SETUP_TIME, async_setup_component
 
-from tests.common import MockEntity, MockEntityPlatform, async_mock_service
+from tests.common import (
+    MockConfigEntry,
+    MockEntity,
+    MockEntityPlatform,
+    async_mock_service,
+)
 
 STATE_KEY_SHORT_NAMES = {
     "entity_id": "e",
@@ -502,6 +507,31 @@ async def test_get_states(hass, websocket_client):
 
     assert msg["result"] == states
 
+    # The states are only collected when the snapshot can't be used
+    with patch.object(
+        hass.states, "async_all", wraps=hass.states.async_all
+    ) as mock_async_all:
+        await websocket_client.send_json({"id": 6, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+    assert msg["result"] == states
+    assert not mock_async_all.called
+
+
+async def test_command_metrics(hass, websocket_client):
+    """Test getting the latency histograms of the handled commands."""
+    await websocket_client.send_json({"id": 5, "type": "ping"})
+    assert (await websocket_client.receive_json())["type"] == "pong"
+
+    await websocket_client.send_json({"id": 6, "type": "command_metrics"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    ping = msg["result"]["ping"]
+    assert ping["count"] == 1
+    assert list(ping["buckets"])[0] == "0.001"
+    assert list(ping["buckets"])[-1] == "+Inf"
+    assert sum(ping["buckets"].values()) == 1
+
 
 async def test_get_services(hass, websocket_client):
     """Test get_services command."""
@@ -1719,6 +1749,10 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         "august": datetime.timedelta(seconds=12.5),
         "isy994": datetime.timedelta(seconds=12.8),
     }
+    hass.data[DATA_IMPORT_TIME] = {"august": datetime.timedelta(seconds=0.5)}
+    entry = MockConfigEntry(domain="isy994", entry_id="isy994_entry")
+    entry.add_to_hass(hass)
+    hass.config_entries.setup_times[entry.entry_id] = 10.5
     await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
 
     msg = await websocket_client.receive_json()
@@ -1726,8 +1760,12 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
-        {"domain": "isy994", "seconds": 12.8},
+        {"domain": "august", "seconds": 12.5, "import_seconds": 0.5},
+        {
+            "domain": "isy994",
+            "seconds": 12.8,
+            "config_entries": [{"entry_id": "isy994_entry", "seconds": 10.5}],
+        },
     ]
 
 
@@ -0,0 +1,163 @@
+"""Test the shared entity subscription hub."""
+from unittest.mock import Mock, patch
+
+from homeassistant.components.websocket_api import entity_subscriptions
+from homeassistant.components.websocket_api.const import FEATURE_COALESCE_ENTITY_UPDATES
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_loads
+
+
+def _mock_connection(permissions: Mock) -> Mock:
+    """Return a mock connection which records the sent messages."""
+    connection = Mock()
+    connection.user.permissions = permissions
+    connection.supported_features = {}
+    connection.sent = []
+    connection.send_message = lambda message: connection.sent.append(message())
+    return connection
+
+
+async def test_hub_shares_listener(hass: HomeAssistant) -> None:
+    """Test subscriptions share a single state changed listener."""
+    hub = entity_subscriptions.async_get_hub(hass)
+    assert entity_subscriptions.async_get_hub(hass) is hub
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    permissions = Mock()
+    permissions.check_entity.return_value = True
+    all_connection = _mock_connection(permissions)
+    light_connection = _mock_connection(permissions)
+    switch_connection = _mock_connection(permissions)
+
+    unsubs = [
+        hub.async_subscribe(all_connection, 1, set()),
+        hub.async_subscribe(light_connection, 2, {"light.kitchen"}),
+        hub.async_subscribe(switch_connection, 3, {"switch.kitchen"}),
+    ]
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    with patch(
+        "homeassistant.components.websocket_api.messages._state_diff_event",
+        wraps=entity_subscriptions.messages._state_diff_event,
+    ) as mock_diff:
+        hass.states.async_set("light.kitchen", "on")
+        await hass.async_block_till_done()
+
+    assert len(mock_diff.mock_calls) == 1
+    assert len(permissions.check_entity.mock_calls) == 1
+    assert len(all_connection.sent) == 1
+    assert '"id":1' in all_connection.sent[0]
+    assert len(light_connection.sent) == 1
+    assert '"id":2' in light_connection.sent[0]
+    assert switch_connection.sent == []
+
+    for unsub in unsubs:
+        unsub()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == init_count
+
+
+async def test_hub_checks_permissions(hass: HomeAssistant) -> None:
+    """Test state changes are only sent to connections allowed to read them."""
+    hub = entity_subscriptions.async_get_hub(hass)
+
+    allowed = Mock()
+    allowed.check_entity.return_value = True
+    denied = Mock()
+    denied.check_entity.return_value = False
+    allowed_connection = _mock_connection(allowed)
+    denied_connection = _mock_connection(denied)
+
+    hub.async_subscribe(allowed_connection, 1, set())
+    hub.async_subscribe(denied_connection, 1, {"light.kitchen"})
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert len(allowed_connection.sent) == 1
+    assert denied_connection.sent == []
+
+
+async def test_coalescing_subscription(hass: HomeAssistant) -> None:
+    """Test changes are merged per entity while the client is lagging."""
+    hub = entity_subscriptions.async_get_hub(hass)
+    hass.states.async_set("light.kitchen", "off", {"brightness": 10})
+    hass.states.async_set("light.removed", "on")
+
+    permissions = Mock()
+    permissions.check_entity.return_value = True
+    connection = Mock()
+    connection.user.permissions = permissions
+    connection.supported_features = {FEATURE_COALESCE_ENTITY_UPDATES: 1}
+    queue = []
+    connection.send_message = queue.append
+
+    hub.async_subscribe(connection, 5, set())
+
+    # The client does not read, so all changes end up in one queued message
+    hass.states.async_set("light.kitchen", "on", {"brightness": 20})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 30})
+    hass.states.async_set("light.new", "on")
+    hass.states.async_remove("light.removed")
+    await hass.async_block_till_done()
+
+    assert len(queue) == 1
+    assert hub.async_connection_stats(connection) == [
+        {
+            "id": 5,
+            "coalesce": True,
+            "sent": 0,
+            "coalesced": 3,
+            "pending": 3,
+            "max_pending": 3,
+        }
+    ]
+
+    message = json_loads(queue.pop()())
+    assert message["id"] == 5
+    assert message["event"]["a"]["light.new"]["s"] == "on"
+    assert message["event"]["c"]["light.kitchen"]["+"]["s"] == "on"
+    assert message["event"]["c"]["light.kitchen"]["+"]["a"] == {"brightness": 30}
+    assert message["event"]["r"] == ["light.removed"]
+
+    # Once written the next change is queued again
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert len(queue) == 1
+    message = json_loads(queue.pop()())
+    assert message["event"]["c"]["light.kitchen"]["+"]["s"] == "off"
+    assert hub.async_connection_stats(connection)[0]["sent"] == 2
+
+
+async def test_subscribe_entities_stats(hass: HomeAssistant, websocket_client) -> None:
+    """Test the subscription stats of a connection."""
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "supported_features",
+            "features": {FEATURE_COALESCE_ENTITY_UPDATES: 1},
+        }
+    )
+    assert (await websocket_client.receive_json())["success"]
+
+    await websocket_client.send_json({"id": 6, "type": "subscribe_entities"})
+    assert (await websocket_client.receive_json())["success"]
+    await websocket_client.receive_json()
+
+    hass.states.async_set("light.kitchen", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.kitchen"]["s"] == "on"
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities/stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "id": 6,
+            "coalesce": True,
+            "sent": 1,
+            "coalesced": 0,
+            "pending": 0,
+            "max_pending": 0,
+        }
+    ]
@@ -4,9 +4,11 @@ from datetime import timedelta
 from unittest.mock import patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
+import msgpack
 import pytest
 
 from homeassistant.components.websocket_api import const, http
+from homeassistant.helpers.json import JSON_DUMP, json_loads
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
@@ -93,3 +95,126 @@ async def test_prepare_fail(hass, hass_ws_client, caplog):
         await hass_ws_client(hass)
 
     assert "Timeout preparing request" in caplog.text
+
+
+async def test_msgpack_messages(hass, websocket_client):
+    """Test messages are sent as MessagePack when the client supports it."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_MSGPACK_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    assert msgpack.unpackb(msg.data) == {
+        "id": 1,
+        "type": "result",
+        "success": True,
+        "result": None,
+    }
+
+    await websocket_client.send_json({"id": 2, "type": "ping"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    assert msgpack.unpackb(msg.data) == {"id": 2, "type": "pong"}
+
+    await websocket_client.send_json(
+        {"id": 3, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive()
+    assert msgpack.unpackb(msg.data)["success"]
+
+    hass.bus.async_fire("test_event", {"hello": "world"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    event_msg = msgpack.unpackb(msg.data)
+    assert event_msg["id"] == 3
+    assert event_msg["type"] == "event"
+    assert event_msg["event"]["event_type"] == "test_event"
+    assert event_msg["event"]["data"] == {"hello": "world"}
+
+
+async def test_msgpack_state_snapshots(hass, websocket_client):
+    """Test the states are serialized to MessagePack without JSON."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.bedroom", "off")
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_MSGPACK_MESSAGES: 1},
+        }
+    )
+    assert msgpack.unpackb((await websocket_client.receive()).data)["success"]
+
+    with patch(
+        "homeassistant.components.websocket_api.http.json_to_msgpack"
+    ) as mock_json_to_msgpack:
+        await websocket_client.send_json({"id": 2, "type": "get_states"})
+        msg = msgpack.unpackb((await websocket_client.receive()).data)
+        assert msg == {
+            "id": 2,
+            "type": "result",
+            "success": True,
+            "result": [
+                json_loads(JSON_DUMP(state)) for state in hass.states.async_all()
+            ],
+        }
+
+        await websocket_client.send_json(
+            {
+                "id": 3,
+                "type": "subscribe_entities",
+                "entity_ids": ["light.kitchen"],
+            }
+        )
+        assert msgpack.unpackb((await websocket_client.receive()).data)["success"]
+        msg = msgpack.unpackb((await websocket_client.receive()).data)
+        assert msg == {
+            "id": 3,
+            "type": "event",
+            "event": {
+                "a": {
+                    "light.kitchen": json_loads(
+                        JSON_DUMP(
+                            hass.states.get("light.kitchen").as_compressed_state()
+                        )
+                    )
+                }
+            },
+        }
+
+    assert not mock_json_to_msgpack.called
+
+
+async def test_msgpack_coalesced_messages(hass, websocket_client):
+    """Test coalesced messages are sent as a MessagePack array."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_MSGPACK_MESSAGES: 1,
+                const.FEATURE_COALESCE_MESSAGES: 1,
+            },
+        }
+    )
+    msg = await websocket_client.receive()
+    assert msgpack.unpackb(msg.data)["success"]
+
+    await websocket_client.send_json(
+        {"id": 2, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive()
+    assert msgpack.unpackb(msg.data)["success"]
+
+    hass.bus.async_fire("test_event", {"count": 1})
+    hass.bus.async_fire("test_event", {"count": 2})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    assert [message["event"]["data"] for message in msgpack.unpackb(msg.data)] == [
+        {"count": 1},
+        {"count": 2},
+    ]
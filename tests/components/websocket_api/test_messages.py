@@ -1,12 +1,23 @@
 """Test Websocket API messages module."""
+import msgpack
+import pytest
 
 from homeassistant.components.websocket_api.messages import (
+    CachedEventMessage,
+    CachedStateDiffMessage,
+    LazyMessage,
     _cached_event_message as lru_event_cache,
+    _cached_event_msgpack as lru_event_msgpack_cache,
     cached_event_message,
+    cached_state_diff_message,
     message_to_json,
+    message_to_msgpack,
+    msgpack_entities_added_message,
+    msgpack_result_message,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import callback
+from homeassistant.helpers.json import json_loads
 
 
 async def test_cached_event_message(hass):
@@ -94,5 +105,77 @@ async def test_message_to_json(caplog):
     assert "Unable to serialize to JSON" in caplog.text
 
 
+async def test_cached_event_message_msgpack(hass):
+    """Test event messages are serialized to MessagePack once per event."""
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"brightness": 100})
+    hass.states.async_set("light.window", "off")
+    await hass.async_block_till_done()
+
+    lru_event_msgpack_cache.cache_clear()
+    for iden in (2, 3):
+        message = CachedEventMessage(iden, events[0])
+        assert msgpack.unpackb(message.as_msgpack()) == json_loads(message())
+        assert json_loads(message()) == json_loads(
+            cached_event_message(iden, events[0])
+        )
+
+        diff_message = CachedStateDiffMessage(iden, events[1])
+        assert msgpack.unpackb(diff_message.as_msgpack()) == json_loads(
+            cached_state_diff_message(iden, events[1])
+        )
+
+    cache_info = lru_event_msgpack_cache.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+
+
+async def test_message_to_msgpack(caplog):
+    """Test we can serialize websocket messages to MessagePack."""
+    assert msgpack.unpackb(message_to_msgpack({"id": 1, "message": "xyz"})) == {
+        "id": 1,
+        "message": "xyz",
+    }
+
+    assert msgpack.unpackb(
+        message_to_msgpack({"id": 1, "message": _Unserializeable()})
+    ) == {
+        "id": 1,
+        "type": "result",
+        "success": False,
+        "error": {"code": "unknown_error", "message": "Invalid JSON in response"},
+    }
+    assert "Unable to serialize to MessagePack" in caplog.text
+
+
 class _Unserializeable:
     """A class that cannot be serialized."""
+
+
+async def test_msgpack_messages_around_packed_payload():
+    """Test building messages around payloads serialized to MessagePack."""
+    assert msgpack.unpackb(msgpack_result_message(5, msgpack.packb([1, 2]))) == {
+        "id": 5,
+        "type": "result",
+        "success": True,
+        "result": [1, 2],
+    }
+    packed_states = msgpack.packb({"light.kitchen": {"s": "on"}})
+    assert msgpack.unpackb(msgpack_entities_added_message(6, packed_states)) == {
+        "id": 6,
+        "type": "event",
+        "event": {"a": {"light.kitchen": {"s": "on"}}},
+    }
+
+
+async def test_lazy_message_is_abstract():
+    """Test lazy messages must implement both formats."""
+    with pytest.raises(TypeError):
+        LazyMessage()  # pylint: disable=abstract-class-instantiated
@@ -0,0 +1,155 @@
+"""Test the scheduler of expensive websocket commands."""
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from homeassistant.components.websocket_api.scheduler import (
+    CommandScheduler,
+    async_get_scheduler,
+)
+from homeassistant.core import HomeAssistant
+
+
+def _mock_connection(user_id: str) -> Mock:
+    """Return a mock connection of a user."""
+    connection = Mock()
+    connection.user.id = user_id
+    return connection
+
+
+async def _run(
+    scheduler: CommandScheduler,
+    connection: Mock,
+    name: str,
+    started: list[str],
+    release: asyncio.Event,
+) -> None:
+    """Run a command which holds its slot until released."""
+    async with scheduler.async_slot(connection):
+        started.append(name)
+        await release.wait()
+
+
+async def test_limits(hass: HomeAssistant) -> None:
+    """Test the global and per connection limits."""
+    scheduler = CommandScheduler(limit=3, connection_limit=2)
+    first = _mock_connection("user")
+    second = _mock_connection("user")
+    started: list[str] = []
+    release = asyncio.Event()
+
+    tasks = [
+        asyncio.create_task(_run(scheduler, first, name, started, release))
+        for name in ("first 1", "first 2", "first 3")
+    ] + [
+        asyncio.create_task(_run(scheduler, second, name, started, release))
+        for name in ("second 1", "second 2")
+    ]
+    await asyncio.sleep(0)
+
+    assert started == ["first 1", "first 2", "second 1"]
+    assert scheduler.running == 3
+    assert scheduler.waiting == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert sorted(started) == [
+        "first 1",
+        "first 2",
+        "first 3",
+        "second 1",
+        "second 2",
+    ]
+    assert scheduler.running == 0
+    assert scheduler.waiting == 0
+
+
+async def test_users_take_turns(hass: HomeAssistant) -> None:
+    """Test free slots are handed to waiting users in turn."""
+    scheduler = CommandScheduler(limit=1, connection_limit=5)
+    busy = _mock_connection("busy")
+    other = _mock_connection("other")
+    started: list[str] = []
+    releases = {name: asyncio.Event() for name in ("a", "b", "c", "d")}
+
+    tasks = [
+        asyncio.create_task(_run(scheduler, busy, name, started, releases[name]))
+        for name in ("a", "b", "c")
+    ]
+    await asyncio.sleep(0)
+    tasks.append(
+        asyncio.create_task(_run(scheduler, other, "d", started, releases["d"]))
+    )
+    await asyncio.sleep(0)
+
+    for name in ("a", "d", "b", "c"):
+        assert started[-1] == name
+        releases[name].set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    await asyncio.gather(*tasks)
+    assert started == ["a", "d", "b", "c"]
+
+
+async def test_cancel_waiting(hass: HomeAssistant) -> None:
+    """Test a cancelled command gives up its place in the queue."""
+    scheduler = CommandScheduler(limit=1, connection_limit=1)
+    connection = _mock_connection("user")
+    started: list[str] = []
+    release = asyncio.Event()
+
+    running = asyncio.create_task(
+        _run(scheduler, connection, "running", started, release)
+    )
+    waiting = asyncio.create_task(
+        _run(scheduler, connection, "waiting", started, release)
+    )
+    await asyncio.sleep(0)
+    assert scheduler.waiting == 1
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert scheduler.waiting == 0
+
+    release.set()
+    await running
+    assert started == ["running"]
+    assert scheduler.running == 0
+
+
+async def test_remove_connection(hass: HomeAssistant) -> None:
+    """Test the waiting commands of a closed connection are dropped."""
+    scheduler = CommandScheduler(limit=1, connection_limit=1)
+    closed = _mock_connection("user")
+    other = _mock_connection("user")
+    started: list[str] = []
+    release = asyncio.Event()
+
+    running = asyncio.create_task(_run(scheduler, closed, "running", started, release))
+    dropped = [
+        asyncio.create_task(_run(scheduler, closed, name, started, release))
+        for name in ("dropped 1", "dropped 2")
+    ]
+    waiting = asyncio.create_task(_run(scheduler, other, "waiting", started, release))
+    await asyncio.sleep(0)
+    assert scheduler.waiting == 3
+
+    scheduler.async_remove_connection(closed)
+    assert scheduler.waiting == 1
+    for task in dropped:
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    release.set()
+    await asyncio.gather(running, waiting)
+    assert started == ["running", "waiting"]
+    assert scheduler.running == 0
+    assert scheduler.waiting == 0
+
+
+async def test_get_scheduler(hass: HomeAssistant) -> None:
+    """Test the scheduler is shared."""
+    assert async_get_scheduler(hass) is async_get_scheduler(hass)
@@ -0,0 +1,86 @@
+"""Test the serialized state snapshot."""
+from unittest.mock import patch
+
+import msgpack
+
+from homeassistant.components.websocket_api import state_snapshot
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import JSON_DUMP, json_loads
+
+
+async def test_snapshot_reuses_fragments(hass: HomeAssistant) -> None:
+    """Test states are only serialized again after they changed."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.living_room", "off")
+    snapshot = state_snapshot.async_get_snapshot(hass)
+    assert state_snapshot.async_get_snapshot(hass) is snapshot
+
+    with patch.object(state_snapshot, "JSON_DUMP", side_effect=JSON_DUMP) as mock_dump:
+        serialized = snapshot.async_states_json()
+        assert json_loads(f"[{serialized}]") == [
+            state.as_dict() for state in hass.states.async_all()
+        ]
+        assert len(mock_dump.mock_calls) == 2
+        assert snapshot.async_states_json() is serialized
+        assert snapshot.async_states_json(
+            [hass.states.get("light.kitchen")]
+        ) == JSON_DUMP(hass.states.get("light.kitchen"))
+        assert len(mock_dump.mock_calls) == 2
+
+        hass.states.async_set("light.kitchen", "off")
+        serialized = snapshot.async_states_json()
+        assert len(mock_dump.mock_calls) == 3
+        assert json_loads(f"[{serialized}]")[0]["state"] == "off"
+
+        hass.states.async_remove("light.kitchen")
+        serialized = snapshot.async_states_json()
+        assert len(mock_dump.mock_calls) == 3
+        assert [state["entity_id"] for state in json_loads(f"[{serialized}]")] == [
+            "light.living_room"
+        ]
+
+
+async def test_snapshot_compressed_states(hass: HomeAssistant) -> None:
+    """Test the compressed states of the subscribe_entities add event."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    snapshot = state_snapshot.async_get_snapshot(hass)
+
+    serialized = snapshot.async_compressed_states_json()
+    assert json_loads(f"{{{serialized}}}") == {
+        "light.kitchen": json_loads(
+            JSON_DUMP(hass.states.get("light.kitchen").as_compressed_state())
+        )
+    }
+    assert snapshot.async_compressed_states_json([]) == ""
+
+
+async def test_snapshot_msgpack(hass: HomeAssistant) -> None:
+    """Test the states serialized to MessagePack."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.living_room", "off")
+    snapshot = state_snapshot.async_get_snapshot(hass)
+
+    packed = snapshot.async_states_msgpack()
+    assert msgpack.unpackb(packed) == [
+        json_loads(JSON_DUMP(state)) for state in hass.states.async_all()
+    ]
+    assert snapshot.async_states_msgpack() is packed
+
+    kitchen = hass.states.get("light.kitchen")
+    assert msgpack.unpackb(snapshot.async_compressed_states_msgpack([kitchen])) == {
+        "light.kitchen": json_loads(JSON_DUMP(kitchen.as_compressed_state()))
+    }
+    assert msgpack.unpackb(snapshot.async_compressed_states_msgpack([])) == {}
+
+    hass.states.async_set("light.kitchen", "off")
+    assert snapshot.async_states_msgpack() is not packed
+    assert msgpack.unpackb(snapshot.async_states_msgpack())[0]["state"] == "off"
+
+
+async def test_snapshot_unserializable_state(hass: HomeAssistant) -> None:
+    """Test None is returned when a state cannot be serialized."""
+    hass.states.async_set("light.kitchen", "on", {"bad": object()})
+    snapshot = state_snapshot.async_get_snapshot(hass)
+
+    assert snapshot.async_states_json() is None
+    assert snapshot.async_compressed_states_json() is None
@@ -0,0 +1,30 @@
+"""Test websocket API system health."""
+from homeassistant.components.websocket_api.metrics import async_get_metrics
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_system_health_info(hass, websocket_client):
+    """Test the command latencies are reported."""
+    assert await async_setup_component(hass, "system_health", {})
+
+    await websocket_client.send_json({"id": 5, "type": "ping"})
+    assert (await websocket_client.receive_json())["type"] == "pong"
+    await websocket_client.send_json({"id": 6, "type": "get_services"})
+    assert (await websocket_client.receive_json())["success"]
+
+    latencies = async_get_metrics(hass).latencies
+    assert latencies["ping"].count == 1
+    assert latencies["get_services"].count == 1
+    assert sum(latencies["ping"].as_dict()["buckets"].values()) == 1
+
+    async_get_metrics(hass).async_record("slow", 5)
+
+    info = await get_system_health_info(hass, "websocket_api")
+    assert info["limited_commands_running"] == 0
+    assert info["limited_commands_waiting"] == 0
+    assert info["commands_handled"] == 3
+    assert info["mean_latency"].endswith(" ms")
+    assert info["slowest_command"] == "slow (5000.0 ms)"
+    assert "ping" not in info
@@ -271,19 +271,37 @@ async def test_and_condition_with_template(hass):
     config = await condition.async_validate_condition_config(hass, config)
     test = await condition.async_from_config(hass, config)
 
+    # The cheaper numeric_state condition is evaluated before the template
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
 
     hass.states.async_set("sensor.temperature", 105)
     assert not test(hass)
+    assert_condition_trace(
+        {
+            "": [{"result": {"result": False}}],
+            "conditions/1": [{"result": {"result": True}}],
+            "conditions/1/entity_id/0": [{"result": {"result": True, "state": 105.0}}],
+            "conditions/0": [
+                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            ],
+        }
+    )
 
     hass.states.async_set("sensor.temperature", 100)
     assert test(hass)
@@ -313,19 +331,37 @@ async def test_and_condition_shorthand(hass):
     assert config["alias"] == "And Condition Shorthand"
     assert "and" not in config.keys()
 
+    # The cheaper numeric_state condition is evaluated before the template
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
 
     hass.states.async_set("sensor.temperature", 105)
     assert not test(hass)
+    assert_condition_trace(
+        {
+            "": [{"result": {"result": False}}],
+            "conditions/1": [{"result": {"result": True}}],
+            "conditions/1/entity_id/0": [{"result": {"result": True, "state": 105.0}}],
+            "conditions/0": [
+                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            ],
+        }
+    )
 
     hass.states.async_set("sensor.temperature", 100)
     assert test(hass)
@@ -355,24 +391,106 @@ async def test_and_condition_list_shorthand(hass):
     assert config["alias"] == "And Condition List Shorthand"
     assert "and" not in config.keys()
 
+    # The cheaper numeric_state condition is evaluated before the template
     hass.states.async_set("sensor.temperature", 120)
     assert not test(hass)
     assert_condition_trace(
         {
             "": [{"result": {"result": False}}],
-            "conditions/0": [
-                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            "conditions/1": [{"result": {"result": False}}],
+            "conditions/1/entity_id/0": [
+                {
+                    "result": {
+                        "result": False,
+                        "state": 120.0,
+                        "wanted_state_below": 110.0,
+                    }
+                }
             ],
         }
     )
 
     hass.states.async_set("sensor.temperature", 105)
     assert not test(hass)
+    assert_condition_trace(
+        {
+            "": [{"result": {"result": False}}],
+            "conditions/1": [{"result": {"result": True}}],
+            "conditions/1/entity_id/0": [{"result": {"result": True, "state": 105.0}}],
+            "conditions/0": [
+                {"result": {"entities": ["sensor.temperature"], "result": False}}
+            ],
+        }
+    )
 
     hass.states.async_set("sensor.temperature", 100)
     assert test(hass)
 
 
+async def test_conditions_by_cost(hass):
+    """Test condition configs are ordered by their cost."""
+    template_cond = {
+        "condition": "template",
+        "value_template": "{{ true }}",
+    }
+    state_cond = {"condition": "state", "entity_id": ["light.a"], "state": "on"}
+    numeric_cond = {
+        "condition": "numeric_state",
+        "entity_id": ["sensor.a", "sensor.b"],
+        "below": 10,
+    }
+    numeric_template_cond = {
+        "condition": "numeric_state",
+        "entity_id": ["sensor.a"],
+        "value_template": "{{ state.attributes.value }}",
+        "below": 10,
+    }
+    disabled_cond = {**template_cond, "enabled": False}
+    or_cond = {"condition": "or", "conditions": [state_cond, template_cond]}
+
+    assert condition.condition_cost(state_cond) == 1
+    assert condition.condition_cost(numeric_cond) == 4
+    assert condition.condition_cost(or_cond) == 11
+    assert condition.condition_cost(disabled_cond) == 0
+
+    configs = [
+        template_cond,
+        or_cond,
+        numeric_template_cond,
+        numeric_cond,
+        state_cond,
+        disabled_cond,
+    ]
+    assert [index for index, _ in condition.conditions_by_cost(configs)] == [
+        5,
+        4,
+        3,
+        0,
+        2,
+        1,
+    ]
+
+
+async def test_condition_trace_duration(hass):
+    """Test condition traces record how long the condition took."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {"condition": "state", "entity_id": "light.a", "state": "on"},
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("light.a", "on")
+    assert test(hass)
+    condition_trace = trace.trace_get(clear=False)
+    for trace_elements in condition_trace.values():
+        for trace_element in trace_elements:
+            assert trace_element.as_dict()["duration"] >= 0
+
+
 async def test_malformed_and_condition_list_shorthand(hass):
     """Test the 'and' condition list shorthand syntax check."""
     config = {
@@ -0,0 +1,100 @@
+"""Test the config item cache helper."""
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import EVENT_COMPONENT_LOADED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_item_cache
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+from homeassistant.setup import ATTR_COMPONENT
+
+from tests.common import MockConfigEntry
+
+
+async def test_config_item_cache(hass: HomeAssistant) -> None:
+    """Test storing and retrieving validated config items."""
+    cache = config_item_cache.async_get(hass)
+    assert config_item_cache.async_get(hass) is cache
+
+    raw = {"alias": "hello", "trigger": [{"platform": "event"}]}
+    validated = {"alias": "hello", "validated": True}
+    assert cache.async_get("automation", None, raw) is None
+
+    cache.async_set("automation", None, raw, validated)
+    assert cache.async_get("automation", None, dict(raw)) is validated
+    assert cache.async_get("automation", "other_id", raw) is None
+    assert cache.async_get("script", None, raw) is None
+    assert cache.async_get("automation", None, {**raw, "alias": "bye"}) is None
+
+    # Unserializable config can't be cached
+    unserializable = {"alias": object()}
+    cache.async_set("automation", None, unserializable, validated)
+    assert cache.async_get("automation", None, unserializable) is None
+
+    # Items which are no longer configured are dropped
+    cache.async_retain("automation", [])
+    assert cache.async_get("automation", None, raw) is None
+
+
+async def test_config_item_cache_invalidation(hass: HomeAssistant) -> None:
+    """Test the cache is cleared when validation inputs change."""
+    cache = config_item_cache.async_get(hass)
+    raw = {"alias": "hello"}
+    validated = {"alias": "hello"}
+
+    cache.async_set("script", "hello", raw, validated)
+    assert cache.async_get("script", "hello", raw) is validated
+
+    # Added devices and entities can't invalidate validated items
+    hass.bus.async_fire(
+        EVENT_DEVICE_REGISTRY_UPDATED, {"action": "create", "device_id": "abc"}
+    )
+    hass.bus.async_fire(
+        EVENT_ENTITY_REGISTRY_UPDATED, {"action": "create", "entity_id": "light.a"}
+    )
+    hass.bus.async_fire(
+        EVENT_ENTITY_REGISTRY_UPDATED,
+        {"action": "update", "entity_id": "light.a", "changes": {"name": None}},
+    )
+    await hass.async_block_till_done()
+    assert cache.async_get("script", "hello", raw) is validated
+
+    hass.bus.async_fire(
+        EVENT_ENTITY_REGISTRY_UPDATED,
+        {"action": "update", "entity_id": "light.b", "changes": {"entity_id": "a"}},
+    )
+    await hass.async_block_till_done()
+    assert cache.async_get("script", "hello", raw) is None
+
+    cache.async_set("script", "hello", raw, validated)
+    hass.bus.async_fire(
+        EVENT_DEVICE_REGISTRY_UPDATED, {"action": "remove", "device_id": "abc"}
+    )
+    await hass.async_block_till_done()
+    assert cache.async_get("script", "hello", raw) is None
+
+
+async def test_config_item_cache_cleared_on_load_and_unload(
+    hass: HomeAssistant,
+) -> None:
+    """Test the cache is cleared when integrations are loaded or unloaded."""
+    cache = config_item_cache.async_get(hass)
+    raw = {"alias": "hello"}
+    validated = {"alias": "hello"}
+
+    cache.async_set("script", "hello", raw, validated)
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "script"})
+    await hass.async_block_till_done()
+    assert cache.async_get("script", "hello", raw) is validated
+
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "light"})
+    await hass.async_block_till_done()
+    assert cache.async_get("script", "hello", raw) is None
+
+    entry = MockConfigEntry(domain="light")
+    entry.add_to_hass(hass)
+    cache.async_set("script", "hello", raw, validated)
+    entry.async_set_state(hass, ConfigEntryState.LOADED, None)
+    assert cache.async_get("script", "hello", raw) is validated
+
+    entry.async_set_state(hass, ConfigEntryState.NOT_LOADED, None)
+    assert cache.async_get("script", "hello", raw) is None
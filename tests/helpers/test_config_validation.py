@@ -94,6 +94,18 @@ def test_isfile():
         schema("test.txt")
 
 
+def test_validate_reusable(tmp_path):
+    """Test results depending on the file system are not reusable."""
+    schema = vol.Schema({"name": cv.string, vol.Optional("file"): cv.isfile})
+    (tmp_path / "file").write_text("")
+
+    assert cv.validate_reusable(schema, {"name": "test"}) == ({"name": "test"}, True)
+    assert cv.validate_reusable(
+        schema, {"name": "test", "file": str(tmp_path / "file")}
+    ) == ({"name": "test", "file": str(tmp_path / "file")}, False)
+    assert cv.validate_reusable(schema, {"name": "test"})[1]
+
+
 def test_url():
     """Test URL."""
     schema = vol.Schema(cv.url)
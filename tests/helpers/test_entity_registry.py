@@ -1433,3 +1433,29 @@ def test_migrate_entity_to_new_platform(hass, registry):
             new_unique_id=new_unique_id,
             new_config_entry_id=new_config_entry.entry_id,
         )
+
+
+async def test_entries_for_config_entry(hass, registry):
+    """Test the config entry index follows changes of the entries."""
+    entry_1 = MockConfigEntry(domain="light")
+    entry_2 = MockConfigEntry(domain="light")
+    first = registry.async_get_or_create(
+        "light", "hue", "1", config_entry=entry_1
+    ).entity_id
+    second = registry.async_get_or_create(
+        "light", "hue", "2", config_entry=entry_1
+    ).entity_id
+
+    registry.async_update_entity(first, name="Updated")
+    assert [
+        entry.entity_id
+        for entry in er.async_entries_for_config_entry(registry, entry_1.entry_id)
+    ] == [first, second]
+
+    registry.async_update_entity(first, config_entry_id=entry_2.entry_id)
+    registry.async_remove(second)
+    assert not er.async_entries_for_config_entry(registry, entry_1.entry_id)
+    assert [
+        entry.entity_id
+        for entry in er.async_entries_for_config_entry(registry, entry_2.entry_id)
+    ] == [first]
@@ -1848,6 +1848,43 @@ async def test_track_template_result_with_wildcard(hass):
     assert "cover.office_skylight=open" in specific_runs[0]
 
 
+async def test_track_template_result_shared_render_cache(hass):
+    """Test trackers with the render cache share a single render."""
+    hass.states.async_set("sensor.power_1", 100)
+    template_str = "{{ states('sensor.power_1') | float * 2 }}"
+    runs_1 = []
+    runs_2 = []
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as mock_render:
+        info_1 = async_track_template_result(
+            hass,
+            [TrackTemplate(Template(template_str, hass), None)],
+            lambda event, updates: runs_1.append(updates.pop().result),
+            use_render_cache=True,
+        )
+        info_2 = async_track_template_result(
+            hass,
+            [TrackTemplate(Template(template_str, hass), None)],
+            lambda event, updates: runs_2.append(updates.pop().result),
+            use_render_cache=True,
+        )
+        await hass.async_block_till_done()
+        assert len(mock_render.mock_calls) == 1
+
+        hass.states.async_set("sensor.power_1", 150)
+        await hass.async_block_till_done()
+        assert len(mock_render.mock_calls) == 2
+
+    assert runs_1 == runs_2 == [300.0]
+    info_1.async_remove()
+    info_2.async_remove()
+
+
 async def test_track_template_result_with_group(hass):
     """Test tracking template with a group."""
     hass.states.async_set("sensor.power_1", 0)
@@ -0,0 +1,156 @@
+"""Tests for the registry snapshot."""
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity_registry as er,
+    registry_snapshot,
+)
+from homeassistant.helpers.entity import EntityCategory
+
+from tests.common import MockConfigEntry
+
+
+async def _async_load_registries(hass: HomeAssistant) -> None:
+    """Load the snapshot and the registries as a fresh start would."""
+    for key in (
+        registry_snapshot.DATA_REGISTRY_SNAPSHOT,
+        dr.DATA_REGISTRY,
+        er.DATA_REGISTRY,
+    ):
+        hass.data.pop(key, None)
+    await registry_snapshot.async_load(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+
+
+async def _async_close(hass: HomeAssistant, tmp_path) -> None:
+    """Write the JSON stores and fire the close event."""
+    (tmp_path / ".storage").mkdir(exist_ok=True)
+    for key in (dr.STORAGE_KEY, er.STORAGE_KEY):
+        (tmp_path / ".storage" / key).write_text(key)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+
+@pytest.fixture
+def config_dir(hass, tmp_path):
+    """Use a temporary config dir."""
+    hass.config.config_dir = str(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_registries_loaded_from_snapshot(hass, hass_storage, config_dir):
+    """Test the registries are restored from an unchanged snapshot."""
+    await _async_load_registries(hass)
+    config_entry = MockConfigEntry(domain="light")
+    config_entry.add_to_hass(hass)
+
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:ab:cd:ef")},
+        identifiers={("hue", "1234")},
+        entry_type=dr.DeviceEntryType.SERVICE,
+        manufacturer="manufacturer",
+        model="model",
+    )
+    device_registry.async_update_device(
+        device.id, disabled_by=dr.DeviceEntryDisabler.USER
+    )
+    other_device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={("hue", "5678")}
+    )
+    device_registry.async_remove_device(other_device.id)
+
+    entity_registry = er.async_get(hass)
+    entity = entity_registry.async_get_or_create(
+        "light",
+        "hue",
+        "5678",
+        config_entry=config_entry,
+        device_id=device.id,
+        disabled_by=er.RegistryEntryDisabler.USER,
+        entity_category=EntityCategory.CONFIG,
+        capabilities={"max": 100},
+        original_name="Light",
+    )
+    entity_registry.async_update_entity(entity.entity_id, aliases={"lamp"})
+    entity_registry.async_update_entity_options(
+        entity.entity_id, "light", {"precision": 1}
+    )
+    devices = dict(device_registry.devices)
+    deleted_devices = dict(device_registry.deleted_devices)
+    entities = dict(entity_registry.entities)
+
+    await _async_close(hass, config_dir)
+
+    # The JSON stores are not read when the snapshot is valid
+    hass_storage.clear()
+    with patch("homeassistant.helpers.storage.Store.async_load") as mock_load:
+        await _async_load_registries(hass)
+    assert not mock_load.called
+
+    device_registry = dr.async_get(hass)
+    assert dict(device_registry.devices) == devices
+    assert dict(device_registry.deleted_devices) == deleted_devices
+    assert device_registry.async_get_device({("hue", "1234")}) == devices[device.id]
+    restored_device = device_registry.async_get(device.id)
+    assert restored_device.entry_type is dr.DeviceEntryType.SERVICE
+    assert restored_device.disabled_by is dr.DeviceEntryDisabler.USER
+
+    entity_registry = er.async_get(hass)
+    assert dict(entity_registry.entities) == entities
+    restored_entity = entity_registry.async_get(entity.entity_id)
+    assert restored_entity.aliases == {"lamp"}
+    assert restored_entity.disabled_by is er.RegistryEntryDisabler.USER
+    assert restored_entity.entity_category is EntityCategory.CONFIG
+    assert entity_registry.async_get_entity_id("light", "hue", "5678")
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_snapshot_ignored_for_changed_stores(hass, hass_storage, config_dir):
+    """Test a store changed after the snapshot is loaded from JSON."""
+    await _async_load_registries(hass)
+    er.async_get(hass).async_get_or_create("light", "hue", "1234")
+    dr.async_get(hass).async_get_or_create(
+        config_entry_id="1234", identifiers={("hue", "1234")}
+    )
+    await _async_close(hass, config_dir)
+
+    (config_dir / ".storage" / er.STORAGE_KEY).write_text("changed")
+    hass_storage.clear()
+    await _async_load_registries(hass)
+
+    assert not er.async_get(hass).entities
+    assert len(dr.async_get(hass).devices) == 1
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_snapshot_ignored_for_other_version(hass, hass_storage, config_dir):
+    """Test a snapshot of another version is ignored."""
+    await _async_load_registries(hass)
+    er.async_get(hass).async_get_or_create("light", "hue", "1234")
+    with patch("homeassistant.helpers.registry_snapshot.__version__", "0.1"):
+        await _async_close(hass, config_dir)
+
+    hass_storage.clear()
+    await _async_load_registries(hass)
+
+    assert not er.async_get(hass).entities
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_invalid_snapshot(hass, hass_storage, config_dir):
+    """Test an unreadable snapshot is ignored."""
+    (config_dir / ".storage").mkdir()
+    (config_dir / ".storage" / registry_snapshot.SNAPSHOT_FILE).write_text("bad")
+
+    await _async_load_registries(hass)
+
+    assert not er.async_get(hass).entities
@@ -0,0 +1,64 @@
+"""Test the startup timeline."""
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import startup_timeline
+
+
+async def test_spans_as_trace_events(hass: HomeAssistant) -> None:
+    """Test spans are exported as Chrome trace events."""
+    with startup_timeline.startup_span(hass, "not recorded", "stage"):
+        pass
+    assert startup_timeline.DATA_STARTUP_TIMELINE not in hass.data
+
+    timeline = startup_timeline.async_start_timeline(hass)
+    with patch.object(startup_timeline.time, "monotonic", side_effect=[1, 2, 3, 4]):
+        timeline._origin = 0
+        with startup_timeline.startup_span(hass, "stage 1", "stage"):
+            with startup_timeline.startup_span(
+                hass, "setup entry", "config_entry", "hue (Hue)", entry_id="abc"
+            ):
+                pass
+
+    timeline.async_stop()
+    with startup_timeline.startup_span(hass, "after startup", "stage"):
+        pass
+
+    assert timeline.as_trace_events() == {
+        "traceEvents": [
+            {
+                "name": "setup entry",
+                "cat": "config_entry",
+                "ph": "X",
+                "ts": 2_000_000,
+                "dur": 1_000_000,
+                "pid": 1,
+                "tid": 1,
+                "args": {"entry_id": "abc"},
+            },
+            {
+                "name": "stage 1",
+                "cat": "stage",
+                "ph": "X",
+                "ts": 1_000_000,
+                "dur": 3_000_000,
+                "pid": 1,
+                "tid": 2,
+            },
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 1,
+                "args": {"name": "hue (Hue)"},
+            },
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 2,
+                "args": {"name": "bootstrap"},
+            },
+        ],
+        "displayTimeUnit": "ms",
+    }
@@ -3543,6 +3543,99 @@ async def test_async_render_to_info_in_conditional(hass: HomeAssistant) -> None:
     assert_result_info(info, "oink", ["sensor.xyz", "sensor.pig"], [])
 
 
+async def test_render_cache_shares_result(hass: HomeAssistant) -> None:
+    """Test the render cache shares renders until a dependency changes."""
+    cache = template.async_get_render_cache(hass)
+    hass.states.async_set("sensor.xyz", "dog")
+    hass.states.async_set("light.a", "on")
+
+    template_str = (
+        "{{ states('sensor.xyz') }}"
+        " {{ states.light | selectattr('state', 'eq', 'on') | list | count }}"
+    )
+    info = cache.async_render_to_info(template.Template(template_str, hass))
+    assert_result_info(info, "dog 1", ["sensor.xyz"], ["light"])
+    assert cache.misses == 1
+
+    # Each caller gets its own copy of the cached render
+    tmp = template.Template(template_str, hass)
+    shared_info = cache.async_render_to_info(tmp)
+    assert shared_info is not info
+    assert shared_info.template is tmp
+    assert_result_info(shared_info, "dog 1", ["sensor.xyz"], ["light"])
+    assert shared_info.filter("light.b")
+    assert not shared_info.filter("switch.b")
+    assert cache.hits == 1
+
+    # Unrelated changes keep the cached render
+    hass.states.async_set("sensor.other", "cow")
+    cache.async_render_to_info(template.Template(template_str, hass))
+    assert cache.hits == 2
+
+    hass.states.async_set("sensor.xyz", "sheep")
+    new_info = cache.async_render_to_info(template.Template(template_str, hass))
+    assert_result_info(new_info, "sheep 1", ["sensor.xyz"], ["light"])
+    assert cache.misses == 2
+
+    hass.states.async_set("light.b", "on")
+    new_info = cache.async_render_to_info(template.Template(template_str, hass))
+    assert_result_info(new_info, "sheep 2", ["sensor.xyz"], ["light"])
+    assert cache.hits == 2
+    assert cache.misses == 3
+
+
+async def test_render_cache_keys(hass: HomeAssistant) -> None:
+    """Test the render cache keys on variables and skips uncacheable renders."""
+    cache = template.async_get_render_cache(hass)
+    tmp = template.Template("{{ name }}", hass)
+
+    assert cache.async_render_to_info(tmp, {"name": "a"}).result() == "a"
+    assert cache.async_render_to_info(tmp, {"name": "a"}).result() == "a"
+    assert cache.hits == 1
+    assert cache.async_render_to_info(tmp, {"name": "b"}).result() == "b"
+    assert cache.misses == 2
+
+    # Unserializable variables bypass the cache
+    unserializable = {"name": object()}
+    cache.async_render_to_info(tmp, unserializable)
+    cache.async_render_to_info(tmp, unserializable)
+    assert cache.hits == 1
+
+    # Renders depending on time or raising errors are not cached
+    tmp = template.Template("{{ now() }}", hass)
+    cache.async_render_to_info(tmp)
+    cache.async_render_to_info(tmp)
+    tmp = template.Template("{{ x }}", hass)
+    info = cache.async_render_to_info(tmp, strict=True)
+    assert info.exception is not None
+    cache.async_render_to_info(tmp, strict=True)
+    assert cache.hits == 1
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ area_name('sensor.xyz') }}",
+        "{{ 'sensor.xyz' | area_entities }}",
+        "{{ device_attr('abc', 'name') }}",
+        "{{ [1, 2, 3] | random }}",
+        "{{ lipsum() }}",
+        "{{ 'abc' is is_device_attr('name', 'x') }}",
+        "{{ states('sensor.xyz') }} {{ integration_entities('demo') }}",
+    ],
+)
+async def test_render_cache_skips_untracked(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test renders depending on more than the recorded states are not cached."""
+    cache = template.async_get_render_cache(hass)
+    tmp = template.Template(template_str, hass)
+
+    cache.async_render_to_info(tmp)
+    cache.async_render_to_info(tmp)
+    assert cache.hits == 0
+
+
 def test_jinja_namespace(hass: HomeAssistant) -> None:
     """Test Jinja's namespace command can be used."""
     test_template = template.Template(
@@ -4062,6 +4155,30 @@ async def test_undefined_variable(hass, caplog):
     )
 
 
+async def test_template_states_reuse_wrappers(hass: HomeAssistant) -> None:
+    """Test template state wrappers are reused while the state is unchanged."""
+    hass.states.async_set("sensor.power_1", "100")
+    hass.states.async_set("sensor.power_2", "200")
+    all_states = template.AllStates(hass)
+
+    first = list(all_states.sensor)
+    assert [state.state for state in first] == ["100", "200"]
+    assert all(a is b for a, b in zip(first, all_states.sensor))
+    assert all_states.sensor.power_1 is all_states.sensor.power_1
+
+    hass.states.async_set("sensor.power_2", "300")
+    second = list(all_states.sensor)
+    assert second[0] is first[0]
+    assert second[1] is not first[1]
+    assert second[1].state == "300"
+
+    hass.states.async_remove("sensor.power_1")
+    hass.states.async_set("sensor.power_1", "50")
+    third = list(all_states)
+    assert third[0] is not first[0]
+    assert [state.state for state in third] == ["50", "300"]
+
+
 async def test_template_states_blocks_setitem(hass: HomeAssistant) -> None:
     """Test we cannot setitem on TemplateStates."""
     hass.states.async_set("light.new", STATE_ON)
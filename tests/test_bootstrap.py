@@ -2,16 +2,18 @@
 # pylint: disable=protected-access
 import asyncio
 import glob
+import json
 import os
 from unittest.mock import Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, runner
 import homeassistant.config as config_util
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.startup_timeline import DATA_STARTUP_TIMELINE
 
 from tests.common import (
     MockModule,
@@ -504,6 +506,53 @@ async def test_setup_hass(
     assert hass == core.async_get_hass()
 
 
+async def test_setup_hass_startup_trace(
+    mock_enable_logging,
+    mock_is_virtual_env,
+    mock_mount_local_lib_path,
+    mock_ensure_config_exists,
+    mock_process_ha_config_upgrade,
+    event_loop,
+    tmp_path,
+):
+    """Test the startup phases are written as a Chrome trace."""
+    trace_path = tmp_path / "startup_trace.json"
+    with patch(
+        "homeassistant.config.async_hass_config_yaml",
+        return_value={"browser": {}, "frontend": {}},
+    ), patch.object(bootstrap, "LOG_SLOW_STARTUP_INTERVAL", 5000):
+        hass = await bootstrap.async_setup_hass(
+            runner.RuntimeConfig(
+                config_dir=get_test_config_dir(),
+                skip_pip=True,
+                startup_trace=str(trace_path),
+            ),
+        )
+
+    trace = json.loads(trace_path.read_text())
+    lanes = {
+        event["tid"]: event["args"]["name"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    spans = {
+        (lanes[event["tid"]], event["name"])
+        for event in trace["traceEvents"]
+        if event["ph"] == "X"
+    }
+    assert {
+        ("bootstrap", "load configuration.yaml"),
+        ("bootstrap", "load registries"),
+        ("entity_registry", "load entity_registry"),
+        ("bootstrap", "set up core integrations"),
+        ("bootstrap", "stage 2"),
+        ("bootstrap", "wrap up"),
+        ("browser", "validate config"),
+        ("browser", "setup"),
+    } <= spans
+    assert not hass.data[DATA_STARTUP_TIMELINE].recording
+
+
 async def test_setup_hass_takes_longer_than_log_slow_startup(
     mock_enable_logging,
     mock_is_virtual_env,
@@ -795,3 +844,61 @@ async def test_warning_logged_on_wrap_up_timeout(hass, caplog):
         await hass.async_block_till_done()
 
     assert "Setup timed out for bootstrap - moving forward" in caplog.text
+
+
+async def test_preload_integrations(hass):
+    """Test integrations are imported after their dependencies."""
+    imported = []
+
+    def mock_integration_to_preload(
+        domain, dependencies, side_effect=None, requirements=()
+    ):
+        """Return an integration which records its import."""
+
+        def preload(platform_names):
+            if side_effect:
+                raise side_effect
+            assert set(dependencies) <= set(imported)
+            imported.append(domain)
+
+        return Mock(
+            domain=domain,
+            all_dependencies=set(dependencies),
+            requirements=list(requirements),
+            preload=Mock(side_effect=preload),
+        )
+
+    integrations = [
+        mock_integration_to_preload("comp_c", ["comp_a", "comp_b"]),
+        mock_integration_to_preload("comp_b", ["comp_a"]),
+        mock_integration_to_preload("comp_a", []),
+        mock_integration_to_preload("comp_broken", [], ImportError),
+        mock_integration_to_preload("comp_missing", [], requirements=["missing==1"]),
+        mock_integration_to_preload("comp_d", ["comp_missing"]),
+    ]
+
+    with patch(
+        "homeassistant.bootstrap.is_installed",
+        side_effect=lambda requirement: requirement != "missing==1",
+    ):
+        await bootstrap._async_preload_integrations(hass, integrations, {"light"})
+
+    # Integrations are not imported before their requirements are installed
+    assert imported == ["comp_a", "comp_b", "comp_c"]
+    assert not integrations[4].preload.called
+    assert not integrations[5].preload.called
+    integrations[0].preload.assert_called_once_with({"light"})
+    assert set(hass.data[bootstrap.DATA_IMPORT_TIME]) == {"comp_a", "comp_b", "comp_c"}
+
+
+async def test_preload_imports_available_platforms(hass):
+    """Test preloading an integration imports the platforms it provides."""
+    integration = await loader.async_get_integration(hass, "demo")
+
+    with patch("homeassistant.loader.importlib.import_module") as mock_import:
+        integration.preload({"light", "not_a_platform"})
+
+    assert [call[1][0] for call in mock_import.mock_calls] == [
+        "homeassistant.components.demo",
+        "homeassistant.components.demo.light",
+    ]
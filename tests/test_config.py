@@ -1253,6 +1253,171 @@ async def test_component_config_exceptions(hass, caplog):
     assert "Unable to import test_domain: No such file or directory" in caplog.text
 
 
+async def test_component_config_validation_cached(hass):
+    """Test unchanged config blocks are not validated again."""
+    config_schema = Mock(
+        side_effect=vol.Schema(
+            {"test_domain": {"value": vol.Coerce(int)}}, extra=vol.ALLOW_EXTRA
+        )
+    )
+    integration = Mock(
+        domain="test_domain",
+        get_platform=Mock(return_value=None),
+        get_component=Mock(return_value=Mock(CONFIG_SCHEMA=config_schema)),
+    )
+
+    config = {"test_domain": {"value": "1"}, "other": {"value": "2"}}
+    validated = await config_util.async_process_component_config(
+        hass, config, integration
+    )
+    assert validated == {"test_domain": {"value": 1}, "other": {"value": "2"}}
+    validated["test_domain"]["value"] = 5
+
+    config = {"test_domain": {"value": "1"}, "other": {"value": "3"}}
+    assert await config_util.async_process_component_config(
+        hass, config, integration
+    ) == {"test_domain": {"value": 1}, "other": {"value": "3"}}
+    assert len(config_schema.mock_calls) == 1
+
+    config = {"test_domain": {"value": "2"}}
+    assert await config_util.async_process_component_config(
+        hass, config, integration
+    ) == {"test_domain": {"value": 2}}
+    assert len(config_schema.mock_calls) == 2
+
+    # Invalid config is not cached
+    config = {"test_domain": {"value": "invalid"}}
+    for _ in range(2):
+        assert (
+            await config_util.async_process_component_config(hass, config, integration)
+            is None
+        )
+    assert len(config_schema.mock_calls) == 4
+
+
+async def test_platform_config_validation_cached(hass):
+    """Test only changed platform blocks are validated again."""
+    base_schema = Mock(side_effect=vol.Schema({"platform": str, "value": str}))
+    platform_schema = Mock(
+        side_effect=vol.Schema({"platform": str, "value": vol.Coerce(int)})
+    )
+    integration = Mock(
+        domain="test_domain",
+        get_platform=Mock(return_value=None),
+        get_component=Mock(
+            return_value=Mock(
+                spec=["PLATFORM_SCHEMA_BASE"], PLATFORM_SCHEMA_BASE=base_schema
+            )
+        ),
+    )
+    p_integration = Mock(get_platform=Mock(return_value=Mock(spec=["PLATFORM_SCHEMA"])))
+    p_integration.get_platform.return_value.PLATFORM_SCHEMA = platform_schema
+
+    with patch(
+        "homeassistant.config.async_get_integration_with_requirements",
+        return_value=p_integration,
+    ):
+        config = {
+            "test_domain": [
+                {"platform": "test_platform", "value": "1"},
+                {"platform": "test_platform", "value": "2"},
+            ]
+        }
+        assert await config_util.async_process_component_config(
+            hass, config, integration
+        ) == {
+            "test_domain": [
+                {"platform": "test_platform", "value": 1},
+                {"platform": "test_platform", "value": 2},
+            ]
+        }
+        assert len(base_schema.mock_calls) == 2
+        assert len(platform_schema.mock_calls) == 2
+
+        config["test_domain"][1]["value"] = "3"
+        assert await config_util.async_process_component_config(
+            hass, config, integration
+        ) == {
+            "test_domain": [
+                {"platform": "test_platform", "value": 1},
+                {"platform": "test_platform", "value": 3},
+            ]
+        }
+        assert len(base_schema.mock_calls) == 3
+        assert len(platform_schema.mock_calls) == 3
+
+
+async def test_config_validation_cache_copies_templates(hass):
+    """Test cached templates are not shared."""
+    schema = Mock(side_effect=vol.Schema({"value": cv.template}))
+
+    first = config_util.async_validate_cached(hass, schema, {"value": "{{ 1 }}"})
+    first["value"].hass = hass
+    second = config_util.async_validate_cached(hass, schema, {"value": "{{ 1 }}"})
+
+    assert len(schema.mock_calls) == 1
+    assert second["value"].template == first["value"].template
+    assert second["value"] is not first["value"]
+    assert second["value"].hass is None
+
+
+async def test_config_validation_cache_skips_side_effects(hass, caplog):
+    """Test results of validators with side effects are not cached."""
+    schema = Mock(
+        side_effect=vol.Schema(
+            vol.All(cv.deprecated("old"), {vol.Optional("old"): int, "new": int})
+        )
+    )
+
+    for _ in range(2):
+        caplog.clear()
+        assert config_util.async_validate_cached(
+            hass, schema, {"old": 1, "new": 2}
+        ) == {"old": 1, "new": 2}
+        assert "The 'old' option is deprecated" in caplog.text
+    assert len(schema.mock_calls) == 2
+
+    for _ in range(2):
+        config_util.async_validate_cached(hass, schema, {"new": 2})
+    assert len(schema.mock_calls) == 3
+
+
+async def test_config_validation_cache_key(hass):
+    """Test the cache key tells apart equal values of different types."""
+    schema = Mock(side_effect=vol.Schema({"value": vol.Any(bool, int)}))
+
+    assert config_util.async_validate_cached(hass, schema, {"value": True}) == {
+        "value": True
+    }
+    assert config_util.async_validate_cached(hass, schema, {"value": 1}) == {"value": 1}
+    assert len(schema.mock_calls) == 2
+    assert config_util.config_key({"value": object()}) is None
+
+
+async def test_config_validation_cache_keeps_location(hass):
+    """Test equal blocks from different files keep their own location."""
+    schema = Mock(side_effect=lambda config: config)
+
+    def loaded_block(config_file, line):
+        """Return a block as loaded by the YAML loader."""
+        block = OrderedDict(value=1)
+        block.__config_file__ = config_file
+        block.__line__ = line
+        return block
+
+    for config_file, line in (("a.yaml", 1), ("b.yaml", 5), ("a.yaml", 1)):
+        validated = config_util.async_validate_cached(
+            hass, schema, loaded_block(config_file, line)
+        )
+        assert (validated.__config_file__, validated.__line__) == (config_file, line)
+    assert len(schema.mock_calls) == 2
+
+    # Values are compared without location on request
+    assert config_util.config_key(
+        loaded_block("a.yaml", 1), location=False
+    ) == config_util.config_key(loaded_block("b.yaml", 5), location=False)
+
+
 @pytest.mark.parametrize(
     "domain, schema, expected",
     [
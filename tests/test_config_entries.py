@@ -3537,3 +3537,245 @@ async def test_options_flow_options_not_mutated() -> None:
         "sub_list": ["one", "two"],
     }
     assert entry.options == {"sub_dict": {"1": "one"}, "sub_list": ["one"]}
+
+
+async def test_setup_entries_concurrency_limit(hass):
+    """Test the number of entries setting up at the same time is limited."""
+    running = 0
+    max_running = 0
+    release = asyncio.Event()
+
+    async def mock_setup_entry(hass, entry):
+        """Mock setting up an entry."""
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+        return True
+
+    mock_integration(hass, MockModule("test", async_setup_entry=mock_setup_entry))
+    mock_entity_platform(hass, "config_flow.test", None)
+    entries = [MockConfigEntry(domain="test") for _ in range(5)]
+    for entry in entries:
+        entry.add_to_hass(hass)
+
+    with patch.object(hass.config_entries, "_setup_semaphore", asyncio.Semaphore(2)):
+        setup_task = hass.async_create_task(async_setup_component(hass, "test", {}))
+        await asyncio.sleep(0.01)
+        assert running == 2
+        release.set()
+        assert await setup_task
+
+    assert max_running == 2
+    assert all(
+        entry.state is config_entries.ConfigEntryState.LOADED for entry in entries
+    )
+
+
+async def test_entry_waiting_for_integration_releases_slot(hass):
+    """Test an entry waiting for another integration gives up its slot."""
+    inner_entry = MockConfigEntry(domain="comp")
+    inner_entry.add_to_hass(hass)
+    mock_integration(
+        hass, MockModule("comp", async_setup_entry=AsyncMock(return_value=True))
+    )
+    mock_entity_platform(hass, "config_flow.comp", None)
+
+    async def mock_setup_entry(hass, entry):
+        """Set up the other integration from within the setup."""
+        return await async_setup_component(hass, "comp", {})
+
+    outer_entry = MockConfigEntry(domain="test")
+    outer_entry.add_to_hass(hass)
+    mock_integration(hass, MockModule("test", async_setup_entry=mock_setup_entry))
+    mock_entity_platform(hass, "config_flow.test", None)
+
+    with patch.object(hass.config_entries, "_setup_semaphore", asyncio.Semaphore(1)):
+        async with asyncio.timeout(5):
+            assert await async_setup_component(hass, "test", {})
+
+    assert outer_entry.state is config_entries.ConfigEntryState.LOADED
+    assert inner_entry.state is config_entries.ConfigEntryState.LOADED
+
+
+async def test_setup_dependent_entries_more_than_slots(hass):
+    """Test entries waiting for entries of a started integration don't deadlock."""
+    comp_started = asyncio.Event()
+    release_comp = asyncio.Event()
+    running = 0
+    max_running = 0
+
+    async def mock_comp_setup(hass, config):
+        """Hold the setup of the integration until the other entries wait."""
+        comp_started.set()
+        await release_comp.wait()
+        return True
+
+    async def mock_comp_setup_entry(hass, entry):
+        """Mock setting up an entry."""
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return True
+
+    async def mock_test_setup_entry(hass, entry):
+        """Wait for the other integration from within the setup."""
+        return await async_setup_component(hass, "comp", {})
+
+    mock_integration(
+        hass,
+        MockModule(
+            "comp", async_setup=mock_comp_setup, async_setup_entry=mock_comp_setup_entry
+        ),
+    )
+    mock_entity_platform(hass, "config_flow.comp", None)
+    mock_integration(hass, MockModule("test", async_setup_entry=mock_test_setup_entry))
+    mock_entity_platform(hass, "config_flow.test", None)
+    comp_entries = [MockConfigEntry(domain="comp") for _ in range(3)]
+    test_entries = [MockConfigEntry(domain="test") for _ in range(3)]
+    for entry in (*comp_entries, *test_entries):
+        entry.add_to_hass(hass)
+
+    with patch.object(hass.config_entries, "_setup_semaphore", asyncio.Semaphore(2)):
+        # The integration is set up outside of any setup slot
+        comp_task = hass.async_create_task(async_setup_component(hass, "comp", {}))
+        await comp_started.wait()
+        test_task = hass.async_create_task(async_setup_component(hass, "test", {}))
+        await asyncio.sleep(0.01)
+        release_comp.set()
+        async with asyncio.timeout(5):
+            assert await comp_task
+            assert await test_task
+
+    assert max_running == 2
+    assert all(
+        entry.state is config_entries.ConfigEntryState.LOADED
+        for entry in (*comp_entries, *test_entries)
+    )
+    assert not hass.config_entries._setup_slot_holders
+
+
+async def test_task_created_in_setup_does_not_hold_slot(hass):
+    """Test tasks created by an entry setup don't skip the limit."""
+    release = asyncio.Event()
+    other_entry = MockConfigEntry(domain="test", title="other")
+    setup_started = []
+
+    async def mock_setup_entry(hass, entry):
+        """Set up another entry from a task created during the setup."""
+        setup_started.append(entry.title)
+        if entry.title == "outer":
+            hass.async_create_task(
+                other_entry.async_setup(hass, limit_concurrency=True)
+            )
+            await release.wait()
+        return True
+
+    mock_integration(hass, MockModule("test", async_setup_entry=mock_setup_entry))
+    mock_entity_platform(hass, "config_flow.test", None)
+    outer_entry = MockConfigEntry(domain="test", title="outer")
+    outer_entry.add_to_hass(hass)
+    other_entry.add_to_hass(hass)
+
+    with patch.object(hass.config_entries, "_setup_semaphore", asyncio.Semaphore(1)):
+        outer_task = hass.async_create_task(
+            outer_entry.async_setup(hass, limit_concurrency=True)
+        )
+        await asyncio.sleep(0.01)
+        assert setup_started == ["outer"]
+        release.set()
+        await outer_task
+        await hass.async_block_till_done()
+
+    assert setup_started == ["outer", "other"]
+    assert other_entry.state is config_entries.ConfigEntryState.LOADED
+
+
+async def test_slow_entry_continues_in_background_during_startup(hass, caplog):
+    """Test a slow entry does not hold up its integration during startup."""
+    release = asyncio.Event()
+
+    async def mock_setup_entry(hass, entry):
+        """Mock setting up an entry."""
+        if entry.title == "slow":
+            await release.wait()
+        return True
+
+    mock_integration(hass, MockModule("test", async_setup_entry=mock_setup_entry))
+    mock_entity_platform(hass, "config_flow.test", None)
+    slow_entry = MockConfigEntry(domain="test", title="slow")
+    slow_entry.add_to_hass(hass)
+    fast_entry = MockConfigEntry(domain="test", title="fast")
+    fast_entry.add_to_hass(hass)
+
+    hass.state = CoreState.starting
+    with patch("homeassistant.config_entries.ENTRY_SETUP_STARTUP_WAIT", 0.01):
+        assert await async_setup_component(hass, "test", {})
+
+    assert "test" in hass.config.components
+    assert fast_entry.state is config_entries.ConfigEntryState.LOADED
+    assert slow_entry.state is config_entries.ConfigEntryState.SETUP_IN_PROGRESS
+    assert (
+        "Setup of config entry 'slow' for test integration is taking over"
+        in caplog.text
+    )
+
+    release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert slow_entry.state is config_entries.ConfigEntryState.LOADED
+    assert not hass.config_entries._background_setups
+
+
+async def test_background_setup_cancelled_on_shutdown(hass):
+    """Test an entry still setting up in the background is not left in progress."""
+    unloaded = Mock()
+
+    async def mock_setup_entry(hass, entry):
+        """Mock an entry which never finishes setting up."""
+        entry.async_on_unload(unloaded)
+        await asyncio.Event().wait()
+
+    mock_integration(hass, MockModule("test", async_setup_entry=mock_setup_entry))
+    mock_entity_platform(hass, "config_flow.test", None)
+    entry = MockConfigEntry(domain="test")
+    entry.add_to_hass(hass)
+
+    hass.state = CoreState.starting
+    with patch("homeassistant.config_entries.ENTRY_SETUP_STARTUP_WAIT", 0.01):
+        assert await async_setup_component(hass, "test", {})
+    assert entry.state is config_entries.ConfigEntryState.SETUP_IN_PROGRESS
+
+    await hass.config_entries._async_shutdown(None)
+
+    assert entry.state is config_entries.ConfigEntryState.NOT_LOADED
+    assert not hass.config_entries._background_setups
+    assert len(unloaded.mock_calls) == 1
+
+
+async def test_setup_time_accounted_per_entry(hass):
+    """Test the time spent setting up is accounted per entry over retries."""
+    entry = MockConfigEntry(domain="test")
+    mock_setup_entry = AsyncMock(side_effect=ConfigEntryNotReady)
+    mock_integration(hass, MockModule("test", async_setup_entry=mock_setup_entry))
+    mock_entity_platform(hass, "config_flow.test", None)
+
+    with patch(
+        "homeassistant.config_entries.time.monotonic", side_effect=[10, 12, 20, 21]
+    ), patch("homeassistant.config_entries.async_call_later") as mock_call:
+        entry.add_to_hass(hass)
+        await entry.async_setup(hass)
+        assert hass.config_entries.setup_times[entry.entry_id] == 2
+
+        mock_setup_entry.side_effect = None
+        mock_setup_entry.return_value = True
+        await mock_call.mock_calls[0][1][2](None)
+
+    assert entry.state is config_entries.ConfigEntryState.LOADED
+    assert hass.config_entries.setup_times[entry.entry_id] == 3
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    assert entry.entry_id not in hass.config_entries.setup_times
@@ -1492,6 +1492,40 @@ async def test_async_all(hass):
     } == {"light.bowl", "light.frog", "switch.link"}
 
 
+async def test_async_all_sorted(hass):
+    """Test async_all_sorted."""
+
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.frog", "on")
+    hass.states.async_set("vacuum.floor", "on")
+
+    assert [state.entity_id for state in hass.states.async_all_sorted()] == [
+        "light.frog",
+        "switch.link",
+        "vacuum.floor",
+    ]
+    assert [state.entity_id for state in hass.states.async_all_sorted("light")] == [
+        "light.frog"
+    ]
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.frog", "off")
+    assert [
+        (state.entity_id, state.state)
+        for state in hass.states.async_all_sorted("LIGHT")
+    ] == [("light.bowl", "on"), ("light.frog", "off")]
+
+    hass.states.async_remove("light.bowl")
+    hass.states.async_remove("switch.link")
+    assert [state.entity_id for state in hass.states.async_all_sorted()] == [
+        "light.frog",
+        "vacuum.floor",
+    ]
+    assert [state.entity_id for state in hass.states.async_all_sorted("light")] == [
+        "light.frog"
+    ]
+
+
 async def test_async_entity_ids_count(hass):
     """Test async_entity_ids_count."""
 
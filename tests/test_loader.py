@@ -1,4 +1,7 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import pathlib
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -6,8 +9,10 @@ import pytest
 from homeassistant import core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__ as HA_VERSION
+from homeassistant.util import dt as dt_util
 
-from tests.common import MockModule, mock_integration
+from tests.common import MockModule, async_fire_time_changed, mock_integration
 
 
 async def test_component_dependencies(hass):
@@ -718,3 +723,93 @@ async def test_loggers(hass):
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+async def test_manifest_cache(hass, hass_storage):
+    """Test unchanged manifests are not parsed again."""
+    manifest_path = pathlib.Path(http.__file__).parent / "manifest.json"
+    manifest_stat = manifest_path.stat()
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {
+            "ha_version": HA_VERSION,
+            "manifests": {
+                str(manifest_path): [
+                    manifest_stat.st_mtime_ns,
+                    manifest_stat.st_size,
+                    {"domain": "http", "name": "Cached HTTP"},
+                ]
+            },
+        },
+    }
+    hass.data.pop(loader.DATA_MANIFEST_CACHE, None)
+    hass.data.pop(loader.DATA_INTEGRATIONS, None)
+
+    integration = await loader.async_get_integration(hass, "http")
+    assert integration.name == "Cached HTTP"
+
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name == "Philips Hue"
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    manifests = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]["manifests"]
+    hue_path = pathlib.Path(hue.__file__).parent / "manifest.json"
+    assert manifests[str(hue_path)][2]["name"] == "Philips Hue"
+    assert "is_built_in" not in manifests[str(hue_path)][2]
+
+
+@pytest.mark.parametrize(
+    "ha_version,mtime_offset",
+    [(HA_VERSION, 1), ("2021.1.0", 0)],
+)
+async def test_manifest_cache_outdated(hass, hass_storage, ha_version, mtime_offset):
+    """Test changed manifests and manifests of other versions are parsed."""
+    manifest_path = pathlib.Path(http.__file__).parent / "manifest.json"
+    manifest_stat = manifest_path.stat()
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {
+            "ha_version": ha_version,
+            "manifests": {
+                str(manifest_path): [
+                    manifest_stat.st_mtime_ns + mtime_offset,
+                    manifest_stat.st_size,
+                    {"domain": "http", "name": "Cached HTTP"},
+                ]
+            },
+        },
+    }
+    hass.data.pop(loader.DATA_MANIFEST_CACHE, None)
+    hass.data.pop(loader.DATA_INTEGRATIONS, None)
+
+    integration = await loader.async_get_integration(hass, "http")
+    assert integration.name == "HTTP"
+
+
+async def test_async_get_platform_imports_in_executor(hass):
+    """Test platforms not imported yet are imported in the executor."""
+    integration = await loader.async_get_integration(hass, "hue")
+
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor, patch.dict(sys.modules):
+        sys.modules.pop("homeassistant.components.hue.switch", None)
+        assert (await integration.async_get_platform("switch")).__name__ == (
+            "homeassistant.components.hue.switch"
+        )
+        assert len(mock_executor.mock_calls) == 1
+
+        # The cache is populated in the event loop
+        assert hass.data[loader.DATA_COMPONENTS]["hue.switch"].__name__ == (
+            "homeassistant.components.hue.switch"
+        )
+
+        # Imported platforms are returned right away
+        assert await integration.async_get_platform("switch")
+        assert await integration.async_get_platform("light") is hue_light
+        assert len(mock_executor.mock_calls) == 1
@@ -436,15 +436,16 @@ async def test_discovery_requirements_ssdp(hass):
     ) as mock_process:
         await async_get_integration_with_requirements(hass, "ssdp_comp")
 
-    assert len(mock_process.mock_calls) == 5
+    assert len(mock_process.mock_calls) == 6
     assert mock_process.mock_calls[0][1][1] == ssdp.requirements
     # Ensure zeroconf is a dep for ssdp
-    assert {
-        mock_process.mock_calls[1][1][0],
-        mock_process.mock_calls[2][1][0],
-        mock_process.mock_calls[3][1][0],
-        mock_process.mock_calls[4][1][0],
-    } == {"http", "network", "recorder", "zeroconf"}
+    assert {call[1][0] for call in mock_process.mock_calls[1:]} == {
+        "http",
+        "network",
+        "recorder",
+        "websocket_api",
+        "zeroconf",
+    }
 
 
 @pytest.mark.parametrize(
@@ -466,7 +467,8 @@ async def test_discovery_requirements_zeroconf(hass, partial_manifest):
     ) as mock_process:
         await async_get_integration_with_requirements(hass, "comp")
 
-    assert len(mock_process.mock_calls) == 4  # zeroconf also depends on http
+    # zeroconf also depends on http and websocket_api
+    assert len(mock_process.mock_calls) == 5
     assert mock_process.mock_calls[0][1][1] == zeroconf.requirements
 
 
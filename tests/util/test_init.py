@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
+import slugify as unicode_slug
 
 from homeassistant import util
 import homeassistant.util.dt as dt_util
@@ -61,6 +62,33 @@ def test_slugify():
     assert util.slugify(None) == ""
 
 
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Test More",
+        "  --Test__More--  ",
+        "It's 1,000,000 o'clock, 5, 6",
+        "tab\tand\nnewline",
+        "UPPER_lower-123",
+        "!@#$%^*()",
+        "a.b/c\\d",
+    ],
+)
+@pytest.mark.parametrize("separator", ["_", "-", ""])
+def test_slugify_ascii_matches_library(text, separator):
+    """Test the ASCII fast path of slugify matches python-slugify."""
+    expected = unicode_slug.slugify(text, separator=separator) or "unknown"
+    with patch("homeassistant.util.unicode_slug.slugify") as mock_slugify:
+        assert util.slugify(text, separator=separator) == expected
+    assert not mock_slugify.called
+
+
+def test_slugify_html_entities():
+    """Test text with HTML entities is slugified by python-slugify."""
+    assert util.slugify("Tom &amp; Jerry") == "tom_jerry"
+    assert util.slugify("&#36;&#x24;") == "unknown"
+
+
 def test_repr_helper():
     """Test repr_helper."""
     assert util.repr_helper("A") == "A"
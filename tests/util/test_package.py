@@ -255,21 +255,16 @@ def test_check_package_zip():
     assert not package.is_installed(TEST_ZIP_REQ)
 
 
-def test_get_distribution_falls_back_to_version():
-    """Test for get_distribution failing and fallback to version."""
+def test_check_package_normalized_name():
+    """Test for a package requested with a differently spelled name."""
     first_package = list(pkg_resources.working_set)[0]
     installed_package = first_package.project_name
     installed_version = first_package.version
 
-    with patch(
-        "homeassistant.util.package.pkg_resources.get_distribution",
-        side_effect=pkg_resources.ExtractionError,
-    ):
-        assert package.is_installed(installed_package)
-        assert package.is_installed(f"{installed_package}=={installed_version}")
-        assert package.is_installed(f"{installed_package}>={installed_version}")
-        assert package.is_installed(f"{installed_package}<={installed_version}")
-        assert not package.is_installed(f"{installed_package}<{installed_version}")
+    assert package.is_installed(installed_package.upper())
+    assert package.is_installed(
+        f"{installed_package.replace('-', '_')}=={installed_version}"
+    )
 
 
 def test_check_package_previous_failed_install():
@@ -279,8 +274,39 @@ def test_check_package_previous_failed_install():
     installed_version = first_package.version
 
     with patch(
-        "homeassistant.util.package.pkg_resources.get_distribution",
-        side_effect=pkg_resources.ExtractionError,
-    ), patch("homeassistant.util.package.version", return_value=None):
+        "homeassistant.util.package.get_installed_versions",
+        return_value={package.canonicalize_name(installed_package): None},
+    ):
         assert not package.is_installed(installed_package)
         assert not package.is_installed(f"{installed_package}=={installed_version}")
+
+
+def test_installed_versions_cached():
+    """Test the installed packages are indexed once until sys.path changes."""
+    package.invalidate_installed_versions()
+    with patch(
+        "homeassistant.util.package.distributions", wraps=package.distributions
+    ) as mock_distributions:
+        versions = package.get_installed_versions()
+        assert package.get_installed_versions() is versions
+        assert package.is_installed(list(pkg_resources.working_set)[0].project_name)
+        assert len(mock_distributions.mock_calls) == 1
+
+        with patch.object(package.sys, "path", [*sys.path, "/non_existing_dir"]):
+            package.get_installed_versions()
+        assert len(mock_distributions.mock_calls) == 2
+
+        package.invalidate_installed_versions()
+        package.get_installed_versions()
+        assert len(mock_distributions.mock_calls) == 3
+
+
+def test_installed_versions_invalidated_by_install(
+    mock_sys, mock_popen, mock_env_copy, mock_venv
+):
+    """Test a successful install invalidates the installed packages."""
+    with patch(
+        "homeassistant.util.package.invalidate_installed_versions"
+    ) as mock_invalidate:
+        assert package.install_package(TEST_NEW_REQ, False)
+    assert len(mock_invalidate.mock_calls) == 1
@@ -1,4 +1,5 @@
 """Test Home Assistant yaml loader."""
+import hashlib
 import importlib
 import io
 import os
@@ -9,10 +10,15 @@ from unittest.mock import patch
 import pytest
 import yaml as pyyaml
 
-from homeassistant.config import YAML_CONFIG_FILE, load_yaml_config_file
+from homeassistant.config import (
+    YAML_CONFIG_FILE,
+    load_yaml_config_file,
+    load_yaml_config_file_cached,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.yaml as yaml
 from homeassistant.util.yaml import loader as yaml_loader
+from homeassistant.util.yaml.cache import NodeCache
 
 from tests.common import get_test_config_dir, patch_yaml_files
 
@@ -34,6 +40,13 @@ def try_both_loaders(request):
     importlib.reload(yaml_loader)
 
 
+@pytest.fixture
+def disable_c_loader_for_cache():
+    """Use the node cache, it is skipped when the C loader is available."""
+    with patch.object(yaml_loader, "HAS_C_LOADER", False):
+        yield
+
+
 @pytest.fixture(params=["enable_c_dumper", "disable_c_dumper"])
 def try_both_dumpers(request):
     """Disable the yaml c dumper."""
@@ -500,3 +513,176 @@ async def test_loading_actual_file_with_syntax(hass, try_both_loaders):
             "fixtures", "bad.yaml.txt"
         )
         await hass.async_add_executor_job(load_yaml_config_file, fixture_path)
+
+
+def test_node_cache_resolves_tags_on_every_load(disable_c_loader_for_cache, tmp_path):
+    """Test cached files are not parsed again but tags are resolved freshly."""
+    cache_path = str(tmp_path / "core.yaml_node_cache")
+    files = {
+        YAML_CONFIG_FILE: "password: !env_var CACHE_PASSWORD\nsecret: !secret a",
+        yaml.SECRET_YAML: "a: one",
+    }
+    config_path = get_test_config_dir(YAML_CONFIG_FILE)
+    secrets = yaml.Secrets(pathlib.Path(get_test_config_dir()))
+    with patch_yaml_files(files), patch.dict(os.environ, {"CACHE_PASSWORD": "1"}):
+        assert load_yaml_config_file_cached(config_path, secrets, cache_path) == {
+            "password": "1",
+            "secret": "one",
+        }
+
+    files[yaml.SECRET_YAML] = "a: two"
+    secrets = yaml.Secrets(pathlib.Path(get_test_config_dir()))
+    with patch_yaml_files(files), patch.dict(
+        os.environ, {"CACHE_PASSWORD": "2"}
+    ), patch.object(yaml_loader.NODE_CACHE, "set", side_effect=AssertionError):
+        assert load_yaml_config_file_cached(config_path, secrets, cache_path) == {
+            "password": "2",
+            "secret": "two",
+        }
+
+    files[YAML_CONFIG_FILE] = "changed: true"
+    with patch_yaml_files(files):
+        assert load_yaml_config_file_cached(config_path, None, cache_path) == {
+            "changed": True
+        }
+
+
+def test_node_cache_keeps_line_numbers(disable_c_loader_for_cache, tmp_path):
+    """Test objects loaded from the cache keep their file and line."""
+    cache_path = str(tmp_path / "core.yaml_node_cache")
+    files = {YAML_CONFIG_FILE: "key:\n  - one\n  - two\nother: !include other.yaml"}
+    files["other.yaml"] = "nested: value"
+    with patch_yaml_files(files):
+        load_yaml_config_file_cached(YAML_CONFIG_FILE, None, cache_path)
+        conf = load_yaml_config_file_cached(YAML_CONFIG_FILE, None, cache_path)
+
+    assert conf == {"key": ["one", "two"], "other": {"nested": "value"}}
+    assert conf["key"].__line__ == 1
+    assert conf["key"].__config_file__ == YAML_CONFIG_FILE
+    assert conf["other"].__line__ == 3
+
+
+def test_node_cache_keeps_marks(disable_c_loader_for_cache, tmp_path):
+    """Test cached node trees keep the start and end marks of their nodes."""
+    cache_path = str(tmp_path / "core.yaml_node_cache")
+    content = "key:\n  - one\n  - [two, three]\nother: {nested: value}\n"
+    node_cache = NodeCache()
+    with patch.object(yaml_loader, "NODE_CACHE", node_cache), patch(
+        "homeassistant.config.NODE_CACHE", node_cache
+    ), patch_yaml_files({YAML_CONFIG_FILE: content}):
+        load_yaml_config_file_cached(YAML_CONFIG_FILE, None, cache_path)
+
+    def marks(node):
+        children = []
+        if isinstance(node, pyyaml.SequenceNode):
+            children = node.value
+        elif isinstance(node, pyyaml.MappingNode):
+            children = [child for pair in node.value for child in pair]
+        return (
+            (node.start_mark.line, node.start_mark.column),
+            (node.end_mark.line, node.end_mark.column),
+            [marks(child) for child in children],
+        )
+
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    assert marks(node_cache.get(YAML_CONFIG_FILE, digest)) == marks(
+        pyyaml.compose(content)
+    )
+
+
+def test_node_cache_not_used_with_c_loader(tmp_path):
+    """Test the node cache is skipped when the C loader is available."""
+    cache_path = str(tmp_path / "core.yaml_node_cache")
+    node_cache = NodeCache()
+    with patch.object(yaml_loader, "HAS_C_LOADER", True), patch.object(
+        yaml_loader, "NODE_CACHE", node_cache
+    ), patch("homeassistant.config.NODE_CACHE", node_cache), patch_yaml_files(
+        {YAML_CONFIG_FILE: "a: 1"}
+    ), patch.object(
+        node_cache, "set"
+    ) as mock_set:
+        assert load_yaml_config_file_cached(YAML_CONFIG_FILE, None, cache_path) == {
+            "a": 1
+        }
+    assert not mock_set.called
+
+
+def test_node_cache_persisted(disable_c_loader_for_cache, tmp_path):
+    """Test the node cache is stored and only keeps used files."""
+    cache_path = str(tmp_path / ".storage" / "core.yaml_node_cache")
+    files = {
+        YAML_CONFIG_FILE: "a: !include a.yaml\nb: !include b.yaml",
+        "a.yaml": "value: 1",
+        "b.yaml": "value: 2",
+    }
+    node_cache = NodeCache()
+    with patch.object(yaml_loader, "NODE_CACHE", node_cache), patch(
+        "homeassistant.config.NODE_CACHE", node_cache
+    ), patch_yaml_files(files):
+        assert load_yaml_config_file_cached(YAML_CONFIG_FILE, None, cache_path) == {
+            "a": {"value": 1},
+            "b": {"value": 2},
+        }
+    assert os.path.isfile(cache_path)
+
+    node_cache = NodeCache()
+    files[YAML_CONFIG_FILE] = "a: !include a.yaml"
+    with patch.object(yaml_loader, "NODE_CACHE", node_cache), patch(
+        "homeassistant.config.NODE_CACHE", node_cache
+    ), patch_yaml_files(files), patch.object(
+        node_cache, "set", wraps=node_cache.set
+    ) as mock_set:
+        assert load_yaml_config_file_cached(YAML_CONFIG_FILE, None, cache_path) == {
+            "a": {"value": 1}
+        }
+    # Only the changed configuration.yaml was parsed again
+    assert [call[0][0] for call in mock_set.call_args_list] == [YAML_CONFIG_FILE]
+
+    node_cache = NodeCache()
+    node_cache.load(cache_path)
+    with pytest.raises(KeyError):
+        node_cache.get("b.yaml", "")
+
+
+def test_node_cache_only_used_for_configuration(disable_c_loader_for_cache, tmp_path):
+    """Test YAML files loaded outside of the configuration are not cached."""
+    cache_path = str(tmp_path / "core.yaml_node_cache")
+    files = {YAML_CONFIG_FILE: "a: 1", "other.yaml": "b: 2"}
+    node_cache = NodeCache()
+    with patch.object(yaml_loader, "NODE_CACHE", node_cache), patch(
+        "homeassistant.config.NODE_CACHE", node_cache
+    ), patch_yaml_files(files), patch.object(
+        node_cache, "set", wraps=node_cache.set
+    ) as mock_set:
+        assert yaml.load_yaml("other.yaml") == {"b": 2}
+        assert not mock_set.called
+        assert load_yaml_config_file_cached(YAML_CONFIG_FILE, None, cache_path) == {
+            "a": 1
+        }
+        assert [call[0][0] for call in mock_set.call_args_list] == [YAML_CONFIG_FILE]
+        assert not node_cache.active
+
+
+def test_node_cache_skips_aliases(disable_c_loader_for_cache, tmp_path):
+    """Test node trees with aliases are not cached."""
+    cache_path = str(tmp_path / "core.yaml_node_cache")
+    files = {
+        YAML_CONFIG_FILE: "a: !include a.yaml",
+        "a.yaml": "base: &base\n  value: 1\ncopy: *base",
+    }
+    node_cache = NodeCache()
+    with patch.object(yaml_loader, "NODE_CACHE", node_cache), patch(
+        "homeassistant.config.NODE_CACHE", node_cache
+    ), patch_yaml_files(files):
+        for _ in range(2):
+            conf = load_yaml_config_file_cached(YAML_CONFIG_FILE, None, cache_path)
+            assert conf["a"] == {"base": {"value": 1}, "copy": {"value": 1}}
+
+    with pytest.raises(KeyError):
+        node_cache.get("a.yaml", "")
+
+    # Recursive aliases must not make encoding loop forever
+    node = pyyaml.compose("recursive: &recursive [*recursive]")
+    node_cache.set("recursive.yaml", "digest", node)
+    with pytest.raises(KeyError):
+        node_cache.get("recursive.yaml", "digest")